@@ -4,10 +4,12 @@ AgentSphere AI – Multi-Agent Strategic Simulation Engine.
 Top-level package providing convenient re-exports of the main public API.
 """
 
+from typing import Any
+
+from agentsphere._numba import warmup
 from agentsphere.config import APP_TITLE, ENV_DEFAULTS
 from agentsphere.environment import BusinessEnvironment, EnvironmentState
 from agentsphere.simulation import SimulationResult, Simulator
-from agentsphere.analytics import MetricsEngine
 
 __all__ = [
     "APP_TITLE",
@@ -17,4 +19,14 @@ __all__ = [
     "Simulator",
     "SimulationResult",
     "MetricsEngine",
+    "warmup",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ``MetricsEngine`` (and with it pandas) on first access."""
+    if name == "MetricsEngine":
+        from agentsphere.analytics import MetricsEngine
+
+        return MetricsEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
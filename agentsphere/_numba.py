@@ -0,0 +1,66 @@
+"""
+Optional Numba integration for AgentSphere AI.
+
+Numba is an *optional* accelerator.  When it is installed, :func:`njit`
+compiles the decorated function to native code; otherwise the decorator
+returns the function unchanged and the pure-Python implementation runs.
+Kernels decorated this way must therefore stick to the Numba-supported
+subset of Python (scalars, tuples, ``math`` and NumPy arrays).
+
+Kernels compile on first call (or load from Numba's on-disk cache);
+:func:`warmup` does that up front for the kernels a simulation round uses.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+
+HAVE_NUMBA: bool = _numba_njit is not None
+
+_WARM: bool = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Drop-in replacement for ``numba.njit`` that degrades to a no-op.
+
+    Supports both the bare (``@njit``) and the parametrised
+    (``@njit(cache=True)``) decorator forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        return fn
+
+    return decorator
+
+
+def warmup() -> None:
+    """Compile (or load from cache) the kernels a simulation round uses.
+
+    Called by every ``Simulator`` on construction, so the first round does
+    not pay the JIT latency; call it earlier to move that cost elsewhere.
+    Importing the package does not compile anything.  A no-op without
+    Numba and after the first call.  The agent kernels are skipped when the
+    ahead-of-time ``_agent_kernels`` extension serves ``propose``.
+    """
+    global _WARM
+    if _WARM or not HAVE_NUMBA:
+        return
+    from agentsphere.agents import _backend
+    from agentsphere.agents import _kernels as agent_kernels
+    from agentsphere.environment import _kernels as environment_kernels
+    from agentsphere.negotiation import _kernels as negotiation_kernels
+
+    if not _backend.HAVE_AOT:
+        agent_kernels.warmup()
+    environment_kernels.warmup()
+    negotiation_kernels.warmup()
+    _WARM = True
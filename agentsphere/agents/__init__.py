@@ -1,16 +1,26 @@
 """Agents sub-package for AgentSphere AI."""
 
-from agentsphere.agents.base_agent import BaseAgent, AgentProposal
+from agentsphere.agents.base_agent import (
+    BaseAgent,
+    AgentProposal,
+    LazyRationale,
+    Threshold,
+)
 from agentsphere.agents.revenue_agent import RevenueAgent
 from agentsphere.agents.risk_agent import RiskAgent
 from agentsphere.agents.cost_agent import CostAgent
 from agentsphere.agents.growth_agent import GrowthAgent
+from agentsphere.agents.ensemble import ensemble_propose, ensemble_propose_batch
 
 __all__ = [
     "BaseAgent",
     "AgentProposal",
+    "LazyRationale",
+    "Threshold",
     "RevenueAgent",
     "RiskAgent",
     "CostAgent",
     "GrowthAgent",
+    "ensemble_propose",
+    "ensemble_propose_batch",
 ]
@@ -0,0 +1,71 @@
+"""
+Ahead-of-time build of the agent propose kernels.
+
+Compiles the kernels in :mod:`agentsphere.agents._kernels` into the native
+extension module ``agentsphere.agents._agent_kernels`` with Numba's AOT
+compiler, so Python callers get native code without any JIT latency at
+import.  Run once per platform / Python version (requires Numba)::
+
+    python -m agentsphere.agents._aot_build [--output-dir DIR]
+
+:mod:`agentsphere.agents._backend` picks the extension up automatically when
+present and falls back to the JIT (or pure-Python) kernels otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from agentsphere.agents import _kernels
+
+MODULE_NAME = "_agent_kernels"
+
+# Export signatures; thresholds and state scalars are float64 throughout.
+_F7 = "Tuple((i8, f8, f8, f8, f8, f8, f8))"
+_RISK = "Tuple((i8, i8, f8, f8, f8, f8, f8, f8, f8))"
+SIGNATURES: dict[str, str] = {
+    "cost_kernel": f"{_F7}(f8, f8, f8, f8, f8)",
+    "revenue_kernel": f"{_F7}(f8, f8, f8, f8)",
+    "risk_kernel": f"{_RISK}(f8, f8, f8, f8, f8, f8)",
+    "growth_kernel": f"{_F7}(f8, f8, f8, f8, f8, f8, f8)",
+    "ensemble_kernel": (
+        f"Tuple(({_F7}, {_RISK}, {_F7}, {_F7}))"
+        "(f8, f8, f8, f8, f8, f8, f8,"
+        " UniTuple(f8, 2), UniTuple(f8, 4), UniTuple(f8, 3), UniTuple(f8, 3))"
+    ),
+}
+
+
+def build(output_dir: str | None = None) -> str:
+    """Compile the kernels and return the path of the built extension.
+
+    Args:
+        output_dir: Destination directory; defaults to this package.
+
+    Returns:
+        Path of the compiled extension module.
+    """
+    from numba.pycc import CC
+
+    cc = CC(MODULE_NAME)
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    for name, signature in SIGNATURES.items():
+        kernel = getattr(_kernels, name)
+        # Export the undecorated function; Numba compiles it from source.
+        cc.export(name, signature)(getattr(kernel, "py_func", kernel))
+    cc.compile()
+    return os.path.join(cc.output_dir, cc.output_file)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--output-dir", default=None, help="directory for the built module"
+    )
+    args = parser.parse_args()
+    print(build(args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
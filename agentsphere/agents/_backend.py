@@ -0,0 +1,44 @@
+"""
+Kernel implementations used by the agents' Python-level ``propose`` paths.
+
+Prefers the ahead-of-time compiled ``_agent_kernels`` extension (built by
+:mod:`agentsphere.agents._aot_build`), which needs neither Numba nor any JIT
+work at runtime, and falls back to :mod:`agentsphere.agents._kernels` (JIT
+compiled when Numba is installed, plain Python otherwise).  Numba-compiled
+callers such as :mod:`agentsphere.agents._gufunc` import the ``_kernels``
+versions directly.
+"""
+
+from __future__ import annotations
+
+HAVE_AOT: bool
+
+try:
+    from agentsphere.agents._agent_kernels import (
+        cost_kernel,
+        ensemble_kernel,
+        growth_kernel,
+        revenue_kernel,
+        risk_kernel,
+    )
+except ImportError:
+    from agentsphere.agents._kernels import (
+        cost_kernel,
+        ensemble_kernel,
+        growth_kernel,
+        revenue_kernel,
+        risk_kernel,
+    )
+
+    HAVE_AOT = False
+else:  # pragma: no cover - depends on a local build
+    HAVE_AOT = True
+
+__all__ = [
+    "HAVE_AOT",
+    "cost_kernel",
+    "ensemble_kernel",
+    "growth_kernel",
+    "revenue_kernel",
+    "risk_kernel",
+]
@@ -0,0 +1,80 @@
+"""
+Logistic confidence normalisation shared by all agents.
+
+Agents map a raw confidence score onto (0, 1) with the logistic curve
+``1 / (1 + exp(-6 * (c - 0.5)))``.  Almost every raw score is one of a
+handful of per-branch literals, so their normalised values are computed
+once at import time and served from a dict; any other input falls back to
+the closed form.
+
+Proposals report the normalised value rounded to 4 d.p.;
+:func:`confidence_score` serves that rounded value from a second table, so
+branch literals need neither ``exp`` nor ``round`` per call.  The batch paths
+use the same table: :func:`confidence_select` picks among the cached scores
+of each branch's literal with ``np.select``, so no ``np.exp`` or ``np.round``
+runs for branches whose raw confidence is a constant.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+_exp = math.exp
+
+
+def _logistic(c: float) -> float:
+    return 1.0 / (1.0 + _exp(-6.0 * (c - 0.5)))
+
+
+# Raw confidence literals used by the agents' branch cascades, plus the
+# RiskAgent high-volatility bonus applied on top of each (computed the same
+# way the kernel does, so lookups hit bit-for-bit).
+_BRANCH_LEVELS: tuple[float, ...] = (
+    0.65, 0.68, 0.70, 0.72, 0.75, 0.78, 0.80, 0.85, 0.88, 0.90,
+)
+_LOGISTIC: dict[float, float] = {
+    c: _logistic(c)
+    for level in _BRANCH_LEVELS
+    for c in (level, min(1.0, level + 0.05))
+}
+_SCORES: dict[float, float] = {c: round(v, 4) for c, v in _LOGISTIC.items()}
+
+
+def logistic(c: float) -> float:
+    """Return the logistic-normalised confidence for raw score *c*."""
+    value = _LOGISTIC.get(c)
+    return value if value is not None else _logistic(c)
+
+
+def confidence_score(c: float) -> float:
+    """Return ``round(logistic(c), 4)``, the confidence a proposal reports."""
+    value = _SCORES.get(c)
+    return value if value is not None else round(_logistic(c), 4)
+
+
+def confidence_select(
+    condlist: Sequence[np.ndarray], raw_levels: Sequence[float], default: float
+) -> np.ndarray:
+    """``np.select`` over the cached confidence scores of constant raw scores.
+
+    Args:
+        condlist:   Boolean branch masks, as for ``np.select``.
+        raw_levels: Raw confidence of each masked branch.
+        default:    Raw confidence where no mask is set.
+
+    Returns:
+        Array of :func:`confidence_score` values.
+    """
+    return np.select(
+        condlist,
+        [confidence_score(c) for c in raw_levels],
+        default=confidence_score(default),
+    )
+
+
+def logistic_array(c: np.ndarray) -> np.ndarray:
+    """Closed-form logistic normalisation for arrays of arbitrary raw scores."""
+    return 1.0 / (1.0 + np.exp(-6.0 * (c - 0.5)))
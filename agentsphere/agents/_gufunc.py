@@ -0,0 +1,136 @@
+"""
+Generalised-ufunc form of the four-agent ensemble for scenario batches.
+
+The ensemble gufunc evaluates the Revenue, Risk, Cost and Growth cascades for
+every scenario of a batch and writes each agent's deltas straight into an
+``(N, 4, len(METRICS))`` array (agent order as in
+:func:`agentsphere.agents.ensemble.ensemble_propose`, metric columns in
+``config.METRICS`` order, zero where an agent leaves a metric untouched).
+
+Numba has no syntax for literal core dimensions, so the ``(4, 7)`` output
+shape is carried by a ``layout`` template argument (see
+:func:`layout_template`).  :func:`ensemble_gu` returns the
+``target="parallel"`` or ``target="cpu"`` build, compiling it on first
+request rather than at import; the two produce identical results.  When
+Numba is not installed it returns ``None`` and callers fall back to the
+agents' NumPy ``propose_batch`` paths.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import cache
+from typing import Any
+
+import numpy as np
+
+from agentsphere._numba import HAVE_NUMBA
+from agentsphere.agents._kernels import (
+    cost_kernel,
+    growth_kernel,
+    revenue_kernel,
+    risk_kernel,
+)
+from agentsphere.config import METRIC_INDEX, METRICS
+
+N_AGENTS: int = 4
+
+# Output column of each metric (read as compile-time constants by Numba).
+_REVENUE = METRIC_INDEX["revenue"]
+_COST = METRIC_INDEX["cost"]
+_RISK = METRIC_INDEX["risk_score"]
+_CHURN = METRIC_INDEX["churn"]
+_MARKETING = METRIC_INDEX["marketing_budget"]
+_GROWTH = METRIC_INDEX["growth_rate"]
+_VOLATILITY = METRIC_INDEX["volatility"]
+
+
+def _ensemble_row(
+    revenue: float,
+    cost: float,
+    risk_score: float,
+    churn: float,
+    marketing_budget: float,
+    growth_rate: float,
+    volatility: float,
+    thresholds: np.ndarray,
+    layout: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Fill ``out[agent, metric]`` for one scenario.
+
+    ``thresholds`` is the flat concatenation of the revenue (2), risk (4),
+    cost (3) and growth (3) agents' ``_threshold_args``; ``layout`` only
+    supplies the output shape.
+    """
+    out[:, :] = 0.0
+
+    r = revenue_kernel(growth_rate, churn, thresholds[0], thresholds[1])
+    out[0, _MARKETING] = r[1]
+    out[0, _REVENUE] = r[2]
+    out[0, _GROWTH] = r[3]
+    out[0, _CHURN] = r[4]
+    out[0, _COST] = r[5]
+
+    k = risk_kernel(
+        risk_score, volatility,
+        thresholds[2], thresholds[3], thresholds[4], thresholds[5],
+    )
+    out[1, _RISK] = k[3]
+    out[1, _COST] = k[4]
+    out[1, _REVENUE] = k[5]
+    out[1, _VOLATILITY] = k[6]
+    out[1, _GROWTH] = k[7]
+
+    c = cost_kernel(revenue, cost, thresholds[6], thresholds[7], thresholds[8])
+    out[2, _COST] = c[2]
+    out[2, _MARKETING] = c[3]
+    out[2, _RISK] = c[4]
+    out[2, _REVENUE] = c[5]
+
+    g = growth_kernel(
+        revenue, risk_score, marketing_budget, growth_rate,
+        thresholds[9], thresholds[10], thresholds[11],
+    )
+    out[3, _GROWTH] = g[2]
+    out[3, _MARKETING] = g[3]
+    out[3, _REVENUE] = g[4]
+    out[3, _CHURN] = g[5]
+
+
+_SIGNATURES = ["void(f8, f8, f8, f8, f8, f8, f8, f8[:], f8[:, :], f8[:, :])"]
+_LAYOUT = "(),(),(),(),(),(),(),(t),(a,m)->(a,m)"
+
+
+def ensemble_gu(parallel: bool = True) -> Any:
+    """Return the ensemble gufunc, or ``None`` when Numba is not installed.
+
+    The parallel build is only handed out on the main thread; other threads
+    get the cpu build.  Starting Numba's parallel runtime (TBB by default)
+    from another thread, such as Streamlit's script runner, keeps the
+    process from exiting.
+
+    Args:
+        parallel: Prefer the ``target="parallel"`` build, threaded across
+                  scenarios.
+    """
+    if not HAVE_NUMBA:
+        return None
+    if threading.current_thread() is not threading.main_thread():
+        parallel = False
+    return _build("parallel" if parallel else "cpu")
+
+
+@cache
+def _build(target: str) -> Any:
+    """Compile (or load from Numba's cache) the gufunc for *target*."""
+    from numba import guvectorize
+
+    return guvectorize(
+        _SIGNATURES, _LAYOUT, nopython=True, target=target, cache=True
+    )(_ensemble_row)
+
+
+def layout_template() -> np.ndarray:
+    """Return the ``(N_AGENTS, len(METRICS))`` shape carrier for the gufunc."""
+    return np.empty((N_AGENTS, len(METRICS)))
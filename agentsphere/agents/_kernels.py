@@ -0,0 +1,297 @@
+"""
+Numeric kernels behind the agents' ``propose`` methods.
+
+Each kernel is the branch cascade of one agent reduced to plain float
+arithmetic: it takes the environment scalars the agent reads plus the
+agent's thresholds, and returns a fixed-length tuple of
+``(branch_id, <derived values used in the rationale>, <deltas>,
+confidence_raw)``.  The agent wrappers map ``branch_id`` to the delta keys
+and rationale text, normalise ``confidence_raw`` with
+:func:`agentsphere.agents._confidence.confidence_score`, and assemble the
+``AgentProposal``.
+
+Clamps are written as ternaries (``x if x < cap else cap``) rather than
+``min``/``max`` calls: they select exactly the operand the builtins would,
+compile to a single ``minsd``/``maxsd`` under Numba, and skip a builtin call
+in pure-Python mode.
+
+Kernels are compiled with Numba when it is installed (``cache=True`` keeps
+the compiled code on disk between processes, ``nogil=True`` lets agents on
+different threads run them concurrently) and run as ordinary Python
+otherwise.
+"""
+
+from __future__ import annotations
+
+from agentsphere._numba import njit
+
+
+@njit(nogil=True, cache=True)
+def cost_kernel(
+    revenue: float,
+    cost: float,
+    target_ratio: float,
+    critical_ratio: float,
+    min_ratio: float,
+) -> tuple[int, float, float, float, float, float, float]:
+    """CostAgent cascade.
+
+    Returns:
+        ``(branch, cost_ratio, d_cost, d_marketing, d_risk, d_revenue,
+        confidence_raw)`` where branch is 0 = critical, 1 = above target,
+        2 = below minimum, 3 = on target.
+    """
+    cost_ratio = cost / revenue if revenue > 0 else 1.0
+    cost_gap = cost_ratio - target_ratio
+
+    if cost_ratio >= critical_ratio:
+        branch = 0
+        cut = cost_gap * 0.70
+        d_cost = -(cut if cut < 0.15 else 0.15)
+        d_marketing, d_risk, d_revenue = -0.05, 0.03, 0.0
+        confidence_raw = 0.88
+    elif cost_gap > 0:
+        branch = 1
+        cut = cost_gap * 0.50
+        d_cost = -(cut if cut < 0.08 else 0.08)
+        d_marketing, d_risk, d_revenue = -0.02, 0.0, 0.0
+        confidence_raw = 0.75
+    elif cost_ratio < min_ratio:
+        branch = 2
+        d_cost, d_marketing, d_risk, d_revenue = 0.03, 0.0, -0.02, 0.02
+        confidence_raw = 0.68
+    else:
+        branch = 3
+        d_cost, d_marketing, d_risk, d_revenue = -0.01, 0.0, 0.0, 0.01
+        confidence_raw = 0.70
+
+    return (
+        branch, cost_ratio, d_cost, d_marketing, d_risk, d_revenue, confidence_raw
+    )
+
+
+@njit(nogil=True, cache=True)
+def revenue_kernel(
+    growth_rate: float,
+    churn: float,
+    target_growth: float,
+    churn_threshold: float,
+) -> tuple[int, float, float, float, float, float, float]:
+    """RevenueAgent cascade.
+
+    Returns:
+        ``(branch, d_marketing, d_revenue, d_growth, d_churn, d_cost,
+        confidence_raw)`` where branch is a bit mask: 1 = growth below target,
+        2 = churn above threshold, 0 = healthy.
+    """
+    revenue_gap = target_growth - growth_rate
+    churn_severity = churn - churn_threshold
+    churn_severity = churn_severity if churn_severity > 0.0 else 0.0
+
+    branch = 0
+    d_marketing = d_revenue = d_growth = d_churn = d_cost = 0.0
+    factor_sum = 0.0
+    n_factors = 0
+
+    if revenue_gap > 0:
+        branch |= 1
+        boost = revenue_gap * 2.0
+        d_marketing = boost if boost < 0.20 else 0.20
+        d_revenue = revenue_gap * 0.80
+        d_growth = revenue_gap * 0.50
+        factor = revenue_gap / target_growth
+        factor_sum += factor if factor < 1.0 else 1.0
+        n_factors += 1
+
+    if churn_severity > 0:
+        branch |= 2
+        cut = churn_severity * 3.0
+        d_churn = -(cut if cut < 0.25 else 0.25)
+        d_cost = 0.02
+        d_revenue = d_revenue + churn_severity * 1.5
+        factor = churn_severity / churn_threshold
+        factor_sum += factor if factor < 1.0 else 1.0
+        n_factors += 1
+
+    if branch == 0:
+        d_revenue, d_growth = 0.02, 0.005
+        confidence_raw = 0.70
+    else:
+        confidence_raw = factor_sum / n_factors
+
+    return (
+        branch, d_marketing, d_revenue, d_growth, d_churn, d_cost, confidence_raw
+    )
+
+
+@njit(nogil=True, cache=True)
+def risk_kernel(
+    risk_score: float,
+    volatility: float,
+    critical_risk: float,
+    high_risk: float,
+    safe_risk: float,
+    high_volatility: float,
+) -> tuple[int, int, float, float, float, float, float, float, float]:
+    """RiskAgent cascade.
+
+    Returns:
+        ``(branch, high_vol, vol_reduction, d_risk, d_cost, d_revenue,
+        d_volatility, d_growth, confidence_raw)`` where branch is 0 = critical,
+        1 = elevated, 2 = safe, 3 = moderate and ``high_vol`` (0 or 1) flags
+        the volatility-dampening overlay.  The flag is a plain int so it can
+        index the callers' tables whether or not the kernel is compiled.
+    """
+    risk_excess = risk_score - safe_risk
+    risk_excess = risk_excess if risk_excess > 0.0 else 0.0
+    volatility_excess = volatility - high_volatility
+    volatility_excess = volatility_excess if volatility_excess > 0.0 else 0.0
+
+    if risk_score >= critical_risk:
+        branch = 0
+        d_risk = -(risk_excess * 0.40)
+        d_cost, d_revenue, d_volatility, d_growth = 0.05, -0.02, -0.05, -0.02
+        confidence_raw = 0.90
+    elif risk_score >= high_risk:
+        branch = 1
+        d_risk = -(risk_excess * 0.25)
+        d_cost, d_revenue, d_volatility, d_growth = 0.02, 0.0, -0.03, 0.0
+        confidence_raw = 0.78
+    elif risk_score <= safe_risk:
+        branch = 2
+        d_risk, d_cost, d_revenue = 0.02, 0.0, 0.03
+        d_volatility, d_growth = 0.0, 0.01
+        confidence_raw = 0.72
+    else:
+        branch = 3
+        d_risk, d_cost, d_revenue = -0.02, 0.01, 0.0
+        d_volatility, d_growth = 0.0, 0.0
+        confidence_raw = 0.65
+
+    high_vol = 1 if volatility_excess > 0.0 else 0
+    vol_reduction = 0.0
+    if high_vol:
+        vol_reduction = volatility_excess * 0.50
+        vol_reduction = vol_reduction if vol_reduction < 0.10 else 0.10
+        d_volatility = d_volatility - vol_reduction
+        d_growth = d_growth - volatility_excess * 0.15
+        confidence_raw = confidence_raw + 0.05
+        confidence_raw = confidence_raw if confidence_raw < 1.0 else 1.0
+
+    return (
+        branch, high_vol, vol_reduction,
+        d_risk, d_cost, d_revenue, d_volatility, d_growth,
+        confidence_raw,
+    )
+
+
+@njit(nogil=True, cache=True)
+def growth_kernel(
+    revenue: float,
+    risk_score: float,
+    marketing_budget: float,
+    growth_rate: float,
+    aggressive_growth: float,
+    conservative_growth: float,
+    risk_tolerance: float,
+) -> tuple[int, float, float, float, float, float, float]:
+    """GrowthAgent cascade.
+
+    Returns:
+        ``(branch, market_saturation, d_growth, d_marketing, d_revenue,
+        d_churn, confidence_raw)`` where branch is 0 = risk pull-back,
+        1 = aggressive expansion, 2 = stagnation push, 3 = sustain.
+    """
+    growth_potential = aggressive_growth - growth_rate
+    growth_potential = growth_potential if growth_potential > 0.0 else 0.0
+    market_saturation = (
+        marketing_budget / (revenue * 0.15) if revenue > 0 else 1.0
+    )
+    market_saturation = market_saturation if market_saturation < 1.0 else 1.0
+    risk_factor = 1.0 - risk_score / risk_tolerance
+    risk_factor = risk_factor if risk_factor > 0.0 else 0.0
+    risk_adjusted_potential = growth_potential * risk_factor
+
+    if risk_score > risk_tolerance:
+        branch = 0
+        d_growth, d_marketing, d_revenue, d_churn = -0.01, -0.05, -0.01, 0.0
+        confidence_raw = 0.80
+    elif risk_adjusted_potential > 0.04 and market_saturation < 0.70:
+        branch = 1
+        d_growth = risk_adjusted_potential * 0.80
+        boost = risk_adjusted_potential * 1.5
+        d_marketing = boost if boost < 0.20 else 0.20
+        d_revenue = risk_adjusted_potential * 1.2
+        d_churn = -0.01
+        confidence_raw = 0.85
+    elif growth_rate < conservative_growth:
+        branch = 2
+        d_growth, d_marketing, d_revenue, d_churn = 0.02, 0.08, 0.03, 0.0
+        confidence_raw = 0.72
+    else:
+        branch = 3
+        d_growth, d_marketing, d_revenue, d_churn = 0.005, 0.0, 0.015, 0.0
+        confidence_raw = 0.68
+
+    return (
+        branch, market_saturation,
+        d_growth, d_marketing, d_revenue, d_churn,
+        confidence_raw,
+    )
+
+
+@njit(nogil=True, cache=True)
+def ensemble_kernel(
+    revenue: float,
+    cost: float,
+    risk_score: float,
+    churn: float,
+    marketing_budget: float,
+    growth_rate: float,
+    volatility: float,
+    revenue_thresholds: tuple[float, float],
+    risk_thresholds: tuple[float, float, float, float],
+    cost_thresholds: tuple[float, float, float],
+    growth_thresholds: tuple[float, float, float],
+) -> tuple[tuple, tuple, tuple, tuple]:
+    """Run all four agent cascades in a single call.
+
+    Returns:
+        ``(revenue, risk, cost, growth)`` kernel results, in the same layout
+        as the individual kernels.
+    """
+    return (
+        revenue_kernel(
+            growth_rate, churn, revenue_thresholds[0], revenue_thresholds[1]
+        ),
+        risk_kernel(
+            risk_score, volatility,
+            risk_thresholds[0], risk_thresholds[1],
+            risk_thresholds[2], risk_thresholds[3],
+        ),
+        cost_kernel(
+            revenue, cost,
+            cost_thresholds[0], cost_thresholds[1], cost_thresholds[2],
+        ),
+        growth_kernel(
+            revenue, risk_score, marketing_budget, growth_rate,
+            growth_thresholds[0], growth_thresholds[1], growth_thresholds[2],
+        ),
+    )
+
+
+def warmup() -> None:
+    """Trigger compilation (or on-disk cache load) of every kernel.
+
+    Called by :func:`agentsphere.warmup` so the first simulation round does
+    not pay the JIT latency.
+    """
+    cost_kernel(1.0, 0.5, 0.55, 0.80, 0.40)
+    revenue_kernel(0.05, 0.12, 0.08, 0.10)
+    risk_kernel(0.5, 0.4, 0.65, 0.45, 0.25, 0.30)
+    growth_kernel(1.0, 0.2, 0.05, 0.05, 0.12, 0.04, 0.40)
+    ensemble_kernel(
+        1.0, 0.5, 0.5, 0.12, 0.05, 0.05, 0.4,
+        (0.08, 0.10), (0.65, 0.45, 0.25, 0.30), (0.55, 0.80, 0.40),
+        (0.12, 0.04, 0.40),
+    )
@@ -5,38 +5,96 @@ Every agent follows a read-evaluate-propose lifecycle:
   1. ``evaluate(state)``  – inspect the current ``BusinessEnvironment`` state.
   2. ``propose(state)``   – return an ``AgentProposal`` with recommended deltas,
                             rationale, and a confidence score in [0, 1].
+
+Agents may additionally implement ``propose_batch(states)`` – a vectorised
+variant of ``propose`` that evaluates many scenarios at once from a
+Struct-of-Arrays batch (one 1-D NumPy array per environment metric).
 """
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from agentsphere.config import METRIC_INDEX, METRICS
 
 if TYPE_CHECKING:
-    from agentsphere.environment.business_env import EnvironmentState
+    from agentsphere.environment.business_env import EnvironmentState, StateBatch
+
+
+class LazyRationale:
+    """Rationale text rendered from a %-template on first use.
+
+    Agents build proposals every round but the rationale is usually only read
+    by the UI, so the string formatting is deferred until :meth:`__str__` and
+    the result cached.  Compares and hashes like the rendered string.
+
+    Args:
+        template: ``%``-format string.
+        args:     Mapping or tuple of values for *template*.
+    """
+
+    __slots__ = ("_template", "_args", "_cached")
+
+    def __init__(self, template: str, args: Any) -> None:
+        self._template = template
+        self._args = args
+        self._cached: str | None = None
+
+    def __str__(self) -> str:
+        if self._cached is None:
+            self._cached = self._template % self._args
+        return self._cached
+
+    def __repr__(self) -> str:
+        return repr(str(self))
 
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
 
-@dataclass
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, LazyRationale)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+@dataclass(slots=True, frozen=True)
 class AgentProposal:
     """Structured output produced by a single agent for one simulation round.
 
+    Proposals are immutable once built (slotted and frozen), which keeps the
+    per-round allocation small and makes sharing cached instances safe.
+
     Attributes:
         agent_name: Identifier of the agent that produced this proposal.
         action: Short human-readable description of the recommended action.
         deltas: Mapping of environment metric names to proposed *relative*
                 changes (e.g. ``{"revenue": 0.05}`` means +5 % revenue).
         confidence: Confidence score in the interval [0, 1].
-        rationale: Free-text explanation of the proposal logic.
+        rationale: Free-text explanation of the proposal logic; agents pass a
+                   :class:`LazyRationale`, so use ``str()`` to get the text.
         priority: Urgency rank (1 = highest) used during conflict resolution.
+        agent_id: Index of the agent in the negotiation engine's weight table
+                  (see :attr:`BaseAgent.agent_id`); -1 when unassigned.  The
+                  engine looks the weight up by name when it is unassigned or
+                  is not that engine's index for *agent_name*.
     """
 
     agent_name: str
     action: str
     deltas: dict[str, float]
     confidence: float
-    rationale: str
+    rationale: str | LazyRationale
     priority: int = 1
+    agent_id: int = -1
     metadata: dict[str, object] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -45,23 +103,163 @@ class AgentProposal:
                 f"confidence must be in [0, 1], got {self.confidence}"
             )
 
+    def clone_with(self, **changes: Any) -> AgentProposal:
+        """Return a copy of this proposal with *changes* applied.
+
+        Behaves like ``dataclasses.replace`` (including the confidence check)
+        but fills the slots directly instead of going through ``__init__``,
+        which roughly halves the cost of stamping out a proposal from one of
+        an agent's per-branch prototypes.  The copy gets its own empty
+        ``metadata`` unless one is passed.
+
+        Raises:
+            TypeError:  If *changes* names an unknown field.
+            ValueError: If the resulting confidence is outside [0, 1].
+        """
+        if not changes.keys() <= _PROPOSAL_FIELDS:
+            unknown = ", ".join(sorted(changes.keys() - _PROPOSAL_FIELDS))
+            raise TypeError(f"unknown AgentProposal field(s): {unknown}")
+        new = object.__new__(AgentProposal)
+        for name in _PROPOSAL_COPIED:
+            _set(new, name, changes[name] if name in changes else getattr(self, name))
+        _set(new, "metadata", changes.get("metadata", {}))
+        if "confidence" in changes:
+            new.__post_init__()
+        return new
+
+    def delta_vector(
+        self, out: np.ndarray | None = None, present: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Return ``deltas`` as a dense array in ``config.METRICS`` order.
+
+        Metrics the proposal leaves untouched (and unknown keys) are 0.0.
+
+        Args:
+            out:     Optional ``(len(METRICS),)`` row to write into instead of
+                     allocating a new array.
+            present: Optional boolean row; set where the proposal carries the
+                     metric's key.
+
+        Returns:
+            The delta vector (*out* when given).
+        """
+        if out is None:
+            out = np.zeros(len(METRICS))
+        else:
+            out[:] = 0.0
+        if present is not None:
+            present[:] = False
+        for key, value in self.deltas.items():
+            idx = METRIC_INDEX.get(key)
+            if idx is not None:
+                out[idx] = value
+                if present is not None:
+                    present[idx] = True
+        return out
+
+
+class Threshold:
+    """Class-level agent threshold that keeps the kernel arguments in sync.
+
+    Agents pass their thresholds to the kernels as one tuple,
+    ``_threshold_args``, built by ``_thresholds()`` at construction instead of
+    on every proposal.  Reading the attribute on the class gives the default;
+    setting it on an instance stores the override and rebuilds that
+    instance's tuple, so the next proposal and its rationale both see it.
+    A plain value given to the same name in a subclass body is wrapped by
+    :meth:`BaseAgent.__init_subclass__`.
+
+    Args:
+        default: Value used when the instance has no override.
+    """
+
+    __slots__ = ("default", "name")
+
+    def __init__(self, default: float) -> None:
+        self.default = default
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type | None = None) -> float:
+        if obj is None:
+            return self.default
+        return obj.__dict__.get(self.name, self.default)
+
+    def __set__(self, obj: Any, value: float) -> None:
+        obj.__dict__[self.name] = value
+        obj._threshold_args = obj._thresholds()
+
+    def __delete__(self, obj: Any) -> None:
+        del obj.__dict__[self.name]
+        obj._threshold_args = obj._thresholds()
+
+
+_set = object.__setattr__  # bypasses the frozen-dataclass guard in clone_with
+_PROPOSAL_FIELDS: frozenset[str] = frozenset(f.name for f in fields(AgentProposal))
+_PROPOSAL_COPIED: tuple[str, ...] = tuple(
+    f.name for f in fields(AgentProposal) if f.name != "metadata"
+)
+
 
 class BaseAgent(ABC):
     """Abstract agent that operates inside a ``BusinessEnvironment``.
 
-    Sub-classes must implement :meth:`evaluate` and :meth:`propose`.
+    Sub-classes must implement :meth:`evaluate` and :meth:`propose`.  They may
+    also override :meth:`_cache_key` to let :meth:`act` reuse proposals for
+    states the agent has already seen.  The cache is opt-in: it is only used
+    with a non-zero ``CACHE_STEP``, at which nearby states share one proposal,
+    trading exactness for a hit rate that exact float inputs never reach.
+    Agents whose :meth:`act` blocks on I/O set ``BLOCKING`` so the
+    ``Simulator`` gathers their line-up concurrently.  Kernel thresholds are
+    declared as :class:`Threshold` attributes and listed by
+    :meth:`_thresholds`.
     """
 
-    def __init__(self, name: str, weight: float = 1.0) -> None:
+    CACHE_SIZE: int = 4096   # Max memoised proposals per agent (LRU eviction)
+    CACHE_STEP: float = 0.0  # Key quantisation step; 0 = no proposal cache
+    BLOCKING: bool = False   # act() waits on I/O (remote tools, LLM calls)
+
+    def __init__(
+        self, name: str, weight: float = 1.0, record_history: bool = True
+    ) -> None:
         """Initialise the agent.
 
         Args:
-            name:   Human-readable identifier for the agent.
-            weight: Negotiation weight used by the consensus engine (0–1).
+            name:           Human-readable identifier for the agent.
+            weight:         Negotiation weight used by the consensus engine
+                            (0–1).
+            record_history: Keep every proposal in :attr:`history`.  Turn off
+                            for sweeps that only need aggregated results.
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.weight = weight
-        self._history: list[AgentProposal] = []
+        self.record_history = record_history
+        # Slots [0, _n_recorded) hold proposals; the rest is reserved capacity.
+        self._history: list[AgentProposal | None] = []
+        self._n_recorded: int = 0
+        self._last_state: "EnvironmentState | None" = None
+        self._last_metrics: dict[str, float] | None = None
+        self._cache: OrderedDict[tuple, AgentProposal] = OrderedDict()
+        self._agent_id: int = -1
+        self._prototypes: tuple[AgentProposal, ...] = ()
+        self._threshold_args: tuple[float, ...] = self._thresholds()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Re-wrap plain subclass overrides of inherited thresholds."""
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if isinstance(value, Threshold):
+                continue
+            inherited = next(
+                (vars(base)[name] for base in cls.__mro__[1:] if name in vars(base)),
+                None,
+            )
+            if isinstance(inherited, Threshold):
+                threshold = Threshold(value)
+                threshold.__set_name__(cls, name)
+                setattr(cls, name, threshold)
 
     # ── Abstract interface ────────────────────────────────────────────────────
 
@@ -87,6 +285,47 @@ class BaseAgent(ABC):
             An ``AgentProposal`` describing the recommended action.
         """
 
+    def _thresholds(self) -> tuple[float, ...]:
+        """Thresholds in the agent kernel's argument order.
+
+        Snapshotted into ``_threshold_args`` at construction and rebuilt when
+        a :class:`Threshold` is set on the instance; the default is empty.
+        """
+        return ()
+
+    # ── Optional vectorised interface ─────────────────────────────────────────
+
+    def propose_batch(self, states: StateBatch) -> dict[str, Any]:
+        """Generate proposals for a batch of scenarios in a single pass.
+
+        Args:
+            states: Mapping of environment metric name → 1-D float array, one
+                    element per scenario (all arrays share the same length),
+                    or an ``(N, len(METRICS))`` matrix with one
+                    :meth:`EnvironmentState.to_vector` row per scenario.
+
+        Returns:
+            Dict with ``deltas`` (``(N, len(METRICS))`` matrix in
+            ``config.METRICS`` column order, zero where the selected strategy
+            leaves the metric untouched), ``confidence`` (array in [0, 1]) and
+            ``priority`` (int array).
+
+        Raises:
+            NotImplementedError: If the agent has no vectorised implementation.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not implement propose_batch"
+        )
+
+    @staticmethod
+    def _delta_matrix(columns: dict[str, np.ndarray]) -> np.ndarray:
+        """Pack per-metric delta columns into an ``(N, len(METRICS))`` matrix."""
+        n = len(next(iter(columns.values())))
+        matrix = np.zeros((n, len(METRICS)))
+        for key, column in columns.items():
+            matrix[:, METRIC_INDEX[key]] = column
+        return matrix
+
     # ── Concrete helpers ──────────────────────────────────────────────────────
 
     def act(self, state: "EnvironmentState") -> AgentProposal:
@@ -98,18 +337,166 @@ class BaseAgent(ABC):
         Returns:
             The ``AgentProposal`` for this round.
         """
-        proposal = self.propose(state)
-        self._history.append(proposal)
+        key = self._cache_key(state) if self.CACHE_STEP > 0 else None
+        if key is None:
+            proposal = self.propose(state)
+        else:
+            cached = self._cache.get(key)
+            if cached is None:
+                proposal = self.propose(state)
+                self._cache[key] = proposal
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(key)
+                proposal = cached
+        self.record(proposal, state)
         return proposal
 
+    def act_into(
+        self,
+        state: "EnvironmentState",
+        deltas_out: np.ndarray,
+        present_out: np.ndarray | None = None,
+    ) -> AgentProposal:
+        """:meth:`act`, also writing the proposal's deltas into a metric row.
+
+        Lets array-based callers fill one row of an ``(n_agents,
+        len(METRICS))`` delta matrix per agent (see
+        :meth:`AgentProposal.delta_vector`).
+
+        Args:
+            state:       Current environment state.
+            deltas_out:  Row receiving the deltas in ``config.METRICS`` order.
+            present_out: Optional boolean row marking the proposed metrics.
+
+        Returns:
+            The ``AgentProposal`` for this round.
+        """
+        proposal = self.act(state)
+        proposal.delta_vector(deltas_out, present_out)
+        return proposal
+
+    def record(
+        self, proposal: AgentProposal, state: "EnvironmentState | None" = None
+    ) -> None:
+        """Append a proposal produced outside :meth:`act` to the history.
+
+        A no-op for the history when ``record_history`` is off.
+
+        Args:
+            proposal: Proposal made by this agent for the current round.
+            state:    State the proposal was made for; backs :attr:`last_metrics`.
+        """
+        if state is not None and state is not self._last_state:
+            self._last_state = state
+            self._last_metrics = None
+        if not self.record_history:
+            return
+        n = self._n_recorded
+        if n < len(self._history):
+            self._history[n] = proposal
+        else:
+            self._history.append(proposal)
+        self._n_recorded = n + 1
+
+    def _cache_key(self, state: "EnvironmentState") -> tuple | None:
+        """Return the memoisation key for *state*, or ``None`` to disable caching.
+
+        Sub-classes return the (quantised) inputs their :meth:`propose` reads;
+        two states with the same key must yield the same proposal.
+        """
+        return None
+
+    def _quantize(self, value: float) -> float:
+        """Snap *value* onto the ``CACHE_STEP`` grid (identity when step is 0)."""
+        step = self.CACHE_STEP
+        return value if step <= 0 else round(value / step)
+
+    def _make_prototypes(
+        self, priorities: tuple[int, ...]
+    ) -> tuple[AgentProposal, ...]:
+        """Build the per-branch prototypes that proposals are cloned from.
+
+        Args:
+            priorities: Priority of each branch, indexed by branch id.
+
+        Returns:
+            Prototypes carrying this agent's name, id and the branch priority.
+        """
+        return tuple(
+            AgentProposal(
+                agent_name=self.name,
+                action="",
+                deltas={},
+                confidence=0.0,
+                rationale="",
+                priority=priority,
+                agent_id=self._agent_id,
+            )
+            for priority in priorities
+        )
+
+    @property
+    def agent_id(self) -> int:
+        """Index of this agent in the negotiation engine's weight table.
+
+        Assigned by the ``Simulator`` to the default agents it creates, from
+        :meth:`NegotiationEngine.agent_index`, and stamped on every proposal
+        cloned from the prototypes; -1 (the default) means unassigned.
+        Setting it re-stamps the prototypes and drops cached proposals.
+        """
+        return self._agent_id
+
+    @agent_id.setter
+    def agent_id(self, value: int) -> None:
+        self._agent_id = value
+        self._prototypes = tuple(
+            p.clone_with(agent_id=value) for p in self._prototypes
+        )
+        self._cache.clear()
+
+    def clear_cache(self) -> None:
+        """Drop all memoised proposals."""
+        self._cache.clear()
+
+    @property
+    def last_metrics(self) -> dict[str, float] | None:
+        """:meth:`evaluate` output for the most recently recorded state.
+
+        Computed on first access and reused until the next round, so
+        analytics and logging consumers can read an agent's view of the round
+        without re-running :meth:`evaluate`.  ``None`` before the first round.
+        """
+        if self._last_metrics is None and self._last_state is not None:
+            self._last_metrics = self.evaluate(self._last_state)
+        return self._last_metrics
+
     @property
     def history(self) -> list[AgentProposal]:
         """All proposals made by this agent across rounds."""
-        return list(self._history)
+        return self._history[: self._n_recorded]
+
+    def preallocate(self, n: int) -> None:
+        """Reserve history capacity for *n* more proposals.
+
+        Called by the ``Simulator`` with the round count before a run, so
+        :meth:`record` fills pre-sized slots instead of growing the list.
+
+        Args:
+            n: Number of proposals expected to be recorded.
+        """
+        missing = self._n_recorded + n - len(self._history)
+        if missing > 0 and self.record_history:
+            self._history.extend([None] * missing)
 
     def reset(self) -> None:
-        """Clear proposal history (called at the start of a new simulation)."""
+        """Clear proposal history and cache (called at the start of a new run)."""
         self._history.clear()
+        self._cache.clear()
+        self._n_recorded = 0
+        self._last_state = None
+        self._last_metrics = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r}, weight={self.weight})"
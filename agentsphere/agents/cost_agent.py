@@ -9,21 +9,73 @@ Strategy:
 
 from __future__ import annotations
 
-import math
-
-from agentsphere.agents.base_agent import AgentProposal, BaseAgent
-from agentsphere.environment.business_env import EnvironmentState
+from typing import Any
+
+import numpy as np
+
+from agentsphere.agents._backend import cost_kernel
+from agentsphere.agents._confidence import confidence_score, confidence_select
+from agentsphere.agents.base_agent import (
+    AgentProposal,
+    BaseAgent,
+    LazyRationale,
+    Threshold,
+)
+from agentsphere.environment.business_env import (
+    EnvironmentState,
+    StateBatch,
+    batch_columns,
+)
+
+# Default thresholds; the class attributes of the same name alias these.
+_TARGET_COST_RATIO: float = 0.55     # Target cost-to-revenue ratio
+_CRITICAL_COST_RATIO: float = 0.80
+_MIN_COST_RATIO: float = 0.40        # Below this, cost cuts may harm quality
+
+# Delta keys and rationale per ``cost_kernel`` branch id.
+_DELTA_KEYS: tuple[tuple[str, ...], ...] = (
+    ("cost", "marketing_budget", "risk_score"),  # 0 – critical
+    ("cost", "marketing_budget"),                # 1 – above target
+    ("cost", "revenue", "risk_score"),           # 2 – below minimum
+    ("cost", "revenue"),                         # 3 – on target
+)
+# Position of each delta in the ``cost_kernel`` result tuple.
+_RESULT_INDEX: dict[str, int] = {
+    "cost": 2,
+    "marketing_budget": 3,
+    "risk_score": 4,
+    "revenue": 5,
+}
+_DELTA_SLOTS: tuple[tuple[tuple[str, int], ...], ...] = tuple(
+    tuple((k, _RESULT_INDEX[k]) for k in keys) for keys in _DELTA_KEYS
+)
+# ``(action, detail)`` %-templates per branch; the rationale is
+# ``action + detail``.  Percentages are passed pre-scaled by 100.
+_REASONS: tuple[tuple[str, str], ...] = (
+    ("Critical cost ratio %(ratio).2f",
+     "; aggressive reduction targeted (cost ↓%(reduction_pct).1f%%)."),
+    ("Cost ratio %(ratio).2f above target %(target)s",
+     "; moderate reduction (cost ↓%(reduction_pct).1f%%)."),
+    ("Cost ratio %(ratio).2f below minimum",
+     "; reinvesting to sustain quality and reduce operational risk."),
+    ("Cost ratio %(ratio).2f near target",
+     "; maintaining steady-state efficiency."),
+)
+_RATIONALES: tuple[str, ...] = tuple(a + d for a, d in _REASONS)
 
 
 class CostAgent(BaseAgent):
     """Agent focused on cost optimisation and margin improvement."""
 
-    TARGET_COST_RATIO: float = 0.55  # Target cost-to-revenue ratio
-    CRITICAL_COST_RATIO: float = 0.80
-    MIN_COST_RATIO: float = 0.40     # Below this, cost cuts may harm quality
+    TARGET_COST_RATIO = Threshold(_TARGET_COST_RATIO)
+    CRITICAL_COST_RATIO = Threshold(_CRITICAL_COST_RATIO)
+    MIN_COST_RATIO = Threshold(_MIN_COST_RATIO)
 
-    def __init__(self, weight: float = 0.25) -> None:
-        super().__init__(name="CostAgent", weight=weight)
+    def __init__(self, weight: float = 0.25, record_history: bool = True) -> None:
+        super().__init__(
+            name="CostAgent", weight=weight, record_history=record_history
+        )
+        self._prototypes = self._make_prototypes((2, 2, 2, 2))
 
     # ── BaseAgent interface ───────────────────────────────────────────────────
 
@@ -60,70 +112,93 @@ class CostAgent(BaseAgent):
         Returns:
             AgentProposal with recommended deltas and confidence score.
         """
-        metrics = self.evaluate(state)
-        cost_ratio = metrics["cost_ratio"]
-        cost_gap = metrics["cost_gap"]
-
-        deltas: dict[str, float] = {}
-        reasons: list[str] = []
-        confidence_raw: float
-
-        if cost_ratio >= self.CRITICAL_COST_RATIO:
-            # Aggressive cost-cutting
-            reduction = min(0.15, cost_gap * 0.70)
-            deltas = {
-                "cost": -reduction,
-                "marketing_budget": -0.05,  # trim non-critical spend
-                "risk_score": 0.03,          # cost pressure increases risk
-            }
-            reasons.append(
-                f"Critical cost ratio {cost_ratio:.2f}; aggressive reduction "
-                f"targeted (cost ↓{reduction:.1%})."
-            )
-            confidence_raw = 0.88
-
-        elif cost_gap > 0:
-            # Moderate reduction
-            reduction = min(0.08, cost_gap * 0.50)
-            deltas = {
-                "cost": -reduction,
-                "marketing_budget": -0.02,
-            }
-            reasons.append(
-                f"Cost ratio {cost_ratio:.2f} above target {self.TARGET_COST_RATIO}; "
-                f"moderate reduction (cost ↓{reduction:.1%})."
-            )
-            confidence_raw = 0.75
-
-        elif cost_ratio < self.MIN_COST_RATIO:
-            # Over-cut warning – allow some cost increase for quality
-            deltas = {
-                "cost": 0.03,
-                "revenue": 0.02,   # quality reinvestment drives revenue
-                "risk_score": -0.02,
-            }
-            reasons.append(
-                f"Cost ratio {cost_ratio:.2f} below minimum; reinvesting "
-                "to sustain quality and reduce operational risk."
-            )
-            confidence_raw = 0.68
-
-        else:
-            # On-target: minor optimisation
-            deltas = {"cost": -0.01, "revenue": 0.01}
-            reasons.append(
-                f"Cost ratio {cost_ratio:.2f} near target; maintaining "
-                "steady-state efficiency."
-            )
-            confidence_raw = 0.70
-
-        confidence = 1.0 / (1.0 + math.exp(-6.0 * (confidence_raw - 0.5)))
-
-        return AgentProposal(
-            agent_name=self.name,
-            action=reasons[0].split(";")[0],
+        return self._build_proposal(
+            state,
+            cost_kernel(state.revenue, state.cost, *self._threshold_args),
+        )
+
+    def _thresholds(self) -> tuple[float, ...]:
+        """Thresholds in ``cost_kernel`` argument order.
+
+        Snapshotted into ``_threshold_args``; see :class:`Threshold`.
+        """
+        return (
+            self.TARGET_COST_RATIO,
+            self.CRITICAL_COST_RATIO,
+            self.MIN_COST_RATIO,
+        )
+
+    def _build_proposal(
+        self, state: EnvironmentState, result: tuple
+    ) -> AgentProposal:
+        """Build the proposal for *state* from a ``cost_kernel`` result."""
+        (
+            branch, cost_ratio, d_cost, d_marketing, d_risk, d_revenue, confidence_raw
+        ) = result
+        deltas = {key: result[i] for key, i in _DELTA_SLOTS[branch]}
+        values = {
+            "ratio": cost_ratio,
+            "target": self._threshold_args[0],
+            "reduction_pct": -d_cost * 100,
+        }
+
+        return self._prototypes[branch].clone_with(
+            action=_REASONS[branch][0] % values,
             deltas=deltas,
-            confidence=round(confidence, 4),
-            rationale=" | ".join(reasons),
-            priority=2,
+            confidence=confidence_score(confidence_raw),
+            rationale=LazyRationale(_RATIONALES[branch], values),
+        )
+
+    def _cache_key(self, state: EnvironmentState) -> tuple:
+        """Proposals depend only on the cost-to-revenue ratio."""
+        cost_ratio = state.cost / state.revenue if state.revenue > 0 else 1.0
+        return (self._quantize(cost_ratio),)
+
+    def propose_batch(self, states: StateBatch) -> dict[str, Any]:
+        """Vectorised :meth:`propose` over a Struct-of-Arrays batch of states.
+
+        The branch cascade of :meth:`propose` is evaluated as boolean masks so
+        every scenario in the batch is processed by the same NumPy ufuncs.
+
+        Args:
+            states: Mapping of metric name → 1-D array (``revenue``, ``cost``),
+                    or an ``(N, len(METRICS))`` state matrix.
+
+        Returns:
+            Dict with ``deltas``, ``confidence`` and ``priority`` arrays.
+        """
+        states = batch_columns(states)
+        revenue = np.asarray(states["revenue"], dtype=np.float64)
+        cost = np.asarray(states["cost"], dtype=np.float64)
+
+        cost_ratio = np.divide(
+            cost, revenue, out=np.ones_like(cost), where=revenue > 0
         )
+        cost_gap = cost_ratio - self.TARGET_COST_RATIO
+
+        critical = cost_ratio >= self.CRITICAL_COST_RATIO
+        moderate = ~critical & (cost_gap > 0)
+        under = ~critical & ~moderate & (cost_ratio < self.MIN_COST_RATIO)
+        branches = [critical, moderate, under]
+
+        deltas = self._delta_matrix({
+            "cost": np.select(
+                branches,
+                [
+                    -np.minimum(0.15, cost_gap * 0.70),
+                    -np.minimum(0.08, cost_gap * 0.50),
+                    0.03,
+                ],
+                default=-0.01,
+            ),
+            "marketing_budget": np.select(branches, [-0.05, -0.02, 0.0]),
+            "risk_score": np.select(branches, [0.03, 0.0, -0.02]),
+            "revenue": np.select(branches, [0.0, 0.0, 0.02], default=0.01),
+        })
+        confidence = confidence_select(branches, [0.88, 0.75, 0.68], default=0.70)
+
+        return {
+            "deltas": deltas,
+            "confidence": confidence,
+            "priority": np.full(cost_ratio.shape, 2),
+        }
@@ -0,0 +1,123 @@
+"""
+Fused propose pass for the standard four-agent line-up.
+
+``ensemble_propose`` produces the same proposals as calling ``propose`` on
+each of the Revenue, Risk, Cost and Growth agents in turn, but reads the
+environment state once and evaluates all four numeric cascades in a single
+``ensemble_kernel`` call before handing each result to its agent for
+proposal assembly.
+
+``ensemble_propose_batch`` is the Monte-Carlo counterpart: it returns the
+deltas of all four agents for a whole batch of scenarios as one
+``(N, 4, len(METRICS))`` array.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from agentsphere.agents import _gufunc
+from agentsphere.agents._backend import ensemble_kernel
+from agentsphere.agents.base_agent import AgentProposal
+from agentsphere.agents.cost_agent import CostAgent
+from agentsphere.agents.growth_agent import GrowthAgent
+from agentsphere.agents.revenue_agent import RevenueAgent
+from agentsphere.agents.risk_agent import RiskAgent
+from agentsphere.environment.business_env import (
+    EnvironmentState,
+    StateBatch,
+    batch_columns,
+)
+
+
+def ensemble_propose(
+    state: EnvironmentState,
+    revenue_agent: RevenueAgent,
+    risk_agent: RiskAgent,
+    cost_agent: CostAgent,
+    growth_agent: GrowthAgent,
+) -> list[AgentProposal]:
+    """Generate proposals from all four standard agents in one pass.
+
+    Args:
+        state:         Current environment state.
+        revenue_agent: Agent whose thresholds drive the revenue cascade.
+        risk_agent:    Agent whose thresholds drive the risk cascade.
+        cost_agent:    Agent whose thresholds drive the cost cascade.
+        growth_agent:  Agent whose thresholds drive the growth cascade.
+
+    Returns:
+        ``[revenue, risk, cost, growth]`` proposals (history is not recorded).
+    """
+    revenue_out, risk_out, cost_out, growth_out = ensemble_kernel(
+        state.revenue,
+        state.cost,
+        state.risk_score,
+        state.churn,
+        state.marketing_budget,
+        state.growth_rate,
+        state.volatility,
+        revenue_agent._threshold_args,
+        risk_agent._threshold_args,
+        cost_agent._threshold_args,
+        growth_agent._threshold_args,
+    )
+    return [
+        revenue_agent._build_proposal(state, revenue_out),
+        risk_agent._build_proposal(state, risk_out),
+        cost_agent._build_proposal(state, cost_out),
+        growth_agent._build_proposal(state, growth_out),
+    ]
+
+
+def ensemble_propose_batch(
+    states: StateBatch,
+    revenue_agent: RevenueAgent,
+    risk_agent: RiskAgent,
+    cost_agent: CostAgent,
+    growth_agent: GrowthAgent,
+    parallel: bool = True,
+) -> np.ndarray:
+    """Compute all four agents' deltas for a Struct-of-Arrays batch of states.
+
+    Uses the ensemble gufunc when Numba is installed (threaded across
+    scenarios if *parallel* and called on the main thread, see
+    :func:`agentsphere.agents._gufunc.ensemble_gu`) and the agents'
+    ``propose_batch`` otherwise.
+
+    Args:
+        states:        Mapping of every ``config.METRICS`` name → 1-D array,
+                       or an ``(N, len(METRICS))`` state matrix (its columns
+                       are passed to the gufunc as strided views, uncopied).
+        revenue_agent: Agent whose thresholds drive the revenue cascade.
+        risk_agent:    Agent whose thresholds drive the risk cascade.
+        cost_agent:    Agent whose thresholds drive the cost cascade.
+        growth_agent:  Agent whose thresholds drive the growth cascade.
+        parallel:      Use the ``target="parallel"`` gufunc build.
+
+    Returns:
+        ``(N, 4, len(METRICS))`` array: agents in ``[revenue, risk, cost,
+        growth]`` order, metric columns in ``config.METRICS`` order.
+    """
+    states = batch_columns(states)
+    agents = (revenue_agent, risk_agent, cost_agent, growth_agent)
+    gufunc = _gufunc.ensemble_gu(parallel)
+    if gufunc is None:
+        return np.stack(
+            [agent.propose_batch(states)["deltas"] for agent in agents], axis=1
+        )
+
+    thresholds = np.array(
+        [t for agent in agents for t in agent._threshold_args], dtype=np.float64
+    )
+    return gufunc(
+        np.asarray(states["revenue"], dtype=np.float64),
+        np.asarray(states["cost"], dtype=np.float64),
+        np.asarray(states["risk_score"], dtype=np.float64),
+        np.asarray(states["churn"], dtype=np.float64),
+        np.asarray(states["marketing_budget"], dtype=np.float64),
+        np.asarray(states["growth_rate"], dtype=np.float64),
+        np.asarray(states["volatility"], dtype=np.float64),
+        thresholds,
+        _gufunc.layout_template(),
+    )
@@ -9,21 +9,74 @@ Strategy:
 
 from __future__ import annotations
 
-import math
-
-from agentsphere.agents.base_agent import AgentProposal, BaseAgent
-from agentsphere.environment.business_env import EnvironmentState
+from typing import Any
+
+import numpy as np
+
+from agentsphere.agents._backend import growth_kernel
+from agentsphere.agents._confidence import confidence_score, confidence_select
+from agentsphere.agents.base_agent import (
+    AgentProposal,
+    BaseAgent,
+    LazyRationale,
+    Threshold,
+)
+from agentsphere.environment.business_env import (
+    EnvironmentState,
+    StateBatch,
+    batch_columns,
+)
+
+# Default thresholds; the class attributes of the same name alias these.
+_AGGRESSIVE_GROWTH: float = 0.12     # Target when conditions are favourable
+_CONSERVATIVE_GROWTH: float = 0.04
+_RISK_TOLERANCE: float = 0.40        # Max risk_score before pulling back
+
+# Delta keys and rationale per ``growth_kernel`` branch id.
+_DELTA_KEYS: tuple[tuple[str, ...], ...] = (
+    ("growth_rate", "marketing_budget", "revenue"),           # 0 – pull back
+    ("growth_rate", "marketing_budget", "revenue", "churn"),  # 1 – expand
+    ("growth_rate", "marketing_budget", "revenue"),           # 2 – stagnant
+    ("growth_rate", "revenue"),                               # 3 – sustain
+)
+# Position of each delta in the ``growth_kernel`` result tuple.
+_RESULT_INDEX: dict[str, int] = {
+    "growth_rate": 2,
+    "marketing_budget": 3,
+    "revenue": 4,
+    "churn": 5,
+}
+_DELTA_SLOTS: tuple[tuple[tuple[str, int], ...], ...] = tuple(
+    tuple((k, _RESULT_INDEX[k]) for k in keys) for keys in _DELTA_KEYS
+)
+# ``(action, detail)`` %-templates per branch; the rationale is
+# ``action + detail``.  Percentages are passed pre-scaled by 100.
+_REASONS: tuple[tuple[str, str], ...] = (
+    ("Risk %(risk).2f exceeds tolerance %(tolerance)s",
+     "; scaling back growth strategy."),
+    ("Favourable conditions (risk %(risk).2f, "
+     "saturation %(saturation_pct).0f%%)",
+     "; aggressive expansion (growth ↑%(growth_boost_pct).1f%%)."),
+    ("Stagnant growth %(growth_pct).1f%%",
+     "; moderate marketing push to reignite expansion."),
+    ("Growth %(growth_pct).1f%% on track",
+     "; sustaining momentum with incremental optimisation."),
+)
+_RATIONALES: tuple[str, ...] = tuple(a + d for a, d in _REASONS)
 
 
 class GrowthAgent(BaseAgent):
     """Agent focused on strategic growth and market expansion."""
 
-    AGGRESSIVE_GROWTH: float = 0.12  # Target when conditions are favourable
-    CONSERVATIVE_GROWTH: float = 0.04
-    RISK_TOLERANCE: float = 0.40      # Max risk_score before pulling back
+    AGGRESSIVE_GROWTH = Threshold(_AGGRESSIVE_GROWTH)
+    CONSERVATIVE_GROWTH = Threshold(_CONSERVATIVE_GROWTH)
+    RISK_TOLERANCE = Threshold(_RISK_TOLERANCE)
 
-    def __init__(self, weight: float = 0.20) -> None:
-        super().__init__(name="GrowthAgent", weight=weight)
+    def __init__(self, weight: float = 0.20, record_history: bool = True) -> None:
+        super().__init__(
+            name="GrowthAgent", weight=weight, record_history=record_history
+        )
+        self._prototypes = self._make_prototypes((3, 3, 3, 3))
 
     # ── BaseAgent interface ───────────────────────────────────────────────────
 
@@ -72,77 +125,122 @@ class GrowthAgent(BaseAgent):
         Returns:
             AgentProposal with recommended deltas and confidence score.
         """
-        metrics = self.evaluate(state)
-        growth_potential = metrics["growth_potential"]
-        market_saturation = metrics["market_saturation"]
-        risk_adjusted_potential = metrics["risk_adjusted_potential"]
-
-        deltas: dict[str, float] = {}
-        reasons: list[str] = []
-        confidence_raw: float
-
-        if state.risk_score > self.RISK_TOLERANCE:
-            # Pull back growth plans due to risk
-            deltas = {
-                "growth_rate": -0.01,
-                "marketing_budget": -0.05,
-                "revenue": -0.01,
-            }
-            reasons.append(
-                f"Risk {state.risk_score:.2f} exceeds tolerance "
-                f"{self.RISK_TOLERANCE}; scaling back growth strategy."
-            )
-            confidence_raw = 0.80
-
-        elif risk_adjusted_potential > 0.04 and market_saturation < 0.70:
-            # Aggressive expansion
-            mkt_boost = min(0.20, risk_adjusted_potential * 1.5)
-            rev_boost = risk_adjusted_potential * 1.2
-            deltas = {
-                "growth_rate": risk_adjusted_potential * 0.80,
-                "marketing_budget": mkt_boost,
-                "revenue": rev_boost,
-                "churn": -0.01,  # better brand drives retention
-            }
-            reasons.append(
-                f"Favourable conditions (risk {state.risk_score:.2f}, "
-                f"saturation {market_saturation:.0%}); aggressive expansion "
-                f"(growth ↑{risk_adjusted_potential * 0.80:.1%})."
-            )
-            confidence_raw = 0.85
-
-        elif state.growth_rate < self.CONSERVATIVE_GROWTH:
-            # Stagnation – moderate push
-            deltas = {
-                "growth_rate": 0.02,
-                "marketing_budget": 0.08,
-                "revenue": 0.03,
-            }
-            reasons.append(
-                f"Stagnant growth {state.growth_rate:.1%}; moderate marketing "
-                "push to reignite expansion."
-            )
-            confidence_raw = 0.72
-
-        else:
-            # Sustain and optimise
-            deltas = {
-                "growth_rate": 0.005,
-                "revenue": 0.015,
-            }
-            reasons.append(
-                f"Growth {state.growth_rate:.1%} on track; sustaining momentum "
-                "with incremental optimisation."
-            )
-            confidence_raw = 0.68
-
-        confidence = 1.0 / (1.0 + math.exp(-6.0 * (confidence_raw - 0.5)))
-
-        return AgentProposal(
-            agent_name=self.name,
-            action=reasons[0].split(";")[0],
+        return self._build_proposal(
+            state,
+            growth_kernel(
+                state.revenue,
+                state.risk_score,
+                state.marketing_budget,
+                state.growth_rate,
+                *self._threshold_args,
+            ),
+        )
+
+    def _thresholds(self) -> tuple[float, ...]:
+        """Thresholds in ``growth_kernel`` argument order.
+
+        Snapshotted into ``_threshold_args``; see :class:`Threshold`.
+        """
+        return (
+            self.AGGRESSIVE_GROWTH,
+            self.CONSERVATIVE_GROWTH,
+            self.RISK_TOLERANCE,
+        )
+
+    def _build_proposal(
+        self, state: EnvironmentState, result: tuple
+    ) -> AgentProposal:
+        """Build the proposal for *state* from a ``growth_kernel`` result."""
+        (
+            branch, market_saturation,
+            d_growth, d_marketing, d_revenue, d_churn,
+            confidence_raw,
+        ) = result
+        deltas = {key: result[i] for key, i in _DELTA_SLOTS[branch]}
+        values = {
+            "risk": state.risk_score,
+            "tolerance": self._threshold_args[2],
+            "saturation_pct": market_saturation * 100,
+            "growth_pct": state.growth_rate * 100,
+            "growth_boost_pct": d_growth * 100,
+        }
+
+        return self._prototypes[branch].clone_with(
+            action=_REASONS[branch][0] % values,
             deltas=deltas,
-            confidence=round(confidence, 4),
-            rationale=" | ".join(reasons),
-            priority=3,
+            confidence=confidence_score(confidence_raw),
+            rationale=LazyRationale(_RATIONALES[branch], values),
+        )
+
+    def _cache_key(self, state: EnvironmentState) -> tuple:
+        """Proposals depend on revenue, marketing spend, risk and growth."""
+        return (
+            self._quantize(state.revenue),
+            self._quantize(state.marketing_budget),
+            self._quantize(state.risk_score),
+            self._quantize(state.growth_rate),
+        )
+
+    def propose_batch(self, states: StateBatch) -> dict[str, Any]:
+        """Vectorised :meth:`propose` over a Struct-of-Arrays batch of states.
+
+        Args:
+            states: Mapping of metric name → 1-D array (``revenue``,
+                    ``risk_score``, ``marketing_budget``, ``growth_rate``), or
+                    an ``(N, len(METRICS))`` state matrix.
+
+        Returns:
+            Dict with ``deltas``, ``confidence`` and ``priority`` arrays.
+        """
+        states = batch_columns(states)
+        revenue = np.asarray(states["revenue"], dtype=np.float64)
+        risk_score = np.asarray(states["risk_score"], dtype=np.float64)
+        marketing_budget = np.asarray(states["marketing_budget"], dtype=np.float64)
+        growth_rate = np.asarray(states["growth_rate"], dtype=np.float64)
+
+        growth_potential = np.maximum(0.0, self.AGGRESSIVE_GROWTH - growth_rate)
+        market_saturation = np.minimum(
+            1.0,
+            np.divide(
+                marketing_budget,
+                revenue * 0.15,
+                out=np.ones_like(revenue),
+                where=revenue > 0,
+            ),
         )
+        risk_factor = np.maximum(0.0, 1.0 - risk_score / self.RISK_TOLERANCE)
+        risk_adjusted_potential = growth_potential * risk_factor
+
+        pull_back = risk_score > self.RISK_TOLERANCE
+        expand = (
+            ~pull_back
+            & (risk_adjusted_potential > 0.04)
+            & (market_saturation < 0.70)
+        )
+        stagnant = ~pull_back & ~expand & (growth_rate < self.CONSERVATIVE_GROWTH)
+        branches = [pull_back, expand, stagnant]
+
+        deltas = self._delta_matrix({
+            "growth_rate": np.select(
+                branches,
+                [-0.01, risk_adjusted_potential * 0.80, 0.02],
+                default=0.005,
+            ),
+            "marketing_budget": np.select(
+                branches,
+                [-0.05, np.minimum(0.20, risk_adjusted_potential * 1.5), 0.08],
+            ),
+            "revenue": np.select(
+                branches,
+                [-0.01, risk_adjusted_potential * 1.2, 0.03],
+                default=0.015,
+            ),
+            "churn": np.where(expand, -0.01, 0.0),
+        })
+        confidence = confidence_select(branches, [0.80, 0.85, 0.72], default=0.68)
+
+        return {
+            "deltas": deltas,
+            "confidence": confidence,
+            "priority": np.full(confidence.shape, 3),
+        }
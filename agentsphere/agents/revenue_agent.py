@@ -9,20 +9,86 @@ Strategy:
 
 from __future__ import annotations
 
-import math
-
-from agentsphere.agents.base_agent import AgentProposal, BaseAgent
-from agentsphere.environment.business_env import EnvironmentState
+from typing import Any
+
+import numpy as np
+
+from agentsphere.agents._backend import revenue_kernel
+from agentsphere.agents._confidence import confidence_score, logistic_array
+from agentsphere.agents.base_agent import (
+    AgentProposal,
+    BaseAgent,
+    LazyRationale,
+    Threshold,
+)
+from agentsphere.environment.business_env import (
+    EnvironmentState,
+    StateBatch,
+    batch_columns,
+)
+
+# Default thresholds; the class attributes of the same name alias these.
+_TARGET_GROWTH_RATE: float = 0.08     # 8 % desired quarterly growth
+_HIGH_CHURN_THRESHOLD: float = 0.10   # 10 % churn is considered critical
+
+# ``revenue_kernel`` branch bits and the delta keys for each combination.
+_LOW_GROWTH: int = 1
+_HIGH_CHURN: int = 2
+_DELTA_KEYS: tuple[tuple[str, ...], ...] = (
+    ("revenue", "growth_rate"),                                         # healthy
+    ("marketing_budget", "revenue", "growth_rate"),                     # low growth
+    ("churn", "cost", "revenue"),                                       # high churn
+    ("marketing_budget", "revenue", "growth_rate", "churn", "cost"),    # both
+)
+# Position of each delta in the ``revenue_kernel`` result tuple.
+_RESULT_INDEX: dict[str, int] = {
+    "marketing_budget": 1,
+    "revenue": 2,
+    "growth_rate": 3,
+    "churn": 4,
+    "cost": 5,
+}
+_DELTA_SLOTS: tuple[tuple[tuple[str, int], ...], ...] = tuple(
+    tuple((k, _RESULT_INDEX[k]) for k in keys) for keys in _DELTA_KEYS
+)
+# Action and rationale %-templates per branch combination, formatted with a
+# mapping of values (percentages pre-scaled by 100).
+_LOW_GROWTH_ACTION: str = (
+    "Growth rate %(growth_pct).1f%% is below target %(target_pct).1f%%"
+)
+_LOW_GROWTH_REASON: str = (
+    _LOW_GROWTH_ACTION + "; increasing marketing by %(marketing_pct).1f%%."
+)
+_HIGH_CHURN_ACTION: str = "Churn %(churn_pct).1f%% exceeds threshold"
+_HIGH_CHURN_REASON: str = (
+    _HIGH_CHURN_ACTION
+    + "; deploying retention programme (churn ↓%(churn_cut_pct).1f%%)."
+)
+_ACTIONS: tuple[str, ...] = (
+    "Revenue metrics healthy",
+    _LOW_GROWTH_ACTION,
+    _HIGH_CHURN_ACTION,
+    "Boost marketing & reduce churn",
+)
+_RATIONALES: tuple[str, ...] = (
+    "Revenue metrics healthy; maintaining trajectory.",
+    _LOW_GROWTH_REASON,
+    _HIGH_CHURN_REASON,
+    _LOW_GROWTH_REASON + " | " + _HIGH_CHURN_REASON,
+)
 
 
 class RevenueAgent(BaseAgent):
     """Agent focused on revenue optimisation and customer retention."""
 
-    TARGET_GROWTH_RATE: float = 0.08   # 8 % desired quarterly growth
-    HIGH_CHURN_THRESHOLD: float = 0.10 # 10 % churn is considered critical
+    TARGET_GROWTH_RATE = Threshold(_TARGET_GROWTH_RATE)
+    HIGH_CHURN_THRESHOLD = Threshold(_HIGH_CHURN_THRESHOLD)
 
-    def __init__(self, weight: float = 0.30) -> None:
-        super().__init__(name="RevenueAgent", weight=weight)
+    def __init__(self, weight: float = 0.30, record_history: bool = True) -> None:
+        super().__init__(
+            name="RevenueAgent", weight=weight, record_history=record_history
+        )
+        self._prototypes = self._make_prototypes((1, 1, 1, 1))
 
     # ── BaseAgent interface ───────────────────────────────────────────────────
 
@@ -66,64 +132,104 @@ class RevenueAgent(BaseAgent):
         Returns:
             AgentProposal with recommended deltas and confidence score.
         """
-        metrics = self.evaluate(state)
-        revenue_gap = metrics["revenue_gap"]
-        churn_severity = metrics["churn_severity"]
-
-        deltas: dict[str, float] = {}
-        reasons: list[str] = []
-        confidence_factors: list[float] = []
-
-        if revenue_gap > 0:
-            # Boost marketing and project revenue gain
-            boost = min(0.20, revenue_gap * 2.0)
-            deltas["marketing_budget"] = boost
-            deltas["revenue"] = revenue_gap * 0.80
-            deltas["growth_rate"] = revenue_gap * 0.50
-            reasons.append(
-                f"Growth rate {state.growth_rate:.1%} is below target "
-                f"{self.TARGET_GROWTH_RATE:.1%}; increasing marketing by "
-                f"{boost:.1%}."
-            )
-            confidence_factors.append(min(1.0, revenue_gap / self.TARGET_GROWTH_RATE))
-
-        if churn_severity > 0:
-            # Invest in retention
-            churn_reduction = min(0.25, churn_severity * 3.0)
-            deltas["churn"] = -churn_reduction
-            deltas["cost"] = deltas.get("cost", 0.0) + 0.02  # retention cost
-            deltas["revenue"] = deltas.get("revenue", 0.0) + churn_severity * 1.5
-            reasons.append(
-                f"Churn {state.churn:.1%} exceeds threshold; deploying "
-                f"retention programme (churn ↓{churn_reduction:.1%})."
-            )
-            confidence_factors.append(
-                min(1.0, churn_severity / self.HIGH_CHURN_THRESHOLD)
-            )
-
-        if not deltas:
-            # Healthy state – maintain with a small revenue nudge
-            deltas = {"revenue": 0.02, "growth_rate": 0.005}
-            reasons.append("Revenue metrics healthy; maintaining trajectory.")
-            confidence_factors.append(0.70)
-
-        confidence = float(
-            sum(confidence_factors) / len(confidence_factors)
-            if confidence_factors
-            else 0.65
+        return self._build_proposal(
+            state,
+            revenue_kernel(state.growth_rate, state.churn, *self._threshold_args),
         )
-        # Normalise confidence using a logistic-style curve so it stays in (0,1)
-        confidence = 1.0 / (1.0 + math.exp(-6.0 * (confidence - 0.5)))
-
-        return AgentProposal(
-            agent_name=self.name,
-            action=(
-                "Boost marketing & reduce churn"
-                if len(reasons) > 1
-                else reasons[0].split(";")[0]
-            ),
+
+    def _thresholds(self) -> tuple[float, ...]:
+        """Thresholds in ``revenue_kernel`` argument order.
+
+        Snapshotted into ``_threshold_args``; see :class:`Threshold`.
+        """
+        return (self.TARGET_GROWTH_RATE, self.HIGH_CHURN_THRESHOLD)
+
+    def _build_proposal(
+        self, state: EnvironmentState, result: tuple
+    ) -> AgentProposal:
+        """Build the proposal for *state* from a ``revenue_kernel`` result."""
+        (
+            branch, d_marketing, d_revenue, d_growth, d_churn, d_cost, confidence_raw
+        ) = result
+        deltas = {key: result[i] for key, i in _DELTA_SLOTS[branch]}
+
+        values = {
+            "growth_pct": state.growth_rate * 100,
+            "target_pct": self._threshold_args[0] * 100,
+            "marketing_pct": d_marketing * 100,
+            "churn_pct": state.churn * 100,
+            "churn_cut_pct": -d_churn * 100,
+        }
+
+        return self._prototypes[branch].clone_with(
+            action=_ACTIONS[branch] % values,
             deltas=deltas,
-            confidence=round(confidence, 4),
-            rationale=" | ".join(reasons),
-            priority=1,
+            confidence=confidence_score(confidence_raw),
+            rationale=LazyRationale(_RATIONALES[branch], values),
         )
+
+    def _cache_key(self, state: EnvironmentState) -> tuple:
+        """Proposals depend only on growth rate and churn."""
+        return (self._quantize(state.growth_rate), self._quantize(state.churn))
+
+    def propose_batch(self, states: StateBatch) -> dict[str, Any]:
+        """Vectorised :meth:`propose` over a Struct-of-Arrays batch of states.
+
+        Args:
+            states: Mapping of metric name → 1-D array (``growth_rate``,
+                    ``churn``), or an ``(N, len(METRICS))`` state matrix.
+
+        Returns:
+            Dict with ``deltas``, ``confidence`` and ``priority`` arrays.
+        """
+        states = batch_columns(states)
+        growth_rate = np.asarray(states["growth_rate"], dtype=np.float64)
+        churn = np.asarray(states["churn"], dtype=np.float64)
+
+        revenue_gap = self.TARGET_GROWTH_RATE - growth_rate
+        churn_severity = np.maximum(0.0, churn - self.HIGH_CHURN_THRESHOLD)
+
+        low_growth = revenue_gap > 0
+        high_churn = churn_severity > 0
+        healthy = ~low_growth & ~high_churn
+
+        deltas = self._delta_matrix({
+            "marketing_budget": np.where(
+                low_growth, np.minimum(0.20, revenue_gap * 2.0), 0.0
+            ),
+            "revenue": (
+                np.where(low_growth, revenue_gap * 0.80, 0.0)
+                + np.where(high_churn, churn_severity * 1.5, 0.0)
+                + np.where(healthy, 0.02, 0.0)
+            ),
+            "growth_rate": np.select(
+                [low_growth, healthy], [revenue_gap * 0.50, 0.005]
+            ),
+            "churn": np.where(
+                high_churn, -np.minimum(0.25, churn_severity * 3.0), 0.0
+            ),
+            "cost": np.where(high_churn, 0.02, 0.0),
+        })
+
+        # Mean of the confidence factors contributed by each active strategy
+        factor_sum = np.where(
+            low_growth,
+            np.minimum(1.0, revenue_gap / self.TARGET_GROWTH_RATE),
+            0.0,
+        ) + np.where(
+            high_churn,
+            np.minimum(1.0, churn_severity / self.HIGH_CHURN_THRESHOLD),
+            0.0,
+        )
+        n_factors = low_growth.astype(np.int64) + high_churn.astype(np.int64)
+        confidence = np.where(
+            healthy,
+            confidence_score(0.70),
+            np.round(logistic_array(factor_sum / np.maximum(n_factors, 1)), 4),
+        )
+
+        return {
+            "deltas": deltas,
+            "confidence": confidence,
+            "priority": np.full(confidence.shape, 1),
+        }
@@ -9,22 +9,93 @@ Strategy:
 
 from __future__ import annotations
 
-import math
-
-from agentsphere.agents.base_agent import AgentProposal, BaseAgent
-from agentsphere.environment.business_env import EnvironmentState
+from typing import Any
+
+import numpy as np
+
+from agentsphere.agents._backend import risk_kernel
+from agentsphere.agents._confidence import confidence_score, confidence_select
+from agentsphere.agents.base_agent import (
+    AgentProposal,
+    BaseAgent,
+    LazyRationale,
+    Threshold,
+)
+from agentsphere.environment.business_env import (
+    EnvironmentState,
+    StateBatch,
+    batch_columns,
+)
+
+# Default thresholds; the class attributes of the same name alias these.
+_CRITICAL_RISK: float = 0.65     # risk_score threshold for critical state
+_HIGH_RISK: float = 0.45         # risk_score threshold for elevated state
+_SAFE_RISK: float = 0.25         # risk_score threshold for safe state
+_HIGH_VOLATILITY: float = 0.30   # volatility threshold
+
+# Delta keys per ``risk_kernel`` branch id, without / with the high-volatility
+# overlay (which adds ``volatility`` and ``growth_rate`` when missing).
+_BASE_KEYS: tuple[tuple[str, ...], ...] = (
+    ("risk_score", "cost", "revenue", "volatility", "growth_rate"),  # 0 – critical
+    ("risk_score", "cost", "volatility"),                            # 1 – elevated
+    ("risk_score", "growth_rate", "revenue"),                        # 2 – safe
+    ("risk_score", "cost"),                                          # 3 – moderate
+)
+_DELTA_KEYS: tuple[tuple[tuple[str, ...], ...], ...] = (
+    _BASE_KEYS,
+    tuple(
+        keys + tuple(k for k in ("volatility", "growth_rate") if k not in keys)
+        for keys in _BASE_KEYS
+    ),
+)
+# Position of each delta in the ``risk_kernel`` result tuple.
+_RESULT_INDEX: dict[str, int] = {
+    "risk_score": 3,
+    "cost": 4,
+    "revenue": 5,
+    "volatility": 6,
+    "growth_rate": 7,
+}
+_DELTA_SLOTS: tuple[tuple[tuple[tuple[str, int], ...], ...], ...] = tuple(
+    tuple(tuple((k, _RESULT_INDEX[k]) for k in keys) for keys in variant)
+    for variant in _DELTA_KEYS
+)
+# ``(action, detail)`` %-templates per branch; the first rationale clause is
+# ``action + detail``.
+_REASONS: tuple[tuple[str, str], ...] = (
+    ("CRITICAL risk %(risk).2f",
+     "; emergency mitigation deployed (risk ↓%(mitigation).2f)."),
+    ("Elevated risk %(risk).2f",
+     "; moderate mitigation (risk ↓%(mitigation).2f)."),
+    ("Risk at safe level %(risk).2f",
+     "; allocating headroom for growth acceleration."),
+    ("Moderate risk %(risk).2f",
+     "; holding steady with minor mitigation."),
+)
+_HIGH_VOL_REASON: str = (
+    " | High volatility %(volatility).2f; dampening growth exposure "
+    "(volatility ↓%(vol_reduction).2f)."
+)
+# Full rationale templates indexed ``[high_vol][branch]``.
+_RATIONALES: tuple[tuple[str, ...], ...] = (
+    tuple(a + d for a, d in _REASONS),
+    tuple(a + d + _HIGH_VOL_REASON for a, d in _REASONS),
+)
 
 
 class RiskAgent(BaseAgent):
     """Agent focused on risk assessment and mitigation."""
 
-    CRITICAL_RISK: float = 0.65   # risk_score threshold for critical state
-    HIGH_RISK: float = 0.45       # risk_score threshold for elevated state
-    SAFE_RISK: float = 0.25       # risk_score threshold for safe state
-    HIGH_VOLATILITY: float = 0.30 # volatility threshold
+    CRITICAL_RISK = Threshold(_CRITICAL_RISK)
+    HIGH_RISK = Threshold(_HIGH_RISK)
+    SAFE_RISK = Threshold(_SAFE_RISK)
+    HIGH_VOLATILITY = Threshold(_HIGH_VOLATILITY)
 
-    def __init__(self, weight: float = 0.25) -> None:
-        super().__init__(name="RiskAgent", weight=weight)
+    def __init__(self, weight: float = 0.25, record_history: bool = True) -> None:
+        super().__init__(
+            name="RiskAgent", weight=weight, record_history=record_history
+        )
+        self._prototypes = self._make_prototypes((1, 1, 1, 1))
 
     # ── BaseAgent interface ───────────────────────────────────────────────────
 
@@ -62,82 +133,105 @@ class RiskAgent(BaseAgent):
         Returns:
             AgentProposal with recommended deltas and confidence score.
         """
-        metrics = self.evaluate(state)
-        risk_excess = metrics["risk_excess"]
-        volatility_excess = metrics["volatility_excess"]
-
-        deltas: dict[str, float] = {}
-        reasons: list[str] = []
-        confidence_raw: float
-
-        if state.risk_score >= self.CRITICAL_RISK:
-            # Emergency mitigation
-            mitigation = risk_excess * 0.40
-            deltas = {
-                "risk_score": -mitigation,
-                "cost": 0.05,               # risk-mitigation spend
-                "revenue": -0.02,           # short-term revenue hit
-                "volatility": -0.05,
-                "growth_rate": -0.02,
-            }
-            reasons.append(
-                f"CRITICAL risk {state.risk_score:.2f}; emergency mitigation "
-                f"deployed (risk ↓{mitigation:.2f})."
-            )
-            confidence_raw = 0.90
-
-        elif state.risk_score >= self.HIGH_RISK:
-            mitigation = risk_excess * 0.25
-            deltas = {
-                "risk_score": -mitigation,
-                "cost": 0.02,
-                "volatility": -0.03,
-            }
-            reasons.append(
-                f"Elevated risk {state.risk_score:.2f}; moderate mitigation "
-                f"(risk ↓{mitigation:.2f})."
-            )
-            confidence_raw = 0.78
-
-        elif state.risk_score <= self.SAFE_RISK:
-            # Safe zone: allow growth headroom
-            deltas = {
-                "risk_score": 0.02,          # slight risk allowance for growth
-                "growth_rate": 0.01,
-                "revenue": 0.03,
-            }
-            reasons.append(
-                f"Risk at safe level {state.risk_score:.2f}; allocating "
-                "headroom for growth acceleration."
-            )
-            confidence_raw = 0.72
-
-        else:
-            # Moderate risk – hold steady
-            deltas = {"risk_score": -0.02, "cost": 0.01}
-            reasons.append(
-                f"Moderate risk {state.risk_score:.2f}; holding steady with "
-                "minor mitigation."
-            )
-            confidence_raw = 0.65
-
-        if volatility_excess > 0:
-            vol_reduction = min(0.10, volatility_excess * 0.50)
-            deltas["volatility"] = deltas.get("volatility", 0.0) - vol_reduction
-            deltas["growth_rate"] = deltas.get("growth_rate", 0.0) - volatility_excess * 0.15
-            reasons.append(
-                f"High volatility {state.volatility:.2f}; dampening growth "
-                f"exposure (volatility ↓{vol_reduction:.2f})."
-            )
-            confidence_raw = min(1.0, confidence_raw + 0.05)
-
-        confidence = 1.0 / (1.0 + math.exp(-6.0 * (confidence_raw - 0.5)))
-
-        return AgentProposal(
-            agent_name=self.name,
-            action=reasons[0].split(";")[0],
+        return self._build_proposal(
+            state,
+            risk_kernel(state.risk_score, state.volatility, *self._threshold_args),
+        )
+
+    def _thresholds(self) -> tuple[float, ...]:
+        """Thresholds in ``risk_kernel`` argument order.
+
+        Snapshotted into ``_threshold_args``; see :class:`Threshold`.
+        """
+        return (
+            self.CRITICAL_RISK,
+            self.HIGH_RISK,
+            self.SAFE_RISK,
+            self.HIGH_VOLATILITY,
+        )
+
+    def _build_proposal(
+        self, state: EnvironmentState, result: tuple
+    ) -> AgentProposal:
+        """Build the proposal for *state* from a ``risk_kernel`` result."""
+        (
+            branch, high_vol, vol_reduction,
+            d_risk, d_cost, d_revenue, d_volatility, d_growth,
+            confidence_raw,
+        ) = result
+        deltas = {key: result[i] for key, i in _DELTA_SLOTS[high_vol][branch]}
+
+        values = {
+            "risk": state.risk_score,
+            "mitigation": -d_risk,
+            "volatility": state.volatility,
+            "vol_reduction": vol_reduction,
+        }
+
+        return self._prototypes[branch].clone_with(
+            action=_REASONS[branch][0] % values,
             deltas=deltas,
-            confidence=round(confidence, 4),
-            rationale=" | ".join(reasons),
-            priority=2 if state.risk_score < self.HIGH_RISK else 1,
+            confidence=confidence_score(confidence_raw),
+            rationale=LazyRationale(_RATIONALES[high_vol][branch], values),
+            priority=2 if state.risk_score < self._threshold_args[1] else 1,
         )
+
+    def _cache_key(self, state: EnvironmentState) -> tuple:
+        """Proposals depend only on risk score and volatility."""
+        return (self._quantize(state.risk_score), self._quantize(state.volatility))
+
+    def propose_batch(self, states: StateBatch) -> dict[str, Any]:
+        """Vectorised :meth:`propose` over a Struct-of-Arrays batch of states.
+
+        Args:
+            states: Mapping of metric name → 1-D array (``risk_score``,
+                    ``volatility``), or an ``(N, len(METRICS))`` state matrix.
+
+        Returns:
+            Dict with ``deltas``, ``confidence`` and ``priority`` arrays.
+        """
+        states = batch_columns(states)
+        risk_score = np.asarray(states["risk_score"], dtype=np.float64)
+        volatility = np.asarray(states["volatility"], dtype=np.float64)
+
+        risk_excess = np.maximum(0.0, risk_score - self.SAFE_RISK)
+        volatility_excess = np.maximum(0.0, volatility - self.HIGH_VOLATILITY)
+
+        critical = risk_score >= self.CRITICAL_RISK
+        high = ~critical & (risk_score >= self.HIGH_RISK)
+        safe = ~critical & ~high & (risk_score <= self.SAFE_RISK)
+        branches = [critical, high, safe]
+        high_vol = volatility_excess > 0
+
+        vol_reduction = np.minimum(0.10, volatility_excess * 0.50)
+        deltas = self._delta_matrix({
+            "risk_score": np.select(
+                branches,
+                [-risk_excess * 0.40, -risk_excess * 0.25, 0.02],
+                default=-0.02,
+            ),
+            "cost": np.select(branches, [0.05, 0.02, 0.0], default=0.01),
+            "revenue": np.select(branches, [-0.02, 0.0, 0.03]),
+            "volatility": (
+                np.select(branches, [-0.05, -0.03, 0.0])
+                - np.where(high_vol, vol_reduction, 0.0)
+            ),
+            "growth_rate": (
+                np.select(branches, [-0.02, 0.0, 0.01])
+                - np.where(high_vol, volatility_excess * 0.15, 0.0)
+            ),
+        })
+
+        levels = (0.90, 0.78, 0.72, 0.65)
+        boosted = tuple(min(1.0, c + 0.05) for c in levels)  # high-vol bonus
+        confidence = np.where(
+            high_vol,
+            confidence_select(branches, boosted[:3], default=boosted[3]),
+            confidence_select(branches, levels[:3], default=levels[3]),
+        )
+
+        return {
+            "deltas": deltas,
+            "confidence": confidence,
+            "priority": np.where(risk_score < self.HIGH_RISK, 2, 1),
+        }
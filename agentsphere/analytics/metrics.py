@@ -2,19 +2,37 @@
 MetricsEngine – derives KPIs, chart datasets, and analytics from simulation results.
 
 All methods are pure functions operating on ``SimulationResult`` data; they
-have no side-effects and produce serialisable outputs suitable for Streamlit
-chart components.
+have no side-effects and produce plain-data (or DataFrame) outputs suitable
+for Streamlit chart components.
 """
 
 from __future__ import annotations
 
+import weakref
 from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+from agentsphere.config import METRICS
+from agentsphere.environment.business_env import batch_columns
 from agentsphere.simulation.simulator import SimulationResult
 
+_state_row = attrgetter(*METRICS)
+_ROW_DTYPE = np.dtype((np.float64, len(METRICS)))
+
+# id(result) → extracted columns.  ``SimulationResult`` is unhashable, so
+# entries are keyed by identity and evicted by a finaliser when the result
+# is garbage-collected (which also keeps a recycled id from hitting).
+_ARRAYS: dict[int, dict[str, np.ndarray]] = {}
+# id(result) → executive KPIs, kept and evicted the same way.
+_KPIS: dict[int, ExecutiveKPIs] = {}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ExecutiveKPIs:
     """Top-level KPIs displayed in the executive dashboard.
 
@@ -44,12 +62,25 @@ class MetricsEngine:
     def executive_kpis(result: SimulationResult) -> ExecutiveKPIs:
         """Compute top-level executive KPIs.
 
+        The KPIs are computed once per result object and reused afterwards
+        (the history tab asks for every past run's KPIs on each rerun).
+
         Args:
             result: Completed simulation result.
 
         Returns:
             ``ExecutiveKPIs`` dataclass instance.
         """
+        key = id(result)
+        kpis = _KPIS.get(key)
+        if kpis is None:
+            kpis = _KPIS[key] = MetricsEngine._compute_kpis(result)
+            weakref.finalize(result, _KPIS.pop, key, None)
+        return kpis
+
+    @staticmethod
+    def _compute_kpis(result: SimulationResult) -> ExecutiveKPIs:
+        """Compute :meth:`executive_kpis` without the per-result cache."""
         fs = result.final_state
         i_s = result.initial_state
 
@@ -62,9 +93,10 @@ class MetricsEngine:
         )
         risk_change = fs.risk_score - i_s.risk_score
 
+        confidence_index = MetricsEngine._as_arrays(result)["confidence_index"]
         avg_confidence = (
-            sum(r.consensus.confidence_index for r in result.rounds) / result.n_rounds
-            if result.n_rounds > 0
+            round(float(confidence_index.mean()), 4)
+            if confidence_index.size
             else 0.0
         )
 
@@ -95,22 +127,14 @@ class MetricsEngine:
         Returns:
             Dict with ``rounds``, ``revenue``, ``cost``, and ``profit`` lists.
         """
-        rounds, revenue, cost, profit = [], [], [], []
-        # Include the initial state as round 0
-        i = result.initial_state
-        rounds.append(0)
-        revenue.append(i.revenue)
-        cost.append(i.cost)
-        profit.append(i.revenue - i.cost)
-
-        for r in result.rounds:
-            s = r.state_after
-            rounds.append(r.round_number)
-            revenue.append(s.revenue)
-            cost.append(s.cost)
-            profit.append(s.revenue - s.cost)
-
-        return {"rounds": rounds, "revenue": revenue, "cost": cost, "profit": profit}
+        cols = MetricsEngine._as_arrays(result)
+        revenue, cost = cols["revenue"], cols["cost"]
+        return {
+            "rounds": cols["rounds"].tolist(),
+            "revenue": revenue.tolist(),
+            "cost": cost.tolist(),
+            "profit": (revenue - cost).tolist(),
+        }
 
     @staticmethod
     def risk_timeline(result: SimulationResult) -> dict[str, list[Any]]:
@@ -122,19 +146,12 @@ class MetricsEngine:
         Returns:
             Dict with ``rounds``, ``risk_score``, and ``volatility`` lists.
         """
-        rounds, risk, volatility = [], [], []
-        i = result.initial_state
-        rounds.append(0)
-        risk.append(i.risk_score)
-        volatility.append(i.volatility)
-
-        for r in result.rounds:
-            s = r.state_after
-            rounds.append(r.round_number)
-            risk.append(s.risk_score)
-            volatility.append(s.volatility)
-
-        return {"rounds": rounds, "risk_score": risk, "volatility": volatility}
+        cols = MetricsEngine._as_arrays(result)
+        return {
+            "rounds": cols["rounds"].tolist(),
+            "risk_score": cols["risk_score"].tolist(),
+            "volatility": cols["volatility"].tolist(),
+        }
 
     @staticmethod
     def agent_radar(result: SimulationResult) -> dict[str, Any]:
@@ -148,33 +165,15 @@ class MetricsEngine:
         Returns:
             Dict with ``agents`` (list of names) and ``scores`` (list of floats).
         """
-        agent_confidence: dict[str, list[float]] = {}
-        agent_vote_share: dict[str, list[float]] = {}
-
-        for rnd in result.rounds:
-            for proposal in rnd.consensus.proposals:
-                name = proposal.agent_name
-                agent_confidence.setdefault(name, []).append(proposal.confidence)
-            for name, vote in rnd.consensus.agent_votes.items():
-                agent_vote_share.setdefault(name, []).append(vote)
-
-        agents: list[str] = sorted(agent_confidence.keys())
-        scores: list[float] = []
-        for name in agents:
-            avg_conf = (
-                sum(agent_confidence[name]) / len(agent_confidence[name])
-                if agent_confidence[name]
-                else 0.0
-            )
-            vote_list = agent_vote_share.get(name, [])
-            avg_vote = (
-                sum(vote_list) / len(vote_list)
-                if vote_list
-                else 0.0
-            )
-            # Multiply by n_agents so that a perfectly aligned agent scores ~1.0
-            n_agents = max(1, len(agents))
-            scores.append(round(avg_conf * avg_vote * n_agents, 4))
+        cols = MetricsEngine._as_arrays(result)
+        agents: list[str] = cols["agents"].tolist()
+        avg_conf = MetricsEngine._column_means(cols["agent_confidence"])
+        avg_vote = MetricsEngine._column_means(cols["agent_votes"])
+        # Multiply by n_agents so that a perfectly aligned agent scores ~1.0
+        n_agents = max(1, len(agents))
+        scores = [
+            round(score, 4) for score in (avg_conf * avg_vote * n_agents).tolist()
+        ]
 
         return {"agents": agents, "scores": scores}
 
@@ -188,49 +187,148 @@ class MetricsEngine:
         Returns:
             Dict with ``rounds``, ``roi``, and ``growth_rate`` lists.
         """
-        rounds, roi, growth = [], [], []
-        i = result.initial_state
-        initial_roi = (
-            (i.revenue - i.cost) / i.cost if i.cost > 0 else 0.0
+        cols = MetricsEngine._as_arrays(result)
+        revenue, cost = cols["revenue"], cols["cost"]
+        roi = np.divide(
+            revenue - cost, cost, out=np.zeros_like(cost), where=cost > 0
         )
-        rounds.append(0)
-        roi.append(initial_roi)
-        growth.append(i.growth_rate)
+        return {
+            "rounds": cols["rounds"].tolist(),
+            "roi": roi.tolist(),
+            "growth_rate": cols["growth_rate"].tolist(),
+        }
+
+    @staticmethod
+    def simulation_timeline(result: SimulationResult) -> pd.DataFrame:
+        """Build a structured timeline of key events per round.
 
-        for r in result.rounds:
-            s = r.state_after
-            round_roi = (s.revenue - s.cost) / s.cost if s.cost > 0 else 0.0
-            rounds.append(r.round_number)
-            roi.append(round_roi)
-            growth.append(s.growth_rate)
+        The frame is assembled column by column from the cached state
+        arrays, so every column has its final dtype from the start.
 
-        return {"rounds": rounds, "roi": roi, "growth_rate": growth}
+        Args:
+            result: Completed simulation result.
+
+        Returns:
+            DataFrame with one row per round and the columns ``round``,
+            ``top_agent``, ``action``, ``confidence``,
+            ``consensus_confidence``, ``conflicts``, ``revenue``,
+            ``risk_score``, ``growth_rate`` and ``noise``.
+        """
+        cols = MetricsEngine._as_arrays(result)
+        rounds = result.rounds
+        n = len(rounds)
+        top_agents = [
+            rnd.consensus.top_proposal
+            or max(rnd.proposals, key=attrgetter("confidence"))
+            for rnd in rounds
+        ]
+        return pd.DataFrame(
+            {
+                "round": cols["rounds"][1:],
+                "top_agent": [p.agent_name for p in top_agents],
+                "action": [p.action for p in top_agents],
+                "confidence": np.fromiter(
+                    (p.confidence for p in top_agents), np.float64, n
+                ),
+                "consensus_confidence": np.fromiter(
+                    (round(c, 4) for c in cols["confidence_index"].tolist()),
+                    np.float64,
+                    n,
+                ),
+                "conflicts": np.fromiter(
+                    (len(rnd.consensus.conflicts) for rnd in rounds), np.int64, n
+                ),
+                "revenue": cols["revenue"][1:],
+                "risk_score": cols["risk_score"][1:],
+                "growth_rate": cols["growth_rate"][1:],
+                "noise": np.fromiter((rnd.noise for rnd in rounds), np.float64, n),
+            }
+        )
+
+    # ── Helpers ───────────────────────────────────────────────────────────────
 
     @staticmethod
-    def simulation_timeline(result: SimulationResult) -> list[dict[str, Any]]:
-        """Build a structured timeline of key events per round.
+    def _as_arrays(result: SimulationResult) -> dict[str, np.ndarray]:
+        """Extract the per-round state series as Struct-of-Arrays columns.
+
+        Row 0 is the initial state, followed by each round's ``state_after``
+        (read from ``result.states`` when the simulator recorded it).
+        The extraction runs once per result object; later calls (the
+        dashboard asks for every dataset of the same result) reuse it, so
+        the returned arrays must be treated as read-only.
 
         Args:
             result: Completed simulation result.
 
         Returns:
-            List of dicts (one per round) with summary event data.
+            Mapping of ``rounds`` (round numbers, 0 for the initial state) and
+            every metric in ``config.METRICS`` → 1-D array, plus the
+            per-round consensus ``confidence_index`` and the agent tables:
+            ``agents`` (sorted names) and ``agent_confidence`` /
+            ``agent_votes`` ``(n_rounds, n_agents)`` matrices, NaN where an
+            agent is absent from a round.
         """
-        timeline: list[dict[str, Any]] = []
-        for rnd in result.rounds:
-            top_agent = max(rnd.proposals, key=lambda p: p.confidence)
-            timeline.append(
-                {
-                    "round": rnd.round_number,
-                    "top_agent": top_agent.agent_name,
-                    "action": top_agent.action,
-                    "confidence": top_agent.confidence,
-                    "consensus_confidence": rnd.consensus.confidence_index,
-                    "conflicts": len(rnd.consensus.conflicts),
-                    "revenue": rnd.state_after.revenue,
-                    "risk_score": rnd.state_after.risk_score,
-                    "growth_rate": rnd.state_after.growth_rate,
-                    "noise": rnd.noise,
-                }
+        key = id(result)
+        cols = _ARRAYS.get(key)
+        if cols is None:
+            cols = _ARRAYS[key] = MetricsEngine._extract_arrays(result)
+            weakref.finalize(result, _ARRAYS.pop, key, None)
+        return cols
+
+    @staticmethod
+    def _extract_arrays(result: SimulationResult) -> dict[str, np.ndarray]:
+        """Build the :meth:`_as_arrays` columns for *result* (uncached)."""
+        count = result.n_rounds + 1
+        if result.states is not None and len(result.states) == count:
+            matrix = result.states.copy()
+        else:
+            states = chain(
+                (result.initial_state,), (r.state_after for r in result.rounds)
             )
-        return timeline
+            matrix = np.fromiter(map(_state_row, states), _ROW_DTYPE, count)
+        rounds = np.fromiter(
+            chain((0,), (r.round_number for r in result.rounds)),
+            np.int64,
+            count,
+        )
+
+        consensus = [r.consensus for r in result.rounds]
+        agents = sorted({p.agent_name for c in consensus for p in c.proposals})
+        shape = (len(consensus), len(agents))
+        nan = float("nan")
+        confidence = np.array([
+            [by_name.get(name, nan) for name in agents]
+            for by_name in (
+                {p.agent_name: p.confidence for p in c.proposals}
+                for c in consensus
+            )
+        ]).reshape(shape)
+        confidence_index = np.fromiter(
+            (c.confidence_index for c in consensus), np.float64, len(consensus)
+        )
+        votes = np.array([
+            [c.agent_votes.get(name, nan) for name in agents] for c in consensus
+        ]).reshape(shape)
+
+        cols = {
+            "rounds": rounds,
+            **batch_columns(matrix),
+            "confidence_index": confidence_index,
+            "agents": np.array(agents, dtype=str),
+            "agent_confidence": confidence,
+            "agent_votes": votes,
+        }
+        # Shared between callers through the cache.
+        for array in (matrix, *cols.values()):
+            array.flags.writeable = False
+        return cols
+
+    @staticmethod
+    def _column_means(table: np.ndarray) -> np.ndarray:
+        """Per-column mean of *table* ignoring NaNs (0.0 for empty columns)."""
+        present = ~np.isnan(table)
+        counts = present.sum(axis=0)
+        totals = np.where(present, table, 0.0).sum(axis=0)
+        return np.divide(
+            totals, counts, out=np.zeros(table.shape[1]), where=counts > 0
+        )
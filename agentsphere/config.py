@@ -4,6 +4,8 @@ AgentSphere AI – Global configuration constants and defaults.
 
 from __future__ import annotations
 
+import sys
+
 # ── Environment defaults ──────────────────────────────────────────────────────
 
 ENV_DEFAULTS: dict[str, float] = {
@@ -16,12 +18,25 @@ ENV_DEFAULTS: dict[str, float] = {
     "volatility": 0.15,           # 15 % market volatility
 }
 
+# Fixed metric schema used by array (vector / batch) representations of
+# states and deltas: column ``METRIC_INDEX[name]`` holds metric ``name``.
+# Names are interned so every delta / state dict keyed by them shares the
+# same string objects (lookups then short-circuit on identity).
+METRICS: tuple[str, ...] = tuple(sys.intern(name) for name in ENV_DEFAULTS)
+METRIC_INDEX: dict[str, int] = {name: i for i, name in enumerate(METRICS)}
+
 # ── Simulation parameters ─────────────────────────────────────────────────────
 
 MAX_ROUNDS: int = 12          # Maximum simulation rounds per run
 DEFAULT_ROUNDS: int = 6       # Default number of rounds
 RANDOM_SEED: int = 42
 
+# Custom agent line-ups with at least this many agents have their proposals
+# gathered concurrently on a shared thread pool; smaller line-ups run
+# sequentially, where the submit/wake-up overhead would outweigh the gain.
+PARALLEL_AGENT_THRESHOLD: int = 8
+AGENT_POOL_WORKERS: int = 4
+
 # ── Agent negotiation weights ─────────────────────────────────────────────────
 # Must sum to 1.0
 
@@ -38,6 +53,11 @@ AGENT_WEIGHTS: dict[str, float] = {
 
 CONFLICT_THRESHOLD: float = 0.50
 
+# Rounds with at least this many proposals score all pairs at once with
+# matrix products; smaller rounds compare pairs directly, where the NumPy
+# call overhead would outweigh the saved Python work.
+MATRIX_CONFLICT_THRESHOLD: int = 8
+
 # ── UI constants ──────────────────────────────────────────────────────────────
 
 APP_TITLE: str = "AgentSphere AI – Multi-Agent Strategic Simulation Engine"
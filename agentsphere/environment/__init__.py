@@ -1,5 +1,15 @@
 """Environment sub-package for AgentSphere AI."""
 
-from agentsphere.environment.business_env import BusinessEnvironment, EnvironmentState
+from agentsphere.environment.business_env import (
+    BatchedBusinessEnvironment,
+    BusinessEnvironment,
+    EnvironmentState,
+    batch_columns,
+)
 
-__all__ = ["BusinessEnvironment", "EnvironmentState"]
+__all__ = [
+    "BatchedBusinessEnvironment",
+    "BusinessEnvironment",
+    "EnvironmentState",
+    "batch_columns",
+]
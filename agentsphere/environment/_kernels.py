@@ -0,0 +1,66 @@
+"""
+Numeric kernel behind ``BusinessEnvironment.apply_deltas``.
+
+The kernel works on fixed-length metric vectors in ``config.METRICS`` order:
+the current state, the delta for every metric (zero where none was
+proposed), and the per-metric lower / upper bounds.  It computes the same
+``value * (1 + delta ± noise)`` update and clamp as the pure-Python path,
+in the same operation order, so both produce bit-identical states.
+
+Compiled with Numba when it is installed (``fastmath`` is deliberately left
+off: it would let LLVM contract or reorder the update and change results).
+Without Numba the environment keeps its attribute-based Python path, as
+element-wise indexing of small arrays is slower than plain float maths.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from agentsphere._numba import njit
+from agentsphere.config import METRICS
+
+
+@njit(nogil=True, cache=True)
+def apply_deltas_kernel(
+    state: np.ndarray,
+    deltas: np.ndarray,
+    noise: float,
+    lo: np.ndarray,
+    hi: np.ndarray,
+) -> np.ndarray:
+    """Return the bounded state vector after one round of deltas.
+
+    Noise is added in the direction of each metric's delta (a zero delta
+    counts as positive).
+
+    Args:
+        state:  Current metric vector.
+        deltas: Fractional change per metric.
+        noise:  Noise factor sampled by the simulator.
+        lo:     Lower bound per metric.
+        hi:     Upper bound per metric.
+
+    Returns:
+        New metric vector.
+    """
+    out = np.empty_like(state)
+    for i in range(state.shape[0]):
+        d = deltas[i]
+        raw = state[i] * (1.0 + d + (noise if d >= 0 else -noise))
+        raw = raw if raw < hi[i] else hi[i]
+        out[i] = raw if raw > lo[i] else lo[i]
+    return out
+
+
+def warmup() -> None:
+    """Trigger compilation (or on-disk cache load) of the kernel.
+
+    Called by :func:`agentsphere.warmup`.  The bounds are passed read-only,
+    matching the environment's shared vectors (Numba compiles a separate
+    specialisation for them).
+    """
+    ones, zeros = np.ones(len(METRICS)), np.zeros(len(METRICS))
+    lo, hi = zeros.copy(), ones.copy()
+    lo.flags.writeable = hi.flags.writeable = False
+    apply_deltas_kernel(ones, zeros, 0.0, lo, hi)
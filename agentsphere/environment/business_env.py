@@ -7,12 +7,44 @@ apply agent-proposed deltas, snapshot the state, and reset to initial values.
 
 from __future__ import annotations
 
-import copy
-from dataclasses import asdict, dataclass
-from typing import Any
-
-
-@dataclass
+from dataclasses import dataclass, replace
+from typing import Any, Union
+
+import numpy as np
+
+from agentsphere._numba import HAVE_NUMBA
+from agentsphere.config import MAX_ROUNDS, METRIC_INDEX, METRICS
+from agentsphere.environment._kernels import apply_deltas_kernel
+
+# A batch of scenarios: metric name → 1-D array, or an (N, len(METRICS)) matrix.
+StateBatch = Union[dict[str, np.ndarray], np.ndarray]
+# Deltas for one round: metric name → change, or a (len(METRICS),) vector.
+Deltas = Union[dict[str, float], np.ndarray]
+
+# Hard bounds for each metric.
+_LO_REVENUE, _HI_REVENUE = 1.0, 1e9
+_LO_COST, _HI_COST = 1.0, 1e9
+_LO_RISK, _HI_RISK = 0.0, 1.0
+_LO_CHURN, _HI_CHURN = 0.0, 1.0
+_LO_MARKETING, _HI_MARKETING = 0.0, 1e8
+_LO_GROWTH, _HI_GROWTH = -0.50, 2.0
+_LO_VOLATILITY, _HI_VOLATILITY = 0.0, 1.0
+
+# The same bounds as vectors in ``METRICS`` order, built once at import for
+# the compiled kernel and the batched environment.  Read-only, as every
+# environment shares them.
+_LO = np.array([
+    _LO_REVENUE, _LO_COST, _LO_RISK, _LO_CHURN,
+    _LO_MARKETING, _LO_GROWTH, _LO_VOLATILITY,
+])
+_HI = np.array([
+    _HI_REVENUE, _HI_COST, _HI_RISK, _HI_CHURN,
+    _HI_MARKETING, _HI_GROWTH, _HI_VOLATILITY,
+])
+_LO.flags.writeable = _HI.flags.writeable = False
+
+
+@dataclass(frozen=True, slots=True)
 class EnvironmentState:
     """Immutable snapshot of the business environment at a point in time.
 
@@ -39,8 +71,63 @@ class EnvironmentState:
     round_number: int = 0
 
     def as_dict(self) -> dict[str, Any]:
-        """Return a plain-dict representation of this state."""
-        return asdict(self)
+        """Return a plain-dict representation of this state.
+
+        Spelled out field by field: the record is flat, so neither
+        ``dataclasses.asdict``'s recursive copy nor a ``getattr`` loop is
+        needed.
+        """
+        return {
+            "revenue": self.revenue,
+            "cost": self.cost,
+            "risk_score": self.risk_score,
+            "churn": self.churn,
+            "marketing_budget": self.marketing_budget,
+            "growth_rate": self.growth_rate,
+            "volatility": self.volatility,
+            "round_number": self.round_number,
+        }
+
+    def to_vector(self) -> np.ndarray:
+        """Return the metrics as a ``(len(METRICS),)`` array in ``METRICS`` order."""
+        return np.array([getattr(self, name) for name in METRICS])
+
+    @classmethod
+    def from_vector(
+        cls, vector: np.ndarray, round_number: int = 0
+    ) -> EnvironmentState:
+        """Build a state from a metric vector laid out as by :meth:`to_vector`.
+
+        Args:
+            vector:       1-D array of ``len(METRICS)`` values.
+            round_number: Round index stored on the new state.
+
+        Returns:
+            The corresponding ``EnvironmentState``.
+        """
+        return cls(*map(float, vector), round_number=round_number)
+
+
+def batch_columns(states: StateBatch) -> dict[str, np.ndarray]:
+    """Normalise a batch of states to Struct-of-Arrays form.
+
+    Args:
+        states: Either a mapping of metric name → 1-D array, or an
+                ``(N, len(METRICS))`` matrix whose rows are
+                :meth:`EnvironmentState.to_vector` layouts.
+
+    Returns:
+        Mapping of metric name → 1-D array.  Matrix input is returned as
+        column views, so no data is copied.
+    """
+    if isinstance(states, np.ndarray):
+        if states.ndim != 2 or states.shape[1] != len(METRICS):
+            raise ValueError(
+                f"expected an (N, {len(METRICS)}) state matrix, "
+                f"got shape {states.shape}"
+            )
+        return {name: states[:, i] for name, i in METRIC_INDEX.items()}
+    return states
 
 
 class BusinessEnvironment:
@@ -52,37 +139,42 @@ class BusinessEnvironment:
     Args:
         initial_state: Initial values for all environment metrics.  Defaults
                        to the project-level ``ENV_DEFAULTS``.
+        max_rounds:    Initial capacity of :attr:`history_array` in rows (the
+                       initial state plus one per round; grown on demand).
     """
 
-    # Hard bounds for each metric
-    _BOUNDS: dict[str, tuple[float, float]] = {
-        "revenue":          (1.0,    1e9),
-        "cost":             (1.0,    1e9),
-        "risk_score":       (0.0,    1.0),
-        "churn":            (0.0,    1.0),
-        "marketing_budget": (0.0,    1e8),
-        "growth_rate":      (-0.50,  2.0),
-        "volatility":       (0.0,    1.0),
-    }
-
-    def __init__(self, initial_state: dict[str, float] | None = None) -> None:
+    def __init__(
+        self,
+        initial_state: dict[str, float] | None = None,
+        max_rounds: int = MAX_ROUNDS + 1,
+    ) -> None:
         from agentsphere.config import ENV_DEFAULTS
 
         defaults = ENV_DEFAULTS.copy()
         if initial_state:
             defaults.update(initial_state)
 
-        self._initial: dict[str, float] = defaults.copy()
-        self._state: EnvironmentState = EnvironmentState(**defaults)
+        # Plain floats, so numpy scalars never reach the scalar kernels
+        self._initial: dict[str, float] = {
+            key: float(value) for key, value in defaults.items()
+        }
+        self._state: EnvironmentState = EnvironmentState(**self._initial)
         self._round: int = 0
         self._history: list[EnvironmentState] = []
+        # Metric vector of ``_state``, kept only for the compiled kernel path.
+        self._vector: np.ndarray | None = (
+            self._state.to_vector() if HAVE_NUMBA else None
+        )
+        # Row 0 is the initial state, row r the state after round r.
+        self._states: np.ndarray = np.empty((max(1, max_rounds), len(METRICS)))
+        self._states[0] = self._state.to_vector()
 
     # ── Properties ────────────────────────────────────────────────────────────
 
     @property
     def state(self) -> EnvironmentState:
-        """Current environment state (read-only snapshot)."""
-        return copy.copy(self._state)
+        """Current environment state (frozen, so returned without copying)."""
+        return self._state
 
     @property
     def round(self) -> int:
@@ -91,14 +183,29 @@ class BusinessEnvironment:
 
     @property
     def history(self) -> list[EnvironmentState]:
-        """All snapshots captured so far (one per round)."""
-        return list(self._history)
+        """All snapshots captured so far (one per round).
+
+        The list is returned without copying and must not be modified;
+        :meth:`reset` starts a new list rather than clearing this one.
+        """
+        return self._history
+
+    @property
+    def history_array(self) -> np.ndarray:
+        """``(round + 1, len(METRICS))`` metric matrix of the run so far.
+
+        Row 0 is the initial state and row *r* the state after round *r*, in
+        ``config.METRICS`` column order.  A read-only view of the
+        preallocated buffer that later rounds (and :meth:`reset`) overwrite;
+        copy it to keep it.
+        """
+        view = self._states[: self._round + 1]
+        view.flags.writeable = False
+        return view
 
     # ── Mutation ──────────────────────────────────────────────────────────────
 
-    def apply_deltas(
-        self, deltas: dict[str, float], noise: float = 0.0
-    ) -> EnvironmentState:
+    def apply_deltas(self, deltas: Deltas, noise: float = 0.0) -> EnvironmentState:
         """Apply relative deltas to the current state and advance the round.
 
         Each delta is interpreted as a *fractional change*:
@@ -107,41 +214,106 @@ class BusinessEnvironment:
         Unknown metric keys are silently ignored.
 
         Args:
-            deltas: Mapping of metric name → fractional change (e.g. 0.05 = +5 %).
+            deltas: Mapping of metric name → fractional change (e.g. 0.05 = +5 %),
+                    or a ``(len(METRICS),)`` vector of changes in
+                    ``config.METRICS`` order (e.g.
+                    :meth:`AgentProposal.delta_vector`).
             noise:  Optional random noise factor already sampled by the simulator.
 
         Returns:
             The new ``EnvironmentState`` after applying all deltas.
+
+        Raises:
+            ValueError: If a delta vector has the wrong shape.
         """
-        current = asdict(self._state)
-        new_values: dict[str, float] = {}
-
-        for key, value in current.items():
-            if key == "round_number":
-                continue
-            delta = deltas.get(key, 0.0)
-            if isinstance(value, (int, float)):
-                raw = value * (1.0 + delta + noise * (1 if delta >= 0 else -1))
-                lo, hi = self._BOUNDS.get(key, (-1e12, 1e12))
-                new_values[key] = max(lo, min(hi, raw))
-            else:
-                new_values[key] = value
+        if isinstance(deltas, np.ndarray):
+            if deltas.shape != (len(METRICS),):
+                raise ValueError(
+                    f"expected a ({len(METRICS)},) delta vector, "
+                    f"got shape {deltas.shape}"
+                )
+            if self._vector is not None:
+                return self._advance(np.asarray(deltas, dtype=np.float64), noise)
+            deltas = dict(zip(METRICS, deltas.tolist()))
+        elif self._vector is not None:
+            return self._advance(self._delta_vector(deltas), noise)
+
+        s = self._state
+        get = deltas.get
+
+        # Noise pushes each metric further in the direction of its delta.
+        d = get("revenue", 0.0)
+        raw = s.revenue * (1.0 + d + (noise if d >= 0 else -noise))
+        revenue = max(_LO_REVENUE, min(_HI_REVENUE, raw))
+        d = get("cost", 0.0)
+        raw = s.cost * (1.0 + d + (noise if d >= 0 else -noise))
+        cost = max(_LO_COST, min(_HI_COST, raw))
+        d = get("risk_score", 0.0)
+        raw = s.risk_score * (1.0 + d + (noise if d >= 0 else -noise))
+        risk_score = max(_LO_RISK, min(_HI_RISK, raw))
+        d = get("churn", 0.0)
+        raw = s.churn * (1.0 + d + (noise if d >= 0 else -noise))
+        churn = max(_LO_CHURN, min(_HI_CHURN, raw))
+        d = get("marketing_budget", 0.0)
+        raw = s.marketing_budget * (1.0 + d + (noise if d >= 0 else -noise))
+        marketing_budget = max(_LO_MARKETING, min(_HI_MARKETING, raw))
+        d = get("growth_rate", 0.0)
+        raw = s.growth_rate * (1.0 + d + (noise if d >= 0 else -noise))
+        growth_rate = max(_LO_GROWTH, min(_HI_GROWTH, raw))
+        d = get("volatility", 0.0)
+        raw = s.volatility * (1.0 + d + (noise if d >= 0 else -noise))
+        volatility = max(_LO_VOLATILITY, min(_HI_VOLATILITY, raw))
+
+        self._round += 1
+        # States are frozen, so history can share the instance.
+        self._state = EnvironmentState(
+            revenue, cost, risk_score, churn, marketing_budget, growth_rate,
+            volatility, self._round,
+        )
+        self._history.append(self._state)
+        self._row()[:] = (
+            revenue, cost, risk_score, churn, marketing_budget, growth_rate,
+            volatility,
+        )
+        return self._state
 
+    @staticmethod
+    def _delta_vector(deltas: dict[str, float]) -> np.ndarray:
+        """Lay a delta mapping out in ``METRICS`` order (unknown keys dropped)."""
+        vector = np.zeros(len(METRICS))
+        for key, value in deltas.items():
+            i = METRIC_INDEX.get(key)
+            if i is not None:
+                vector[i] = value
+        return vector
+
+    def _advance(self, delta_vector: np.ndarray, noise: float) -> EnvironmentState:
+        """``apply_deltas`` through the compiled :func:`apply_deltas_kernel`."""
+        self._vector = apply_deltas_kernel(
+            self._vector, delta_vector, noise, _LO, _HI
+        )
         self._round += 1
-        new_values["round_number"] = self._round
-        self._state = EnvironmentState(**new_values)
-        self._history.append(copy.copy(self._state))
+        self._state = EnvironmentState(*self._vector.tolist(), self._round)
+        self._history.append(self._state)
+        self._row()[:] = self._vector
         return self._state
 
+    def _row(self) -> np.ndarray:
+        """Return the :attr:`history_array` row of the current round."""
+        if self._round == len(self._states):
+            self._states = np.concatenate([self._states, self._states])
+        return self._states[self._round]
+
     def snapshot(self) -> EnvironmentState:
         """Capture the current state without advancing the round.
 
         Returns:
-            An immutable copy of the current ``EnvironmentState``.
+            The current ``EnvironmentState``, stamped with the current round.
         """
-        snapshot = copy.copy(self._state)
-        snapshot = EnvironmentState(**{**asdict(snapshot), "round_number": self._round})
-        return snapshot
+        state = self._state
+        if state.round_number == self._round:
+            return state
+        return replace(state, round_number=self._round)
 
     def reset(self, initial_state: dict[str, float] | None = None) -> None:
         """Reset the environment to its initial (or provided) state.
@@ -152,10 +324,36 @@ class BusinessEnvironment:
         """
         values = self._initial.copy()
         if initial_state:
-            values.update(initial_state)
+            values.update(
+                (key, float(value)) for key, value in initial_state.items()
+            )
         self._state = EnvironmentState(**values)
         self._round = 0
-        self._history.clear()
+        self._history = []
+        self._states[0] = self._state.to_vector()
+        if self._vector is not None:
+            self._vector = self._state.to_vector()
+
+    def restore(
+        self, history: list[EnvironmentState], states: np.ndarray
+    ) -> None:
+        """Continue from a previously recorded run.
+
+        Puts the environment in the position it was in after that run's last
+        round, so further rounds extend it.
+
+        Args:
+            history: The run's :attr:`history` (one state per round, non-empty).
+            states:  The run's :attr:`history_array` (``len(history) + 1`` rows).
+        """
+        self._history = list(history)
+        self._round = len(self._history)
+        self._state = self._history[-1]
+        if len(self._states) < len(states):
+            self._states = np.empty((2 * len(states), len(METRICS)))
+        self._states[: len(states)] = states
+        if self._vector is not None:
+            self._vector = self._state.to_vector()
 
     # ── Computed helpers ──────────────────────────────────────────────────────
 
@@ -185,3 +383,136 @@ class BusinessEnvironment:
             f"revenue={s.revenue:,.0f}, cost={s.cost:,.0f}, "
             f"risk={s.risk_score:.2f})"
         )
+
+
+class BatchedBusinessEnvironment:
+    """Many independent business environments advanced in lock-step.
+
+    Holds the state of ``n_scenarios`` environments as one
+    ``(n_scenarios, len(METRICS))`` matrix (rows laid out as by
+    :meth:`EnvironmentState.to_vector`) and applies a round of deltas to all
+    of them with a single vectorised update, using the same
+    ``value * (1 + delta ± noise)`` rule and bounds as
+    :class:`BusinessEnvironment`.  The state matrix feeds the agents'
+    ``propose_batch`` / ``ensemble_propose_batch`` directly.
+
+    Args:
+        n_scenarios:   Number of environments.
+        initial_state: Initial metric values: a mapping applied to every
+                       scenario (missing metrics default to
+                       ``ENV_DEFAULTS``), or an ``(n_scenarios,
+                       len(METRICS))`` matrix of per-scenario starts.
+        max_rounds:    Initial capacity of :attr:`history_array` in rows (the
+                       initial state plus one per round; grown on demand).
+    """
+
+    def __init__(
+        self,
+        n_scenarios: int,
+        initial_state: dict[str, float] | np.ndarray | None = None,
+        max_rounds: int = MAX_ROUNDS + 1,
+    ) -> None:
+        from agentsphere.config import ENV_DEFAULTS
+
+        shape = (n_scenarios, len(METRICS))
+        if isinstance(initial_state, np.ndarray):
+            if initial_state.shape != shape:
+                raise ValueError(
+                    f"expected an {shape} state matrix, "
+                    f"got shape {initial_state.shape}"
+                )
+            initial = np.array(initial_state, dtype=np.float64)
+        else:
+            values = {**ENV_DEFAULTS, **(initial_state or {})}
+            row = [float(values[name]) for name in METRICS]
+            initial = np.tile(row, (n_scenarios, 1))
+
+        self._initial: np.ndarray = initial
+        self._state: np.ndarray = initial.copy()
+        self._round: int = 0
+        # Row 0 is the initial state, row r the state after round r.
+        self._history: np.ndarray = np.empty((max(1, max_rounds), *shape))
+        self._history[0] = initial
+
+    # ── Properties ────────────────────────────────────────────────────────────
+
+    @property
+    def n_scenarios(self) -> int:
+        """Number of environments in the batch."""
+        return self._state.shape[0]
+
+    @property
+    def state(self) -> np.ndarray:
+        """Copy of the current ``(n_scenarios, len(METRICS))`` state matrix."""
+        return self._state.copy()
+
+    @property
+    def round(self) -> int:
+        """Current simulation round number."""
+        return self._round
+
+    @property
+    def history_array(self) -> np.ndarray:
+        """``(round + 1, n_scenarios, len(METRICS))`` states of the run so far.
+
+        Laid out as :attr:`BusinessEnvironment.history_array` with a scenario
+        axis: row 0 is the initial state and row *r* the state after round
+        *r*.  A read-only view of the buffer that later rounds (and
+        :meth:`reset`) overwrite; copy it to keep it.
+        """
+        view = self._history[: self._round + 1]
+        view.flags.writeable = False
+        return view
+
+    # ── Mutation ──────────────────────────────────────────────────────────────
+
+    def apply_deltas(
+        self, deltas: np.ndarray, noise: float | np.ndarray = 0.0
+    ) -> np.ndarray:
+        """Apply one round of relative deltas to every scenario.
+
+        Args:
+            deltas: ``(n_scenarios, len(METRICS))`` fractional changes in
+                    ``config.METRICS`` column order (e.g. a row per scenario
+                    of consensus deltas), or one ``(len(METRICS),)`` vector
+                    shared by all scenarios.
+            noise:  Noise factor per scenario (``(n_scenarios,)`` array) or
+                    one value for all; added in the direction of each delta.
+
+        Returns:
+            Copy of the new state matrix.
+
+        Raises:
+            ValueError: If *deltas* or *noise* has the wrong shape.
+        """
+        n_scenarios = len(self._state)
+        deltas = np.asarray(deltas, dtype=np.float64)
+        if deltas.shape not in ((n_scenarios, len(METRICS)), (len(METRICS),)):
+            raise ValueError(
+                f"expected an ({n_scenarios}, {len(METRICS)}) delta matrix "
+                f"or a ({len(METRICS)},) delta vector, got shape {deltas.shape}"
+            )
+        noise = np.asarray(noise, dtype=np.float64)
+        if noise.ndim:
+            if noise.shape != (n_scenarios,):
+                raise ValueError(
+                    f"expected scalar noise or an ({n_scenarios},) noise "
+                    f"vector, got shape {noise.shape}"
+                )
+            noise = noise[:, None]
+        signed = np.where(deltas >= 0, noise, -noise)
+
+        state = self._state
+        state *= 1.0 + deltas + signed
+        np.clip(state, _LO, _HI, out=state)
+
+        self._round += 1
+        if self._round == len(self._history):
+            self._history = np.concatenate([self._history, self._history])
+        self._history[self._round] = state
+        return state.copy()
+
+    def reset(self) -> None:
+        """Reset every scenario to its initial state."""
+        self._state = self._initial.copy()
+        self._round = 0
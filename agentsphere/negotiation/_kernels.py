@@ -0,0 +1,191 @@
+"""
+Numeric kernels behind ``NegotiationEngine.negotiate_fast``.
+
+Once metric names are mapped to columns a negotiation round is plain array
+arithmetic over a ``(n_agents, n_metrics)`` delta matrix, a matching key
+presence mask, per-agent confidences and base weights, and each proposal's
+name group (see :func:`name_groups`).
+:func:`negotiate_kernel` runs conflict detection, effective weights and the
+weighted averages in one call. :func:`round_kernel` also applies the
+consensus to a state vector.
+
+Each quantity is accumulated in proposal order with the same operations as
+:meth:`NegotiationEngine.negotiate`, so the results are bit-identical to it.
+As in :mod:`agentsphere.environment._kernels`, ``fastmath`` is left off
+because it would allow LLVM to reorder those sums.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from agentsphere._numba import njit
+from agentsphere.config import CONFLICT_THRESHOLD, METRICS
+from agentsphere.environment._kernels import apply_deltas_kernel
+
+
+def name_groups(names: Iterable[str]) -> np.ndarray:
+    """Return each agent's name group: the row of the first with its name.
+
+    ``NegotiationEngine.negotiate`` penalises agents by name, so every
+    proposal of a name that is in any conflict is penalised; the kernels
+    take these groups to do the same for line-ups with duplicate names.
+
+    Args:
+        names: Agent name per row.
+
+    Returns:
+        1-D int array of group indices.
+    """
+    first: dict[str, int] = {}
+    return np.array(
+        [first.setdefault(name, i) for i, name in enumerate(names)],
+        dtype=np.int64,
+    )
+
+
+@njit(nogil=True, cache=True)
+def negotiate_kernel(
+    deltas: np.ndarray,
+    present: np.ndarray,
+    confidences: np.ndarray,
+    base_weights: np.ndarray,
+    groups: np.ndarray,
+    threshold: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float, np.ndarray, np.ndarray]:
+    """Resolve one round of proposals given as a delta matrix.
+
+    Args:
+        deltas:       ``(n_agents, n_metrics)`` proposed deltas (zero where
+                      a key is absent).
+        present:      Boolean mask of the keys each proposal carries.
+        confidences:  Confidence of each proposal.
+        base_weights: Base negotiation weight of each proposal's agent.
+        groups:       Name group of each proposal (:func:`name_groups`); a
+                      conflict penalises every proposal of both groups.
+        threshold:    Severity at or above which a pair conflicts.
+
+    Returns:
+        ``(final_deltas, has_delta, agent_votes, confidence_index, severity,
+        conflict)``: the weighted-average delta per metric and a mask of the
+        metrics that received one, each proposal's vote share, the consensus
+        confidence, and ``(n_agents, n_agents)`` upper-triangular pair
+        severities and conflict flags.
+    """
+    n_agents, n_metrics = deltas.shape
+
+    # Pairwise conflict scan: share of jointly-held keys with opposite signs.
+    severity = np.zeros((n_agents, n_agents))
+    conflict = np.zeros((n_agents, n_agents), dtype=np.bool_)
+    in_conflict = np.zeros(n_agents, dtype=np.bool_)
+    for i in range(n_agents):
+        for j in range(i + 1, n_agents):
+            shared = 0
+            opposed = 0
+            for m in range(n_metrics):
+                if present[i, m] and present[j, m]:
+                    shared += 1
+                    a = deltas[i, m]
+                    b = deltas[j, m]
+                    if (a > 0 and b < 0) or (a < 0 and b > 0):
+                        opposed += 1
+            if shared:
+                s = opposed / shared
+                severity[i, j] = s
+                if s >= threshold:
+                    conflict[i, j] = True
+                    in_conflict[groups[i]] = in_conflict[groups[j]] = True
+
+    # Effective weight = base_weight × confidence × conflict_penalty
+    weights = np.empty(n_agents)
+    total_weight = 0.0
+    weighted_confidence = 0.0
+    for i in range(n_agents):
+        penalty = 0.80 if in_conflict[groups[i]] else 1.0
+        w = base_weights[i] * confidences[i] * penalty
+        weights[i] = w
+        total_weight += w
+        weighted_confidence += w * confidences[i]
+
+    weighted_sum = np.zeros(n_metrics)
+    key_weight_sum = np.zeros(n_metrics)
+    for i in range(n_agents):
+        w = weights[i]
+        for m in range(n_metrics):
+            if present[i, m]:
+                weighted_sum[m] += deltas[i, m] * w
+                key_weight_sum[m] += w
+
+    if total_weight == 0:
+        total_weight = 1.0
+
+    final_deltas = np.zeros(n_metrics)
+    has_delta = np.zeros(n_metrics, dtype=np.bool_)
+    for m in range(n_metrics):
+        if key_weight_sum[m] > 0:
+            final_deltas[m] = weighted_sum[m] / key_weight_sum[m]
+            has_delta[m] = True
+
+    return (
+        final_deltas,
+        has_delta,
+        weights / total_weight,
+        weighted_confidence / total_weight,
+        severity,
+        conflict,
+    )
+
+
+@njit(nogil=True, cache=True)
+def round_kernel(
+    state: np.ndarray,
+    deltas: np.ndarray,
+    present: np.ndarray,
+    confidences: np.ndarray,
+    base_weights: np.ndarray,
+    groups: np.ndarray,
+    threshold: float,
+    noise: float,
+    lo: np.ndarray,
+    hi: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Negotiate one round and apply the consensus to *state*.
+
+    Delta columns are in ``config.METRICS`` order; see
+    :func:`negotiate_kernel` and
+    :func:`agentsphere.environment._kernels.apply_deltas_kernel` for the
+    arguments.
+
+    Returns:
+        ``(new_state, final_deltas, agent_votes, confidence_index)``.
+    """
+    final_deltas, _, votes, confidence_index, _, _ = negotiate_kernel(
+        deltas, present, confidences, base_weights, groups, threshold
+    )
+    new_state = apply_deltas_kernel(state, final_deltas, noise, lo, hi)
+    return new_state, final_deltas, votes, confidence_index
+
+
+def warmup() -> None:
+    """Trigger compilation (or on-disk cache load) of the kernels.
+
+    Called by :func:`agentsphere.warmup`.  Bounds are passed read-only, as
+    the environment's shared vectors are.
+    """
+    n_metrics = len(METRICS)
+    lo, hi = np.zeros(n_metrics), np.ones(n_metrics)
+    lo.flags.writeable = hi.flags.writeable = False
+    deltas = np.zeros((4, n_metrics))
+    present = np.ones((4, n_metrics), dtype=np.bool_)
+    confidences = np.ones(4)
+    weights = np.ones(4)
+    groups = np.arange(4)
+    negotiate_kernel(
+        deltas, present, confidences, weights, groups, CONFLICT_THRESHOLD
+    )
+    round_kernel(
+        np.ones(n_metrics), deltas, present, confidences, weights, groups,
+        CONFLICT_THRESHOLD, 0.0, lo, hi,
+    )
@@ -13,13 +13,22 @@ Algorithm:
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Iterable
 
+import numpy as np
+
+from agentsphere._numba import HAVE_NUMBA
 from agentsphere.agents.base_agent import AgentProposal
-from agentsphere.config import CONFLICT_THRESHOLD
+from agentsphere.config import CONFLICT_THRESHOLD, MATRIX_CONFLICT_THRESHOLD
+from agentsphere.negotiation._kernels import name_groups, negotiate_kernel
+
+_confidence = attrgetter("confidence")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConflictReport:
     """Details of a detected negotiation conflict.
 
@@ -36,7 +45,7 @@ class ConflictReport:
     severity: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsensusResult:
     """Output of one negotiation round.
 
@@ -45,15 +54,50 @@ class ConsensusResult:
         conflicts:        List of detected conflicts between agent pairs.
         confidence_index: Overall confidence of the consensus (0–1).
         agent_votes:      Per-agent effective weight × confidence contributions.
-        summary:          Human-readable summary of the consensus decision.
+        proposals:        The proposals the consensus was reached from.
+        top_proposal:     Highest-confidence proposal (first on ties), or
+                          ``None`` when there were no proposals.
+        summary:          Human-readable summary of the consensus decision
+                          (property; see below).
     """
 
     final_deltas: dict[str, float]
     conflicts: list[ConflictReport]
     confidence_index: float
     agent_votes: dict[str, float]
-    summary: str
     proposals: list[AgentProposal] = field(default_factory=list)
+    top_proposal: AgentProposal | None = None
+    # Either the finished text, or the ``_build_summary`` arguments to
+    # render it from on first access.
+    _summary: str | None = field(default=None, repr=False, compare=False)
+    _summary_args: tuple[Any, ...] = field(default=(), repr=False, compare=False)
+
+    @property
+    def summary(self) -> str:
+        """Human-readable summary of the consensus decision.
+
+        Only the UI reads it, so the text is built on first access and
+        cached rather than formatted every round.
+        """
+        if self._summary is None:
+            self._summary = NegotiationEngine._build_summary(*self._summary_args)
+        return self._summary
+
+    def copy(self) -> ConsensusResult:
+        """Return a copy with its own deltas, votes, conflict and proposal lists.
+
+        The conflict reports and proposals themselves are frozen and shared.
+        """
+        return ConsensusResult(
+            final_deltas=dict(self.final_deltas),
+            conflicts=list(self.conflicts),
+            confidence_index=self.confidence_index,
+            agent_votes=dict(self.agent_votes),
+            proposals=list(self.proposals),
+            top_proposal=self.top_proposal,
+            _summary=self._summary,
+            _summary_args=self._summary_args,
+        )
 
 
 class NegotiationEngine:
@@ -65,6 +109,42 @@ class NegotiationEngine:
 
     def __init__(self, agent_weights: dict[str, float]) -> None:
         self.agent_weights = agent_weights
+        # Positional weight table indexed by ``AgentProposal.agent_id``; an id
+        # is only trusted when ``_names`` has the proposal's name at it.
+        self._agent_ids: dict[str, int] = {
+            name: i for i, name in enumerate(agent_weights)
+        }
+        self._names: tuple[str, ...] = tuple(agent_weights)
+        self._weights: tuple[float, ...] = tuple(agent_weights.values())
+
+    def agent_index(self, name: str) -> int:
+        """Return the weight-table index for agent *name* (-1 if unknown)."""
+        return self._agent_ids.get(name, -1)
+
+    def base_weight(self, name: str, agent_id: int = -1) -> float:
+        """Return the base negotiation weight for a proposal's agent.
+
+        Looked up by *agent_id* when it is this engine's index for *name*,
+        else by *name* (1.0 if unknown), so ids assigned by another engine
+        never pick up the wrong weight.
+        """
+        if 0 <= agent_id < len(self._names) and self._names[agent_id] == name:
+            return self._weights[agent_id]
+        return self.agent_weights.get(name, 1.0)
+
+    def base_weight_vector(self, agents: Iterable[tuple[str, int]]) -> np.ndarray:
+        """Return :meth:`base_weight` of each ``(name, agent_id)`` as an array.
+
+        Args:
+            agents: ``(name, agent_id)`` pair per agent, in row order.
+
+        Returns:
+            1-D float array of base weights.
+        """
+        return np.fromiter(
+            (self.base_weight(name, agent_id) for name, agent_id in agents),
+            np.float64,
+        )
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -77,6 +157,14 @@ class NegotiationEngine:
         3. Compute weighted-average deltas.
         4. Build and return the ``ConsensusResult``.
 
+        Every proposal is weighted on its own, including proposals that share
+        an agent name (a conflict still penalises every proposal of the
+        names involved).  For such line-ups the total weight is the sum over
+        all proposals, so ``final_deltas`` and ``confidence_index`` are true
+        weighted means over the proposals, and ``agent_votes`` holds one
+        entry per name, set by that name's last proposal; the votes then sum
+        to less than 1.  Line-ups with unique names are unaffected.
+
         Args:
             proposals: One ``AgentProposal`` per active agent.
 
@@ -89,7 +177,7 @@ class NegotiationEngine:
                 conflicts=[],
                 confidence_index=0.0,
                 agent_votes={},
-                summary="No proposals received.",
+                _summary="No proposals received.",
             )
 
         conflicts = self._detect_conflicts(proposals)
@@ -98,59 +186,140 @@ class NegotiationEngine:
             conflict_agents.add(c.agent_a)
             conflict_agents.add(c.agent_b)
 
-        # Effective weight = base_weight × confidence × conflict_penalty
+        # Single pass: effective weight = base_weight × confidence ×
+        # conflict_penalty, accumulated into the per-metric weighted sums and
+        # the confidence total as it goes.  Kept generic over the line-up: a
+        # source-generated copy specialised to the default four agents
+        # measured within noise of this loop, since agent ids already make
+        # the base-weight lookup a tuple index.
         effective_weights: dict[str, float] = {}
+        weighted_sum: defaultdict[str, float] = defaultdict(float)
+        key_weight_sum: defaultdict[str, float] = defaultdict(float)
+        total_weight = 0.0
+        weighted_confidence = 0.0
+        names, weights = self._names, self._weights
+        n_weights = len(weights)
         for proposal in proposals:
-            base = self.agent_weights.get(proposal.agent_name, 1.0)
-            penalty = 0.80 if proposal.agent_name in conflict_agents else 1.0
-            effective_weights[proposal.agent_name] = (
-                base * proposal.confidence * penalty
+            name = proposal.agent_name
+            agent_id = proposal.agent_id
+            base = (
+                weights[agent_id]
+                if 0 <= agent_id < n_weights and names[agent_id] == name
+                else self.agent_weights.get(name, 1.0)
             )
+            penalty = 0.80 if name in conflict_agents else 1.0
+            w = base * proposal.confidence * penalty
+            effective_weights[name] = w
+            total_weight += w
+            weighted_confidence += w * proposal.confidence
+            for key, delta in proposal.deltas.items():
+                weighted_sum[key] += delta * w
+                key_weight_sum[key] += w
 
-        total_weight = sum(effective_weights.values())
         if total_weight == 0:
             total_weight = 1.0
 
         # Weighted-average deltas
-        final_deltas: dict[str, float] = {}
-        all_keys: set[str] = set()
-        for p in proposals:
-            all_keys.update(p.deltas.keys())
-
-        for key in all_keys:
-            weighted_sum = 0.0
-            key_weight_sum = 0.0
-            for proposal in proposals:
-                if key in proposal.deltas:
-                    w = effective_weights[proposal.agent_name]
-                    weighted_sum += proposal.deltas[key] * w
-                    key_weight_sum += w
-            if key_weight_sum > 0:
-                final_deltas[key] = weighted_sum / key_weight_sum
+        final_deltas: dict[str, float] = {
+            key: weighted_sum[key] / kw
+            for key, kw in key_weight_sum.items()
+            if kw > 0
+        }
 
         # Confidence index: weighted mean of individual confidences
-        confidence_index = (
-            sum(
-                effective_weights[p.agent_name] * p.confidence
-                for p in proposals
+        confidence_index = weighted_confidence / total_weight
+
+        agent_votes = {
+            name: w / total_weight for name, w in effective_weights.items()
+        }
+
+        top = max(proposals, key=_confidence)
+
+        return ConsensusResult(
+            final_deltas=final_deltas,
+            conflicts=conflicts,
+            confidence_index=confidence_index,
+            agent_votes=agent_votes,
+            proposals=proposals,
+            top_proposal=top,
+            _summary_args=(proposals, conflicts, confidence_index, top),
+        )
+
+    def negotiate_fast(self, proposals: list[AgentProposal]) -> ConsensusResult:
+        """:meth:`negotiate` with the numeric work done by a compiled kernel.
+
+        The proposals are packed into a delta matrix (metric columns in
+        first-seen order) and resolved by
+        :func:`agentsphere.negotiation._kernels.negotiate_kernel`; only the
+        ``ConsensusResult`` objects are built in Python.  Results are
+        identical to :meth:`negotiate`, which this falls back to when Numba
+        is not installed.
+
+        Args:
+            proposals: One ``AgentProposal`` per active agent.
+
+        Returns:
+            A ``ConsensusResult`` encapsulating the consensus decision.
+        """
+        if not proposals or not HAVE_NUMBA:
+            return self.negotiate(proposals)
+
+        metrics = list(dict.fromkeys(k for p in proposals for k in p.deltas))
+        deltas = np.array(
+            [[p.deltas.get(k, 0.0) for k in metrics] for p in proposals]
+        )
+        present = np.array([[k in p.deltas for k in metrics] for p in proposals])
+        confidences = np.array([p.confidence for p in proposals])
+        base_weights = self.base_weight_vector(
+            (p.agent_name, p.agent_id) for p in proposals
+        )
+        groups = name_groups(p.agent_name for p in proposals)
+
+        final, has_delta, votes, confidence_index, severity, flagged = (
+            negotiate_kernel(
+                deltas, present, confidences, base_weights, groups,
+                CONFLICT_THRESHOLD,
             )
-            / total_weight
         )
 
+        conflicts: list[ConflictReport] = []
+        rows, cols = np.nonzero(flagged)
+        for i, j, sev in zip(
+            rows.tolist(), cols.tolist(), severity[rows, cols].tolist()
+        ):
+            a, b = proposals[i].deltas, proposals[j].deltas
+            conflicts.append(
+                ConflictReport(
+                    agent_a=proposals[i].agent_name,
+                    agent_b=proposals[j].agent_name,
+                    conflicting_keys=[
+                        k for k in metrics
+                        if k in a and k in b
+                        and (a[k] > 0 > b[k] or a[k] < 0 < b[k])
+                    ],
+                    severity=sev,
+                )
+            )
+
+        final_deltas = {
+            key: value
+            for key, value, hit in zip(metrics, final.tolist(), has_delta.tolist())
+            if hit
+        }
+        # As in negotiate(), a name's last proposal sets its vote
         agent_votes = {
-            p.agent_name: round(effective_weights[p.agent_name] / total_weight, 4)
-            for p in proposals
+            p.agent_name: vote for p, vote in zip(proposals, votes.tolist())
         }
-
-        summary = self._build_summary(proposals, conflicts, confidence_index)
+        top = max(proposals, key=_confidence)
 
         return ConsensusResult(
             final_deltas=final_deltas,
             conflicts=conflicts,
-            confidence_index=round(confidence_index, 4),
+            confidence_index=confidence_index,
             agent_votes=agent_votes,
-            summary=summary,
             proposals=proposals,
+            top_proposal=top,
+            _summary_args=(proposals, conflicts, confidence_index, top),
         )
 
     # ── Internals ─────────────────────────────────────────────────────────────
@@ -161,7 +330,9 @@ class NegotiationEngine:
 
         Two proposals conflict when their recommended delta directions (positive
         vs negative) differ on at least ``CONFLICT_THRESHOLD`` fraction of their
-        shared metric keys.
+        shared metric keys.  Pairs are scored from per-proposal presence /
+        sign bitmasks; rounds of ``MATRIX_CONFLICT_THRESHOLD`` or more
+        proposals are scored by :meth:`_matrix_conflicts` instead.
 
         Args:
             proposals: All agent proposals for this round.
@@ -169,36 +340,112 @@ class NegotiationEngine:
         Returns:
             List of ``ConflictReport`` objects (may be empty).
         """
+        if len(proposals) >= MATRIX_CONFLICT_THRESHOLD:
+            return NegotiationEngine._matrix_conflicts(proposals)
+
+        # Bit i of a proposal's masks ↔ metric ``metrics[i]``: key present,
+        # delta > 0, delta < 0.  Pair scores are then a few bitwise ops.
+        metrics: list[str] = []
+        column: dict[str, int] = {}
+        masks: list[tuple[int, int, int]] = []
+        for p in proposals:
+            present = positive = negative = 0
+            for key, delta in p.deltas.items():
+                bit = column.get(key)
+                if bit is None:
+                    bit = column[key] = 1 << len(metrics)
+                    metrics.append(key)
+                present |= bit
+                if delta > 0:
+                    positive |= bit
+                elif delta < 0:
+                    negative |= bit
+            masks.append((present, positive, negative))
+
         conflicts: list[ConflictReport] = []
         n = len(proposals)
         for i in range(n):
+            present_a, pos_a, neg_a = masks[i]
             for j in range(i + 1, n):
-                a, b = proposals[i], proposals[j]
-                shared = set(a.deltas.keys()) & set(b.deltas.keys())
+                present_b, pos_b, neg_b = masks[j]
+                shared = (present_a & present_b).bit_count()
                 if not shared:
                     continue
-                conflicting = [
-                    k
-                    for k in shared
-                    if a.deltas[k] * b.deltas[k] < 0  # opposite signs
-                ]
-                severity = len(conflicting) / len(shared)
+                opposed = (pos_a & neg_b) | (neg_a & pos_b)
+                severity = opposed.bit_count() / shared
                 if severity >= CONFLICT_THRESHOLD:
                     conflicts.append(
                         ConflictReport(
-                            agent_a=a.agent_name,
-                            agent_b=b.agent_name,
-                            conflicting_keys=conflicting,
-                            severity=round(severity, 4),
+                            agent_a=proposals[i].agent_name,
+                            agent_b=proposals[j].agent_name,
+                            conflicting_keys=[
+                                k for m, k in enumerate(metrics) if opposed >> m & 1
+                            ],
+                            severity=severity,
                         )
                     )
         return conflicts
 
+    @staticmethod
+    def _matrix_conflicts(proposals: list[AgentProposal]) -> list[ConflictReport]:
+        """Vectorised :meth:`_detect_conflicts` for large proposal sets.
+
+        All pairs are scored at once from matrix products over the proposals'
+        delta signs and key presence; key lists are only built for the
+        flagged pairs, in first-seen metric order.
+
+        Args:
+            proposals: All agent proposals for this round.
+
+        Returns:
+            Conflicts in the same pair order as the pairwise scan.
+        """
+        # Proposal × metric matrices: delta values and key presence.
+        metrics = list(dict.fromkeys(k for p in proposals for k in p.deltas))
+        values = np.array(
+            [[p.deltas.get(k, 0.0) for k in metrics] for p in proposals]
+        )
+        present = np.array(
+            [[k in p.deltas for k in metrics] for p in proposals], dtype=np.float64
+        )
+
+        # Pairwise counts of shared and opposite-sign metrics (symmetric)
+        positive = (values > 0).astype(np.float64)
+        negative = (values < 0).astype(np.float64)
+        n_shared = present @ present.T
+        n_opposed = positive @ negative.T
+        n_opposed += n_opposed.T
+        severity = np.divide(
+            n_opposed, n_shared, out=np.zeros_like(n_shared), where=n_shared > 0
+        )
+        flagged = np.triu((severity >= CONFLICT_THRESHOLD) & (n_shared > 0), k=1)
+        rows, cols = np.nonzero(flagged)
+        if not rows.size:
+            return []
+
+        # Opposed-metric masks for the flagged pairs only
+        opposed = (
+            positive[rows] * negative[cols] + negative[rows] * positive[cols]
+        ) > 0
+        return [
+            ConflictReport(
+                agent_a=proposals[i].agent_name,
+                agent_b=proposals[j].agent_name,
+                conflicting_keys=[k for k, hit in zip(metrics, mask) if hit],
+                severity=sev,
+            )
+            for i, j, mask, sev in zip(
+                rows.tolist(), cols.tolist(), opposed.tolist(),
+                severity[rows, cols].tolist(),
+            )
+        ]
+
     @staticmethod
     def _build_summary(
         proposals: list[AgentProposal],
         conflicts: list[ConflictReport],
         confidence_index: float,
+        top: AgentProposal | None = None,
     ) -> str:
         """Build a human-readable summary of the negotiation round.
 
@@ -206,6 +453,8 @@ class NegotiationEngine:
             proposals:        All agent proposals.
             conflicts:        Detected conflicts.
             confidence_index: Final consensus confidence.
+            top:              Highest-confidence proposal, if the caller has
+                              already picked it.
 
         Returns:
             Multi-line summary string.
@@ -223,7 +472,8 @@ class NegotiationEngine:
                     f"(severity {c.severity:.0%})."
                 )
         # Highlight the highest-confidence proposal
-        top = max(proposals, key=lambda p: p.confidence)
+        if top is None:
+            top = max(proposals, key=_confidence)
         lines.append(
             f"Highest-confidence agent: {top.agent_name} "
             f"({top.confidence:.1%}) – {top.action}."
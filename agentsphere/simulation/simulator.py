@@ -6,15 +6,22 @@ Each round:
 2. Each agent produces an ``AgentProposal``.
 3. The ``NegotiationEngine`` reaches consensus on a merged delta set.
 4. Optional stochastic noise (driven by the environment's *volatility*) is added.
+   The run's standard-normal draws are sampled up front in one
+   ``np.random.Generator`` call, seeded afresh from the simulator's seed.
 5. The ``BusinessEnvironment`` applies the final deltas and advances one round.
 6. The round result is stored in history.
 """
 
 from __future__ import annotations
 
-import random
-from dataclasses import dataclass, field
-from typing import Any
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Any, Callable
+
+import numpy as np
 
 from agentsphere.agents import (
     BaseAgent,
@@ -22,32 +29,87 @@ from agentsphere.agents import (
     GrowthAgent,
     RevenueAgent,
     RiskAgent,
+    ensemble_propose,
 )
 from agentsphere.agents.base_agent import AgentProposal
-from agentsphere.config import AGENT_WEIGHTS, DEFAULT_ROUNDS, RANDOM_SEED
-from agentsphere.environment.business_env import BusinessEnvironment, EnvironmentState
+from agentsphere._numba import HAVE_NUMBA, warmup
+from agentsphere.config import (
+    AGENT_POOL_WORKERS,
+    AGENT_WEIGHTS,
+    CONFLICT_THRESHOLD,
+    DEFAULT_ROUNDS,
+    METRIC_INDEX,
+    METRICS,
+    PARALLEL_AGENT_THRESHOLD,
+    RANDOM_SEED,
+)
+from agentsphere.environment.business_env import (
+    _HI,
+    _LO,
+    BusinessEnvironment,
+    EnvironmentState,
+)
+from agentsphere.negotiation._kernels import name_groups, round_kernel
 from agentsphere.negotiation.engine import ConsensusResult, NegotiationEngine
 
+_VOLATILITY = METRIC_INDEX["volatility"]
 
-@dataclass
+# Shared by all simulators; created on first use by a large custom line-up.
+_POOL: ThreadPoolExecutor | None = None
+
+
+def _agent_pool() -> ThreadPoolExecutor:
+    """Return the module-level thread pool used to gather proposals."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(
+            max_workers=AGENT_POOL_WORKERS, thread_name_prefix="agentsphere"
+        )
+    return _POOL
+
+
+@dataclass(slots=True)
 class RoundResult:
     """Outcome of a single simulation round.
 
+    The environment snapshots are not stored per round: they are rows of the
+    run's state matrix (``SimulationResult.states``), and
+    :attr:`state_before` / :attr:`state_after` build the
+    ``EnvironmentState`` on access.  :attr:`noise` is likewise read from the
+    run's noise vector, rounded for the whole run at once.
+
     Attributes:
         round_number:  1-based round index.
         proposals:     One ``AgentProposal`` per agent.
         consensus:     The ``ConsensusResult`` from the negotiation engine.
-        state_before:  Environment snapshot before applying deltas.
-        state_after:   Environment snapshot after applying deltas.
-        noise:         Stochastic noise factor applied this round.
+        history:       The run's ``(n_rounds + 1, len(METRICS))`` state
+                       matrix; row ``k`` is the state after round ``k``.
+        noise_history: The run's ``(n_rounds,)`` noise factors (6 d.p.);
+                       entry ``k - 1`` belongs to round ``k``.
     """
 
     round_number: int
     proposals: list[AgentProposal]
     consensus: ConsensusResult
-    state_before: EnvironmentState
-    state_after: EnvironmentState
-    noise: float
+    history: np.ndarray = field(repr=False, compare=False)
+    noise_history: np.ndarray = field(repr=False, compare=False)
+
+    @property
+    def noise(self) -> float:
+        """Stochastic noise factor applied this round (rounded to 6 d.p.)."""
+        return float(self.noise_history[self.round_number - 1])
+
+    @property
+    def state_before(self) -> EnvironmentState:
+        """Environment snapshot before applying deltas."""
+        n = self.round_number - 1
+        return EnvironmentState.from_vector(self.history[n], n)
+
+    @property
+    def state_after(self) -> EnvironmentState:
+        """Environment snapshot after applying deltas."""
+        n = self.round_number
+        return EnvironmentState.from_vector(self.history[n], n)
 
 
 @dataclass
@@ -60,6 +122,12 @@ class SimulationResult:
         final_state:    Environment snapshot after the last round.
         scenario_name:  Optional label for the scenario.
         metadata:       Arbitrary extra data stored by the caller.
+        states:         Optional ``(n_rounds + 1, len(METRICS))`` matrix of the
+                        initial state and each round's ``state_after`` (see
+                        ``BusinessEnvironment.history_array``).
+
+    A result is not modified once the simulator returns it, so the derived
+    totals below are computed on first access and cached on the instance.
     """
 
     rounds: list[RoundResult]
@@ -67,51 +135,124 @@ class SimulationResult:
     final_state: EnvironmentState
     scenario_name: str = "Default Scenario"
     metadata: dict[str, Any] = field(default_factory=dict)
+    states: np.ndarray | None = field(default=None, repr=False, compare=False)
 
-    @property
+    @cached_property
     def n_rounds(self) -> int:
         """Number of rounds executed."""
         return len(self.rounds)
 
-    @property
+    @cached_property
     def revenue_delta(self) -> float:
         """Absolute revenue change over the full simulation."""
         return self.final_state.revenue - self.initial_state.revenue
 
-    @property
+    @cached_property
     def revenue_growth_pct(self) -> float:
         """Percentage revenue change over the full simulation."""
         if self.initial_state.revenue == 0:
             return 0.0
         return self.revenue_delta / self.initial_state.revenue
 
-    @property
+    @cached_property
     def risk_delta(self) -> float:
         """Change in risk_score over the full simulation (negative is good)."""
         return self.final_state.risk_score - self.initial_state.risk_score
 
 
+@dataclass(slots=True)
+class _Checkpoint:
+    """A finished run that longer runs from the same start can extend.
+
+    Attributes:
+        stochastic:    Whether the run sampled noise.
+        initial_state: Environment snapshot before the first round.
+        rounds:        The run's rounds.
+        states:        Its ``(len(rounds) + 1, len(METRICS))`` state matrix.
+    """
+
+    stochastic: bool
+    initial_state: EnvironmentState
+    rounds: list[RoundResult]
+    states: np.ndarray
+
+
 class Simulator:
     """Runs multi-round agent simulations against a ``BusinessEnvironment``.
 
     Args:
         initial_state: Optional dict of initial environment values to override
                        project defaults.
-        seed:          Random seed for reproducible stochastic noise.
+        seed:          Seed of the noise generator; every run starts from it,
+                       so repeat runs with the same arguments are identical.
         agents:        Optional custom agent list. Defaults to the four standard
-                       agents with weights from ``config.AGENT_WEIGHTS``.
+                       agents with weights from ``config.AGENT_WEIGHTS``, which
+                       are evaluated in one fused pass (``ensemble_propose``).
+                       Custom line-ups of ``config.PARALLEL_AGENT_THRESHOLD``
+                       or more agents act concurrently on a shared thread
+                       pool; line-ups with a ``BaseAgent.BLOCKING`` agent get
+                       a pool of their own with one thread per agent, so
+                       their I/O waits overlap.  Either way their ``act``
+                       must not share mutable state.
+        record_history: Whether agents keep their per-round proposal history.
+                       Applied to every agent when given; ``None`` (the
+                       default) leaves custom agents' own setting alone.
+                       Round results still carry the proposals; disable for
+                       large sweeps.
+
+    With the default line-up, :meth:`run` memoises its results (up to
+    ``RESULT_CACHE_SIZE``, LRU eviction): every run returns a copy of the
+    cached ``SimulationResult`` (relabelled if only *scenario_name* differs),
+    so callers cannot alter the cache.  The latest run is also kept as a
+    checkpoint, so a run with a different round count reuses its rounds and
+    only simulates the ones past its end (the noise draws of a shorter run
+    are a prefix of a longer one's).  The first simulator constructed
+    compiles the Numba kernels (see :func:`agentsphere.warmup`).
     """
 
+    RESULT_CACHE_SIZE: int = 32  # Max memoised SimulationResults (LRU eviction)
+
     def __init__(
         self,
         initial_state: dict[str, float] | None = None,
         seed: int = RANDOM_SEED,
         agents: list[BaseAgent] | None = None,
+        record_history: bool | None = None,
     ) -> None:
+        warmup()
         self._env = BusinessEnvironment(initial_state)
-        self._rng = random.Random(seed)
+        self._seed = seed
         self._agents: list[BaseAgent] = agents or self._default_agents()
         self._engine = NegotiationEngine(AGENT_WEIGHTS)
+        if record_history is not None:
+            for agent in self._agents:
+                agent.record_history = record_history
+        if not agents:
+            # Caller-owned agents keep their ids; the engine checks them
+            for agent in self._agents:
+                agent.agent_id = self._engine.agent_index(agent.name)
+        # Base negotiation weight per agent, in line-up order
+        self._base_weights = self._engine.base_weight_vector(
+            (agent.name, agent.agent_id) for agent in self._agents
+        )
+        self._groups = name_groups(agent.name for agent in self._agents)
+        # Line-ups with I/O-bound agents get one thread per agent
+        self._pool: ThreadPoolExecutor | None = None
+        if any(agent.BLOCKING for agent in self._agents):
+            self._pool = ThreadPoolExecutor(
+                max_workers=len(self._agents), thread_name_prefix="agentsphere-io"
+            )
+            weakref.finalize(self, self._pool.shutdown, wait=False)
+        # Default line-up → fused ensemble pass; custom agents → per-agent act()
+        self._ensemble: tuple[BaseAgent, ...] | None = (
+            None if agents else tuple(self._agents)
+        )
+        # (n_rounds, stochastic) → result
+        self._results: OrderedDict[tuple[int, bool], SimulationResult] = (
+            OrderedDict()
+        )
+        # Latest run of the default line-up, for resuming longer runs
+        self._checkpoint: _Checkpoint | None = None
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -132,54 +273,243 @@ class Simulator:
         Returns:
             A :class:`SimulationResult` containing round-by-round data.
         """
-        # Reset state
-        self._env.reset()
-        for agent in self._agents:
-            agent.reset()
+        # Only the default line-up is memoised: its agents are private, so
+        # skipping a replay leaves no caller-visible agent history behind.
+        key: tuple[int, bool] | None = None
+        if self._ensemble is not None:
+            key = (n_rounds, stochastic)
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                return self._detached(result, scenario_name)
+
+        # Rounds already simulated by the checkpointed run
+        checkpoint = self._checkpoint
+        done: list[RoundResult] = []
+        if (
+            key is not None
+            and checkpoint is not None
+            and checkpoint.stochastic == stochastic
+        ):
+            done = checkpoint.rounds[:n_rounds]
+
+        if done and len(done) == n_rounds:
+            result = SimulationResult(
+                rounds=done,
+                initial_state=checkpoint.initial_state,
+                final_state=done[-1].state_after,
+                scenario_name=scenario_name,
+                states=checkpoint.states[: n_rounds + 1].copy(),
+            )
+        else:
+            # Fresh run, or resume after the checkpoint's last round
+            self._reset(n_rounds - len(done))
+            if done:
+                self._env.restore(
+                    [r.state_after for r in done], checkpoint.states
+                )
+                initial_state = checkpoint.initial_state
+            else:
+                initial_state = self._env.snapshot()
+            propose, records = self._proposers()
+            # The new rounds' state matrix and noise vector, filled once
+            # they have all run
+            states = np.empty((n_rounds + 1, len(METRICS)))
+            noise = np.empty(n_rounds)
+            draws = self._draws(n_rounds, stochastic)
+
+            snapshot, apply_deltas = self._env.snapshot, self._env.apply_deltas
+            negotiate = self._engine.negotiate
+            rounds = done + [None] * (n_rounds - len(done))
+
+            # A plain loop: unrolling the rounds into generated code measured
+            # within noise of it, as the per-round work dominates.
+            for r in range(len(done), n_rounds):
+                state_before = snapshot()
+                proposals = propose(state_before)
+                for record, proposal in zip(records, proposals):
+                    record(proposal, state_before)
+                consensus = negotiate(proposals)
+
+                # Noise proportional to the current volatility, if stochastic
+                apply_deltas(
+                    consensus.final_deltas,
+                    draws[r] * (state_before.volatility * 0.1),
+                )
+                rounds[r] = RoundResult(r + 1, proposals, consensus, states, noise)
+            states[:] = self._env.history_array
+            # Each round's noise factor, as the loop computed it
+            np.round(
+                np.multiply(draws, states[:-1, _VOLATILITY] * 0.1), 6, out=noise
+            )
+            result = SimulationResult(
+                rounds=rounds,
+                initial_state=initial_state,
+                final_state=self._env.snapshot(),
+                scenario_name=scenario_name,
+                states=states,
+            )
 
-        initial_state = self._env.snapshot()
-        rounds: list[RoundResult] = []
+        if key is not None:
+            if len(result.rounds) > len(done):
+                self._checkpoint = _Checkpoint(
+                    stochastic, result.initial_state, result.rounds, result.states
+                )
+            # The cached matrix backs the rounds' state views; keep it fixed
+            result.states.flags.writeable = False
+            self._results[key] = result
+            if len(self._results) > self.RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+            return self._detached(result, scenario_name)
+        return result
+
+    def run_states(
+        self, n_rounds: int = DEFAULT_ROUNDS, stochastic: bool = True
+    ) -> np.ndarray:
+        """Run the simulation on state vectors only and return the trajectory.
+
+        Struct-of-Arrays counterpart of :meth:`run` for sweeps that only need
+        the states: each round the agents' deltas and key-presence flags are
+        written into preallocated ``(n_agents, len(METRICS))`` matrices and
+        one :func:`agentsphere.negotiation._kernels.round_kernel` call
+        negotiates them and applies the consensus to the state vector.  No
+        ``RoundResult`` or ``ConsensusResult`` objects are built, and the
+        environment is only reset, not advanced.  The states equal those of
+        :meth:`run` for the same seed and any line-up, duplicate agent names
+        included, provided proposals only use ``config.METRICS`` keys (others
+        are not scored).  Without Numba the rounds go through
+        :meth:`NegotiationEngine.negotiate` and the environment instead.
 
-        for round_idx in range(1, n_rounds + 1):
-            state_before = self._env.snapshot()
+        Args:
+            n_rounds:   Number of simulation rounds to run.
+            stochastic: If ``True``, environmental noise is sampled each
+                        round using the current *volatility* value.
+
+        Returns:
+            ``(n_rounds + 1, len(METRICS))`` matrix of the initial state and
+            the state after each round.
+        """
+        self._reset(n_rounds)
+        propose, records = self._proposers()
+        draws = self._draws(n_rounds, stochastic)
+        engine = self._engine
+
+        if not HAVE_NUMBA:
+            snapshot, apply_deltas = self._env.snapshot, self._env.apply_deltas
+            for draw in draws:
+                state = snapshot()
+                proposals = propose(state)
+                for record, proposal in zip(records, proposals):
+                    record(proposal, state)
+                apply_deltas(
+                    engine.negotiate(proposals).final_deltas,
+                    draw * (state.volatility * 0.1),
+                )
+            return self._env.history_array.copy()
+
+        n_agents = len(self._agents)
+        deltas = np.zeros((n_agents, len(METRICS)))
+        present = np.zeros((n_agents, len(METRICS)), dtype=np.bool_)
+        confidences = np.zeros(n_agents)
+        base_weights, groups = self._base_weights, self._groups
+        rows = list(zip(deltas, present))
+        states = np.empty((n_rounds + 1, len(METRICS)))
+        states[0] = self._env.history_array[0]
+
+        for r, draw in enumerate(draws):
+            state = EnvironmentState(*states[r].tolist(), r)
+            proposals = propose(state)
+            for record, proposal in zip(records, proposals):
+                record(proposal, state)
+            for i, (proposal, (row, mask)) in enumerate(zip(proposals, rows)):
+                proposal.delta_vector(row, mask)
+                confidences[i] = proposal.confidence
+            states[r + 1] = round_kernel(
+                states[r], deltas, present, confidences, base_weights, groups,
+                CONFLICT_THRESHOLD, draw * (state.volatility * 0.1), _LO, _HI,
+            )[0]
+
+        return states
 
-            # Each agent observes and proposes
-            proposals: list[AgentProposal] = [
-                agent.act(state_before) for agent in self._agents
-            ]
+    # ── Helpers ───────────────────────────────────────────────────────────────
 
-            # Negotiate consensus
-            consensus: ConsensusResult = self._engine.negotiate(proposals)
+    def _reset(self, n_rounds: int) -> None:
+        """Reset the environment and agents before a run of *n_rounds*."""
+        self._env.reset()
+        for agent in self._agents:
+            agent.reset()
+            agent.preallocate(n_rounds)
 
-            # Sample noise proportional to current volatility
-            noise = (
-                self._rng.gauss(0.0, state_before.volatility * 0.1)
-                if stochastic
-                else 0.0
-            )
+    def _draws(self, n_rounds: int, stochastic: bool) -> list[float]:
+        """Standard-normal noise draws for a run (zeros if not stochastic).
 
-            # Apply consensus deltas + noise to environment
-            state_after = self._env.apply_deltas(consensus.final_deltas, noise=noise)
+        Each run seeds a fresh generator, so the draws depend only on the
+        seed and the first *k* draws of any run are the same.
+        """
+        if not stochastic:
+            return [0.0] * n_rounds
+        return np.random.default_rng(self._seed).standard_normal(n_rounds).tolist()
 
-            rounds.append(
+    @staticmethod
+    def _detached(result: SimulationResult, scenario_name: str) -> SimulationResult:
+        """Return a copy of a memoised result for the caller to keep.
+
+        Every mutable part is the caller's own, so changing it leaves the
+        cache untouched: the rounds list, each ``RoundResult`` and its
+        ``ConsensusResult`` (see :meth:`ConsensusResult.copy`), the metadata,
+        and the state matrix and noise vector the rounds read from.  The
+        frozen proposals, conflict reports and environment states are shared.
+        """
+        states = result.states.copy()
+        rounds = result.rounds
+        # The last round's vector covers every round of the result
+        noise = rounds[-1].noise_history[: len(rounds)].copy() if rounds else None
+        return replace(
+            result,
+            rounds=[
                 RoundResult(
-                    round_number=round_idx,
-                    proposals=proposals,
-                    consensus=consensus,
-                    state_before=state_before,
-                    state_after=state_after,
-                    noise=round(noise, 6),
+                    r.round_number, list(r.proposals), r.consensus.copy(),
+                    states, noise,
                 )
-            )
-
-        return SimulationResult(
-            rounds=rounds,
-            initial_state=initial_state,
-            final_state=self._env.snapshot(),
+                for r in rounds
+            ],
             scenario_name=scenario_name,
+            metadata=dict(result.metadata),
+            states=states,
         )
 
-    # ── Helpers ───────────────────────────────────────────────────────────────
+    def _proposers(
+        self,
+    ) -> tuple[
+        Callable[[EnvironmentState], list[AgentProposal]],
+        tuple[Callable[..., None], ...],
+    ]:
+        """Return the round's proposal source and the record calls it needs.
+
+        Proposals come from the fused ensemble pass (recorded by the caller
+        through the returned ``BaseAgent.record`` methods) or from each
+        agent's own ``act``, which records them itself.
+        """
+        if self._ensemble is not None:
+            ensemble = self._ensemble
+
+            def propose(state: EnvironmentState) -> list[AgentProposal]:
+                return ensemble_propose(state, *ensemble)
+
+            return propose, tuple(agent.record for agent in ensemble)
+        if self._pool is not None or len(self._agents) >= PARALLEL_AGENT_THRESHOLD:
+            return self._act_concurrently, ()
+        return self._act, ()
+
+    def _act(self, state: EnvironmentState) -> list[AgentProposal]:
+        """Collect a proposal from each agent in turn."""
+        return [agent.act(state) for agent in self._agents]
+
+    def _act_concurrently(self, state: EnvironmentState) -> list[AgentProposal]:
+        """Collect the agents' proposals on the line-up's thread pool."""
+        pool = self._pool or _agent_pool()
+        futures = [pool.submit(agent.act, state) for agent in self._agents]
+        return [future.result() for future in futures]
 
     @staticmethod
     def _default_agents() -> list[BaseAgent]:
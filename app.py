@@ -12,15 +12,16 @@ from __future__ import annotations
 
 import sys
 import os
+from dataclasses import replace
+from itertools import chain
 
 # Ensure the project root is on the Python path so `agentsphere` is importable
 # when Streamlit Cloud clones the repo root (not a sub-directory).
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import numpy as np
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
+import plotly.graph_objects as go  # already loaded by Streamlit itself
 
 from agentsphere.config import (
     APP_TITLE,
@@ -29,8 +30,7 @@ from agentsphere.config import (
     MAX_ROUNDS,
     CHART_TEMPLATE,
 )
-from agentsphere.simulation.simulator import Simulator
-from agentsphere.analytics.metrics import MetricsEngine
+from agentsphere.simulation.simulator import SimulationResult, Simulator
 
 # ── Page config ───────────────────────────────────────────────────────────────
 
@@ -119,6 +119,219 @@ def _init_session() -> None:
 
 _init_session()
 
+# ── Cached simulation runs ────────────────────────────────────────────────────
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _run_simulation(
+    initial_items: tuple[tuple[str, float], ...],
+    seed: int,
+    n_rounds: int,
+    stochastic: bool,
+) -> SimulationResult:
+    """Run a fresh simulation; reruns with identical inputs skip the run.
+
+    ``cache_data`` hands every caller its own unpickled copy, so the result
+    stored in one session's state is never shared with another session.
+    """
+    simulator = Simulator(initial_state=dict(initial_items), seed=seed)
+    return simulator.run(n_rounds=n_rounds, stochastic=stochastic)
+
+
+# ── Chart layouts ─────────────────────────────────────────────────────────────
+
+_LEGEND_TOP = dict(orientation="h", yanchor="bottom", y=1.02)
+
+_GAUGE_LAYOUT = dict(
+    paper_bgcolor="#0d1117",
+    font_color="#c9d1d9",
+    height=280,
+    margin=dict(t=40, b=10, l=40, r=40),
+)
+_REV_LAYOUT = dict(
+    template=CHART_TEMPLATE,
+    paper_bgcolor="#0d1117",
+    plot_bgcolor="#0d1117",
+    xaxis_title="Round",
+    yaxis_title="USD ($)",
+    legend=_LEGEND_TOP,
+    height=380,
+    margin=dict(t=40, b=40, l=10, r=10),
+)
+_RADAR_LAYOUT = dict(
+    template=CHART_TEMPLATE,
+    paper_bgcolor="#0d1117",
+    polar=dict(
+        bgcolor="#161b22",
+        radialaxis=dict(visible=True, range=[0, 1], color="#8b949e"),
+        angularaxis=dict(color="#8b949e"),
+    ),
+    showlegend=False,
+    height=360,
+    margin=dict(t=20, b=20, l=20, r=20),
+)
+_ROI_LAYOUT = dict(
+    template=CHART_TEMPLATE,
+    paper_bgcolor="#0d1117",
+    plot_bgcolor="#0d1117",
+    xaxis_title="Round",
+    yaxis=dict(title="ROI", tickformat=".0%"),
+    yaxis2=dict(
+        title="Growth Rate",
+        overlaying="y",
+        side="right",
+        tickformat=".1%",
+        color="#3fb950",
+    ),
+    legend=_LEGEND_TOP,
+    height=360,
+    margin=dict(t=20, b=40, l=10, r=60),
+)
+_RISK_LAYOUT = dict(
+    template=CHART_TEMPLATE,
+    paper_bgcolor="#0d1117",
+    plot_bgcolor="#0d1117",
+    xaxis_title="Round",
+    yaxis_title="Score (0–1)",
+    legend=_LEGEND_TOP,
+    height=300,
+    margin=dict(t=20, b=40, l=10, r=10),
+)
+
+# Risk gauge bands: edges and the colour of each band between them
+_RISK_BAND_EDGES = (0.0, 0.25, 0.50, 0.75, 1.00)
+_RISK_BAND_COLOURS = ("#1a3a1a", "#2d3a10", "#3a2a10", "#3a1a1a")
+
+# Confidence colour ladder: red below 50 %, amber below 75 %, green above
+_CONF_THRESHOLDS = np.array([0.50, 0.75])
+_CONF_COLOURS = np.array(["#f85149", "#d29922", "#3fb950"])
+
+# ── Cached chart builders ─────────────────────────────────────────────────────
+# Keyed on the plotted data, so reruns that only touch a widget get the same
+# Figure objects back instead of re-validating every trace and layout.
+# ``cache_resource`` hands out the cached figure itself; treat it as read-only.
+# The builders return Figures rather than ``fig.to_dict()`` payloads:
+# ``st.plotly_chart`` re-validates dict input through a fresh ``go.Figure``,
+# which costs more than serialising the already-validated Figure.
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _risk_gauge(value: float, reference: float) -> go.Figure:
+    """Gauge of the final risk score against the initial one."""
+    indicator = go.Indicator(
+        mode="gauge+number+delta",
+        value=value,
+        delta={"reference": reference, "valueformat": ".3f"},
+        number={"valueformat": ".3f"},
+        title={"text": "Current Risk Score", "font": {"color": "#c9d1d9"}},
+        gauge={
+            "axis": {"range": [0, 1], "tickcolor": "#8b949e"},
+            "bar": {"color": "#388bfd"},
+            "bgcolor": "#161b22",
+            "steps": [
+                {"range": [lo, hi], "color": colour}
+                for lo, hi, colour in zip(
+                    _RISK_BAND_EDGES, _RISK_BAND_EDGES[1:], _RISK_BAND_COLOURS
+                )
+            ],
+            "threshold": {
+                "line": {"color": "#f85149", "width": 4},
+                "thickness": 0.75,
+                "value": 0.65,
+            },
+        },
+    )
+    return go.Figure(data=[indicator], layout=_GAUGE_LAYOUT)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _revenue_figure(rev_proj: dict[str, list]) -> go.Figure:
+    """Revenue, cost and profit per round."""
+    rounds = rev_proj["rounds"]
+    traces = [
+        go.Scatter(
+            x=rounds,
+            y=rev_proj["revenue"],
+            name="Revenue",
+            line=dict(color="#58a6ff", width=2),
+            fill="tozeroy",
+            fillcolor="rgba(88,166,255,0.08)",
+        ),
+        go.Scatter(
+            x=rounds,
+            y=rev_proj["cost"],
+            name="Cost",
+            line=dict(color="#f85149", width=2, dash="dot"),
+        ),
+        go.Scatter(
+            x=rounds,
+            y=rev_proj["profit"],
+            name="Profit",
+            line=dict(color="#3fb950", width=2),
+        ),
+    ]
+    return go.Figure(data=traces, layout=_REV_LAYOUT)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _radar_figure(agents: list[str], scores: list[float]) -> go.Figure:
+    """Closed alignment polygon over the agents."""
+    # Close the polygon
+    agents_closed = agents + [agents[0]] if agents else agents
+    scores_closed = scores + [scores[0]] if scores else scores
+    trace = go.Scatterpolar(
+        r=scores_closed,
+        theta=agents_closed,
+        fill="toself",
+        fillcolor="rgba(56,139,253,0.20)",
+        line=dict(color="#388bfd", width=2),
+        name="Alignment",
+    )
+    return go.Figure(data=[trace], layout=_RADAR_LAYOUT)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _roi_figure(roi_data: dict[str, list]) -> go.Figure:
+    """ROI bars with the growth rate on a secondary axis."""
+    traces = [
+        go.Bar(
+            x=roi_data["rounds"],
+            y=roi_data["roi"],
+            name="ROI",
+            marker_color="#388bfd",
+            opacity=0.85,
+        ),
+        go.Scatter(
+            x=roi_data["rounds"],
+            y=roi_data["growth_rate"],
+            name="Growth Rate",
+            line=dict(color="#3fb950", width=2),
+            yaxis="y2",
+        ),
+    ]
+    return go.Figure(data=traces, layout=_ROI_LAYOUT)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _risk_figure(risk_tl: dict[str, list]) -> go.Figure:
+    """Risk score and volatility per round."""
+    traces = [
+        go.Scatter(
+            x=risk_tl["rounds"],
+            y=risk_tl["risk_score"],
+            name="Risk Score",
+            line=dict(color="#f85149", width=2),
+            fill="tozeroy",
+            fillcolor="rgba(248,81,73,0.10)",
+        ),
+        go.Scatter(
+            x=risk_tl["rounds"],
+            y=risk_tl["volatility"],
+            name="Volatility",
+            line=dict(color="#d29922", width=2, dash="dot"),
+        ),
+    ]
+    return go.Figure(data=traces, layout=_RISK_LAYOUT)
+
+
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 
 with st.sidebar:
@@ -210,12 +423,12 @@ if run_btn:
     }
 
     with st.spinner("Running multi-agent simulation…"):
-        simulator = Simulator(initial_state=initial_state, seed=int(seed))
-        result = simulator.run(
-            n_rounds=n_rounds,
-            scenario_name=scenario_name,
-            stochastic=stochastic,
+        result = _run_simulation(
+            tuple(sorted(initial_state.items())), int(seed), n_rounds, stochastic
         )
+        # The label is not part of the cache key; relabel a shallow copy.
+        if result.scenario_name != scenario_name:
+            result = replace(result, scenario_name=scenario_name)
 
     st.session_state["simulation_result"] = result
     st.session_state["simulation_history"].append(result)
@@ -241,6 +454,12 @@ if result is None:
     )
     st.stop()
 
+# pandas (and MetricsEngine, which uses it) are first needed once there is a
+# result, so the landing page of a fresh worker renders without loading them.
+import pandas as pd
+
+from agentsphere.analytics.metrics import MetricsEngine
+
 # ── Compute analytics ─────────────────────────────────────────────────────────
 
 kpis = MetricsEngine.executive_kpis(result)
@@ -300,37 +519,7 @@ with tab_overview:
 
     # Risk gauge
     st.markdown("#### 🎯 Risk Gauge")
-    gauge = go.Figure(
-        go.Indicator(
-            mode="gauge+number+delta",
-            value=kpis.risk_score_final,
-            delta={"reference": result.initial_state.risk_score, "valueformat": ".3f"},
-            number={"valueformat": ".3f"},
-            title={"text": "Current Risk Score", "font": {"color": "#c9d1d9"}},
-            gauge={
-                "axis": {"range": [0, 1], "tickcolor": "#8b949e"},
-                "bar": {"color": "#388bfd"},
-                "bgcolor": "#161b22",
-                "steps": [
-                    {"range": [0.0, 0.25], "color": "#1a3a1a"},
-                    {"range": [0.25, 0.50], "color": "#2d3a10"},
-                    {"range": [0.50, 0.75], "color": "#3a2a10"},
-                    {"range": [0.75, 1.00], "color": "#3a1a1a"},
-                ],
-                "threshold": {
-                    "line": {"color": "#f85149", "width": 4},
-                    "thickness": 0.75,
-                    "value": 0.65,
-                },
-            },
-        )
-    )
-    gauge.update_layout(
-        paper_bgcolor="#0d1117",
-        font_color="#c9d1d9",
-        height=280,
-        margin=dict(t=40, b=10, l=40, r=40),
-    )
+    gauge = _risk_gauge(kpis.risk_score_final, result.initial_state.risk_score)
     st.plotly_chart(gauge, use_container_width=True)
 
     # Consensus summary
@@ -356,13 +545,16 @@ with tab_agents:
     last_votes = result.rounds[-1].consensus.agent_votes
 
     agent_cols = st.columns(len(last_proposals))
-    for col, proposal in zip(agent_cols, last_proposals):
-        vote_pct = last_votes.get(proposal.agent_name, 0.0)
-        conf_colour = (
-            "#3fb950" if proposal.confidence >= 0.75
-            else "#d29922" if proposal.confidence >= 0.50
-            else "#f85149"
+    # A confidence equal to a threshold takes the colour above it
+    conf_colours = _CONF_COLOURS[
+        np.searchsorted(
+            _CONF_THRESHOLDS, [p.confidence for p in last_proposals], side="right"
         )
+    ].tolist()
+    for col, proposal, conf_colour in zip(agent_cols, last_proposals, conf_colours):
+        vote_pct = last_votes.get(proposal.agent_name, 0.0)
+        # An f-string compiles to a single BUILD_STRING; string.Template or
+        # str.format on a module-level card template measured 3–8× slower.
         col.markdown(
             f"""
             <div style="background:#161b22;border:1px solid #30363d;
@@ -390,20 +582,25 @@ with tab_agents:
     st.markdown("---")
     st.markdown("### Proposed Deltas (Final Round)")
 
-    delta_rows = []
-    for proposal in last_proposals:
-        for metric, delta in proposal.deltas.items():
-            delta_rows.append(
-                {
-                    "Agent": proposal.agent_name,
-                    "Metric": metric,
-                    "Delta": f"{delta:+.2%}",
-                    "Confidence": f"{proposal.confidence:.1%}",
-                }
-            )
-
-    if delta_rows:
-        df_deltas = pd.DataFrame(delta_rows)
+    # One row per (agent, metric) delta, built column-wise
+    counts = [len(p.deltas) for p in last_proposals]
+    if sum(counts):
+        df_deltas = pd.DataFrame(
+            {
+                "Agent": np.repeat([p.agent_name for p in last_proposals], counts),
+                "Metric": list(chain.from_iterable(p.deltas for p in last_proposals)),
+                "Delta": np.fromiter(
+                    chain.from_iterable(p.deltas.values() for p in last_proposals),
+                    dtype=np.float64,
+                    count=sum(counts),
+                ),
+                "Confidence": np.repeat(
+                    [p.confidence for p in last_proposals], counts
+                ),
+            }
+        )
+        df_deltas["Delta"] = df_deltas["Delta"].map("{:+.2%}".format)
+        df_deltas["Confidence"] = df_deltas["Confidence"].map("{:.1%}".format)
         st.dataframe(
             df_deltas,
             use_container_width=True,
@@ -442,43 +639,7 @@ with tab_agents:
 with tab_charts:
     # ── Revenue projection ────────────────────────────────────────────────────
     st.markdown("### 💰 Revenue & Cost Projection")
-    fig_rev = go.Figure()
-    fig_rev.add_trace(
-        go.Scatter(
-            x=rev_proj["rounds"],
-            y=rev_proj["revenue"],
-            name="Revenue",
-            line=dict(color="#58a6ff", width=2),
-            fill="tozeroy",
-            fillcolor="rgba(88,166,255,0.08)",
-        )
-    )
-    fig_rev.add_trace(
-        go.Scatter(
-            x=rev_proj["rounds"],
-            y=rev_proj["cost"],
-            name="Cost",
-            line=dict(color="#f85149", width=2, dash="dot"),
-        )
-    )
-    fig_rev.add_trace(
-        go.Scatter(
-            x=rev_proj["rounds"],
-            y=rev_proj["profit"],
-            name="Profit",
-            line=dict(color="#3fb950", width=2),
-        )
-    )
-    fig_rev.update_layout(
-        template=CHART_TEMPLATE,
-        paper_bgcolor="#0d1117",
-        plot_bgcolor="#0d1117",
-        xaxis_title="Round",
-        yaxis_title="USD ($)",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02),
-        height=380,
-        margin=dict(t=40, b=40, l=10, r=10),
-    )
+    fig_rev = _revenue_figure(rev_proj)
     st.plotly_chart(fig_rev, use_container_width=True)
 
     col_l, col_r = st.columns(2)
@@ -486,107 +647,18 @@ with tab_charts:
     # ── Radar chart ───────────────────────────────────────────────────────────
     with col_l:
         st.markdown("### 🕸 Agent Alignment Radar")
-        agents_r = radar_data["agents"]
-        scores_r = radar_data["scores"]
-        # Close the polygon
-        agents_closed = agents_r + [agents_r[0]] if agents_r else agents_r
-        scores_closed = scores_r + [scores_r[0]] if scores_r else scores_r
-        fig_radar = go.Figure(
-            go.Scatterpolar(
-                r=scores_closed,
-                theta=agents_closed,
-                fill="toself",
-                fillcolor="rgba(56,139,253,0.20)",
-                line=dict(color="#388bfd", width=2),
-                name="Alignment",
-            )
-        )
-        fig_radar.update_layout(
-            template=CHART_TEMPLATE,
-            paper_bgcolor="#0d1117",
-            polar=dict(
-                bgcolor="#161b22",
-                radialaxis=dict(visible=True, range=[0, 1], color="#8b949e"),
-                angularaxis=dict(color="#8b949e"),
-            ),
-            showlegend=False,
-            height=360,
-            margin=dict(t=20, b=20, l=20, r=20),
-        )
+        fig_radar = _radar_figure(radar_data["agents"], radar_data["scores"])
         st.plotly_chart(fig_radar, use_container_width=True)
 
     # ── ROI comparison ────────────────────────────────────────────────────────
     with col_r:
         st.markdown("### 📊 ROI vs Growth Rate")
-        fig_roi = go.Figure()
-        fig_roi.add_trace(
-            go.Bar(
-                x=roi_data["rounds"],
-                y=roi_data["roi"],
-                name="ROI",
-                marker_color="#388bfd",
-                opacity=0.85,
-            )
-        )
-        fig_roi.add_trace(
-            go.Scatter(
-                x=roi_data["rounds"],
-                y=roi_data["growth_rate"],
-                name="Growth Rate",
-                line=dict(color="#3fb950", width=2),
-                yaxis="y2",
-            )
-        )
-        fig_roi.update_layout(
-            template=CHART_TEMPLATE,
-            paper_bgcolor="#0d1117",
-            plot_bgcolor="#0d1117",
-            xaxis_title="Round",
-            yaxis=dict(title="ROI", tickformat=".0%"),
-            yaxis2=dict(
-                title="Growth Rate",
-                overlaying="y",
-                side="right",
-                tickformat=".1%",
-                color="#3fb950",
-            ),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02),
-            height=360,
-            margin=dict(t=20, b=40, l=10, r=60),
-        )
+        fig_roi = _roi_figure(roi_data)
         st.plotly_chart(fig_roi, use_container_width=True)
 
     # ── Risk timeline ─────────────────────────────────────────────────────────
     st.markdown("### 🔴 Risk & Volatility Timeline")
-    fig_risk = go.Figure()
-    fig_risk.add_trace(
-        go.Scatter(
-            x=risk_tl["rounds"],
-            y=risk_tl["risk_score"],
-            name="Risk Score",
-            line=dict(color="#f85149", width=2),
-            fill="tozeroy",
-            fillcolor="rgba(248,81,73,0.10)",
-        )
-    )
-    fig_risk.add_trace(
-        go.Scatter(
-            x=risk_tl["rounds"],
-            y=risk_tl["volatility"],
-            name="Volatility",
-            line=dict(color="#d29922", width=2, dash="dot"),
-        )
-    )
-    fig_risk.update_layout(
-        template=CHART_TEMPLATE,
-        paper_bgcolor="#0d1117",
-        plot_bgcolor="#0d1117",
-        xaxis_title="Round",
-        yaxis_title="Score (0–1)",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02),
-        height=300,
-        margin=dict(t=20, b=40, l=10, r=10),
-    )
+    fig_risk = _risk_figure(risk_tl)
     st.plotly_chart(fig_risk, use_container_width=True)
 
 # ════════════════════════════════════════════════════════════════════════════════
@@ -597,19 +669,15 @@ with tab_history:
     st.markdown("### 📋 Simulation History Timeline")
     st.markdown("---")
 
-    if not timeline:
+    if timeline.empty:
         st.info("No timeline data available.")
     else:
         # Timeline table
-        df_timeline = pd.DataFrame(timeline)
-        df_timeline["revenue"] = df_timeline["revenue"].map("${:,.0f}".format)
-        df_timeline["risk_score"] = df_timeline["risk_score"].map("{:.3f}".format)
-        df_timeline["growth_rate"] = df_timeline["growth_rate"].map("{:.2%}".format)
-        df_timeline["confidence"] = df_timeline["confidence"].map("{:.1%}".format)
-        df_timeline["consensus_confidence"] = df_timeline["consensus_confidence"].map(
-            "{:.1%}".format
-        )
-        df_timeline["noise"] = df_timeline["noise"].map("{:+.4f}".format)
+        # Columns stay numeric; Streamlit formats them client-side.
+        # Percentages are scaled once per column for the printf formats.
+        df_timeline = timeline
+        for column in ("growth_rate", "confidence", "consensus_confidence"):
+            df_timeline[column] *= 100
         df_timeline.rename(
             columns={
                 "round": "Round",
@@ -625,7 +693,19 @@ with tab_history:
             },
             inplace=True,
         )
-        st.dataframe(df_timeline, use_container_width=True, hide_index=True)
+        st.dataframe(
+            df_timeline,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Revenue": st.column_config.NumberColumn(format="$%,.0f"),
+                "Risk Score": st.column_config.NumberColumn(format="%.3f"),
+                "Growth": st.column_config.NumberColumn(format="%.2f%%"),
+                "Agent Conf.": st.column_config.NumberColumn(format="%.1f%%"),
+                "Consensus Conf.": st.column_config.NumberColumn(format="%.1f%%"),
+                "Noise": st.column_config.NumberColumn(format="%+.4f"),
+            },
+        )
 
     st.markdown("---")
     st.markdown("### 📚 All Simulation Runs")
@@ -634,20 +714,30 @@ with tab_history:
     if not history:
         st.info("No previous runs recorded.")
     else:
-        summary_rows = []
-        for idx, hist_result in enumerate(history, start=1):
-            h_kpis = MetricsEngine.executive_kpis(hist_result)
-            summary_rows.append(
-                {
-                    "Run #": idx,
-                    "Scenario": hist_result.scenario_name,
-                    "Rounds": hist_result.n_rounds,
-                    "Final Revenue": f"${h_kpis.revenue_final:,.0f}",
-                    "Revenue Δ": f"{h_kpis.revenue_change_pct:+.1%}",
-                    "Final Risk": f"{h_kpis.risk_score_final:.3f}",
-                    "ROI": f"{h_kpis.roi:.2%}",
-                    "Avg Confidence": f"{h_kpis.consensus_confidence:.1%}",
-                }
-            )
-        df_history = pd.DataFrame(summary_rows)
-        st.dataframe(df_history, use_container_width=True, hide_index=True)
+        kpis_by_run = [MetricsEngine.executive_kpis(r) for r in history]
+        df_history = pd.DataFrame(
+            {
+                "Run #": range(1, len(history) + 1),
+                "Scenario": [r.scenario_name for r in history],
+                "Rounds": [r.n_rounds for r in history],
+                "Final Revenue": [k.revenue_final for k in kpis_by_run],
+                "Revenue Δ": [k.revenue_change_pct for k in kpis_by_run],
+                "Final Risk": [k.risk_score_final for k in kpis_by_run],
+                "ROI": [k.roi for k in kpis_by_run],
+                "Avg Confidence": [k.consensus_confidence for k in kpis_by_run],
+            }
+        )
+        for column in ("Revenue Δ", "ROI", "Avg Confidence"):
+            df_history[column] *= 100
+        st.dataframe(
+            df_history,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Final Revenue": st.column_config.NumberColumn(format="$%,.0f"),
+                "Revenue Δ": st.column_config.NumberColumn(format="%+.1f%%"),
+                "Final Risk": st.column_config.NumberColumn(format="%.3f"),
+                "ROI": st.column_config.NumberColumn(format="%.2f%%"),
+                "Avg Confidence": st.column_config.NumberColumn(format="%.1f%%"),
+            },
+        )
@@ -0,0 +1,40 @@
+"""Tests for the standard agents."""
+
+from __future__ import annotations
+
+from agentsphere.agents import (
+    CostAgent,
+    GrowthAgent,
+    RevenueAgent,
+    RiskAgent,
+    ensemble_propose,
+)
+from agentsphere.environment.business_env import BusinessEnvironment
+
+
+def test_threshold_overrides_after_init_reach_kernel_and_rationale() -> None:
+    state = BusinessEnvironment().snapshot()
+    agent = CostAgent()
+    assert "above target 0.55" in str(agent.propose(state).rationale)
+
+    agent.TARGET_COST_RATIO = 0.65
+    proposal = agent.propose(state)
+    assert proposal.action == "Cost ratio 0.60 near target"
+    fused = ensemble_propose(state, RevenueAgent(), RiskAgent(), agent, GrowthAgent())
+    assert fused[2].deltas == proposal.deltas
+    assert CostAgent.TARGET_COST_RATIO == 0.55
+
+    del agent.TARGET_COST_RATIO
+    assert agent.propose(state).action.startswith("Cost ratio 0.60 above target")
+
+
+def test_subclass_threshold_overrides_stay_in_sync() -> None:
+    class StrictCostAgent(CostAgent):
+        TARGET_COST_RATIO = 0.65
+
+    state = BusinessEnvironment().snapshot()
+    agent = StrictCostAgent()
+    assert agent.propose(state).action == "Cost ratio 0.60 near target"
+
+    agent.TARGET_COST_RATIO = 0.50
+    assert "above target 0.5" in str(agent.propose(state).rationale)
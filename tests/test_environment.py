@@ -0,0 +1,49 @@
+"""Tests for the batched business environment."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from agentsphere.config import ENV_DEFAULTS, METRICS
+from agentsphere.environment import BatchedBusinessEnvironment, BusinessEnvironment
+
+
+def test_batched_environment_matches_scalar_environments() -> None:
+    rng = np.random.default_rng(11)
+    n, rounds = 16, 30
+    starts = [
+        {name: value * rng.uniform(0.5, 1.5) for name, value in ENV_DEFAULTS.items()}
+        for _ in range(n)
+    ]
+    scalar = [BusinessEnvironment(start) for start in starts]
+    batched = BatchedBusinessEnvironment(
+        n, np.array([[start[name] for name in METRICS] for start in starts])
+    )
+
+    for _ in range(rounds):
+        deltas = rng.uniform(-0.3, 0.3, (n, len(METRICS)))
+        deltas[rng.random(deltas.shape) < 0.2] = 0.0
+        noise = rng.normal(0.0, 0.02, n)
+        new = batched.apply_deltas(deltas, noise)
+        for env, row, draw in zip(scalar, deltas, noise.tolist()):
+            env.apply_deltas(row, draw)
+        np.testing.assert_array_equal(new, [env.state.to_vector() for env in scalar])
+
+    history = batched.history_array
+    assert history.shape == (rounds + 1, n, len(METRICS))
+    for s, env in enumerate(scalar):
+        np.testing.assert_array_equal(history[:, s], env.history_array)
+
+    batched.reset()
+    assert batched.round == 0
+    np.testing.assert_array_equal(batched.history_array[0], history[0])
+
+
+def test_batched_environment_rejects_mis_shaped_inputs() -> None:
+    batched = BatchedBusinessEnvironment(3)
+    with pytest.raises(ValueError, match="delta matrix"):
+        batched.apply_deltas(np.zeros((2, len(METRICS))))
+    with pytest.raises(ValueError, match="noise"):
+        batched.apply_deltas(np.zeros(len(METRICS)), np.zeros(2))
+    assert batched.round == 0
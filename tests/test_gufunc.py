@@ -0,0 +1,82 @@
+"""Tests for the gufunc form of the four-agent ensemble and its fallback."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from agentsphere.agents import (
+    CostAgent,
+    GrowthAgent,
+    RevenueAgent,
+    RiskAgent,
+    ensemble_propose_batch,
+)
+from agentsphere._numba import HAVE_NUMBA
+from agentsphere.agents import _gufunc
+from agentsphere.config import METRIC_INDEX, METRICS
+from agentsphere.environment.business_env import EnvironmentState
+
+needs_numba = pytest.mark.skipif(not HAVE_NUMBA, reason="Numba is not installed")
+
+
+def _random_states(n: int, seed: int) -> np.ndarray:
+    """Return an ``(n, len(METRICS))`` matrix spanning every agent branch."""
+    rng = np.random.default_rng(seed)
+    low = {
+        "revenue": 2e5, "cost": 1e5, "risk_score": 0.0, "churn": 0.0,
+        "marketing_budget": 1e4, "growth_rate": -0.05, "volatility": 0.0,
+    }
+    high = {
+        "revenue": 5e6, "cost": 5e6, "risk_score": 1.0, "churn": 0.3,
+        "marketing_budget": 5e5, "growth_rate": 0.3, "volatility": 1.0,
+    }
+    return np.column_stack(
+        [rng.uniform(low[name], high[name], n) for name in METRICS]
+    )
+
+
+def _scalar_deltas(states: np.ndarray, agents: tuple) -> np.ndarray:
+    """Scalar ``propose`` deltas laid out as the gufunc's output."""
+    out = np.zeros((len(states), len(agents), len(METRICS)))
+    for n, row in enumerate(states):
+        state = EnvironmentState.from_vector(row)
+        for a, agent in enumerate(agents):
+            for key, delta in agent.propose(state).deltas.items():
+                out[n, a, METRIC_INDEX[key]] = delta
+    return out
+
+
+@pytest.mark.parametrize(
+    "target",
+    ["numpy", "cpu", pytest.param("parallel", marks=needs_numba)],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_gufunc_matches_scalar_propose(
+    target: str, seed: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if target == "numpy":
+        # The agents' propose_batch fallback, as used without Numba
+        monkeypatch.setattr(_gufunc, "ensemble_gu", lambda parallel: None)
+    agents = (RevenueAgent(), RiskAgent(), CostAgent(), GrowthAgent())
+    states = _random_states(500, seed)
+
+    batched = ensemble_propose_batch(
+        states, *agents, parallel=target == "parallel"
+    )
+
+    assert batched.shape == (len(states), len(agents), len(METRICS))
+    np.testing.assert_allclose(
+        batched, _scalar_deltas(states, agents), rtol=1e-12, atol=1e-15
+    )
+
+
+@needs_numba
+def test_gufunc_targets_agree() -> None:
+    agents = (RevenueAgent(), RiskAgent(), CostAgent(), GrowthAgent())
+    states = _random_states(2000, 3)
+
+    np.testing.assert_array_equal(
+        ensemble_propose_batch(states, *agents, parallel=True),
+        ensemble_propose_batch(states, *agents, parallel=False),
+    )
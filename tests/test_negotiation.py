@@ -0,0 +1,102 @@
+"""Tests for the NegotiationEngine's alternative negotiation paths."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from agentsphere.agents.base_agent import AgentProposal
+from agentsphere.config import AGENT_WEIGHTS, METRICS
+from agentsphere.negotiation import engine as engine_module
+from agentsphere.negotiation.engine import NegotiationEngine
+
+_NAMES = (*AGENT_WEIGHTS, "PricingAgent")
+_KEYS = (*METRICS, "brand_equity")
+
+
+def _random_round(
+    rng: np.random.Generator, n: int, engine: NegotiationEngine
+) -> list[AgentProposal]:
+    """*n* proposals with repeated names, shared keys and some 0.0 deltas."""
+    proposals = []
+    for _ in range(n):
+        name = str(rng.choice(_NAMES))
+        keys = rng.choice(_KEYS, size=rng.integers(1, 6), replace=False)
+        proposals.append(
+            AgentProposal(
+                agent_name=name,
+                action="",
+                deltas={
+                    str(key): float(rng.choice([0.0, rng.uniform(-0.2, 0.2)]))
+                    for key in keys
+                },
+                confidence=float(rng.choice([0.0, rng.uniform(0.0, 1.0)])),
+                rationale="",
+                agent_id=engine.agent_index(name) if rng.random() < 0.5 else -1,
+            )
+        )
+    return proposals
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_negotiate_fast_matches_negotiate(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    engine = NegotiationEngine(AGENT_WEIGHTS)
+    for _ in range(200):
+        proposals = _random_round(rng, int(rng.integers(0, 10)), engine)
+
+        fast = engine.negotiate_fast(proposals)
+        slow = engine.negotiate(proposals)
+
+        assert fast == slow
+        assert list(fast.final_deltas) == list(slow.final_deltas)
+        assert list(fast.agent_votes) == list(slow.agent_votes)
+        assert fast.summary == slow.summary
+
+
+def test_negotiate_fast_with_duplicate_names() -> None:
+    engine = NegotiationEngine(AGENT_WEIGHTS)
+
+    def proposal(name: str, deltas: dict[str, float], confidence: float):
+        return AgentProposal(name, "", deltas, confidence, "")
+
+    proposals = [
+        proposal("CostAgent", {"cost": -0.05, "revenue": 0.01}, 0.9),
+        proposal("GrowthAgent", {"cost": 0.04, "revenue": 0.03}, 0.7),
+        # In no conflict itself, but penalised with the other CostAgent
+        proposal("CostAgent", {"churn": -0.01}, 0.6),
+    ]
+
+    fast = engine.negotiate_fast(proposals)
+
+    assert fast == engine.negotiate(proposals)
+    assert set(fast.agent_votes) == {"CostAgent", "GrowthAgent"}
+    assert [(c.agent_a, c.agent_b) for c in fast.conflicts] == [
+        ("CostAgent", "GrowthAgent"),
+    ]
+
+
+def test_matrix_and_bitmask_conflict_scans_agree(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Route every round size through the bitmask scan for the comparison
+    monkeypatch.setattr(engine_module, "MATRIX_CONFLICT_THRESHOLD", 10**9)
+    rng = np.random.default_rng(7)
+    engine = NegotiationEngine(AGENT_WEIGHTS)
+    flagged = 0
+    for _ in range(100):
+        for n in range(1, 15):
+            proposals = _random_round(rng, n, engine)
+
+            bitmask = NegotiationEngine._detect_conflicts(proposals)
+            matrix = NegotiationEngine._matrix_conflicts(proposals)
+
+            assert [
+                (c.agent_a, c.agent_b, c.conflicting_keys, c.severity)
+                for c in matrix
+            ] == [
+                (c.agent_a, c.agent_b, c.conflicting_keys, c.severity)
+                for c in bitmask
+            ]
+            flagged += len(bitmask)
+    assert flagged
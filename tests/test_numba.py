@@ -0,0 +1,73 @@
+"""Tests for when the optional Numba kernels are compiled."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from agentsphere._numba import HAVE_NUMBA
+
+needs_numba = pytest.mark.skipif(not HAVE_NUMBA, reason="Numba is not installed")
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    """Run *code* in a fresh interpreter (so imports start cold)."""
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+@needs_numba
+def test_kernels_compile_on_first_simulator_not_on_import() -> None:
+    done = _run(
+        """
+        import agentsphere
+        from agentsphere.agents import _kernels as agents
+        from agentsphere.environment import _kernels as environment
+        from agentsphere.negotiation import _kernels as negotiation
+
+        kernels = (
+            agents.cost_kernel,
+            environment.apply_deltas_kernel,
+            negotiation.round_kernel,
+        )
+        assert not any(k.signatures for k in kernels)
+        agentsphere.Simulator()
+        assert all(k.signatures for k in kernels[1:])
+        """
+    )
+    assert done.returncode == 0, done.stderr
+
+
+def test_package_imported_off_the_main_thread_exits() -> None:
+    # Streamlit imports the app's modules on its script-runner thread;
+    # starting Numba's parallel runtime there would hang interpreter exit.
+    done = _run(
+        """
+        import threading
+
+        import numpy as np
+
+        def work():
+            import agentsphere
+            from agentsphere.agents import (
+                CostAgent, GrowthAgent, RevenueAgent, RiskAgent,
+                ensemble_propose_batch,
+            )
+
+            agentsphere.Simulator().run(3)
+            agents = (RevenueAgent(), RiskAgent(), CostAgent(), GrowthAgent())
+            ensemble_propose_batch(np.ones((8, 7)), *agents, parallel=True)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        """
+    )
+    assert done.returncode == 0, done.stderr
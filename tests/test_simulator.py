@@ -0,0 +1,122 @@
+"""Tests for the Simulator's run paths and memoised results."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from agentsphere.agents import CostAgent, GrowthAgent, RevenueAgent, RiskAgent
+from agentsphere.simulation import simulator as simulator_module
+from agentsphere.simulation.simulator import Simulator
+
+
+
+def _duplicate_names() -> list:
+    """Two CostAgents of which only the first conflicts (with RevenueAgent).
+
+    The second one's target is met, so it proposes a small cut that agrees
+    with both and is only penalised through the name it shares.
+    """
+    on_target = CostAgent(weight=0.1)
+    on_target.TARGET_COST_RATIO = 0.70
+    return [CostAgent(), RevenueAgent(), on_target, GrowthAgent()]
+
+
+# Agent line-ups by name; None is the default (fused ensemble) line-up.
+_LINE_UPS = {
+    "default": lambda: None,
+    "custom": lambda: [GrowthAgent(), RiskAgent(), RevenueAgent()],
+    "duplicate_names": _duplicate_names,
+    "concurrent": lambda: [
+        agent for _ in range(3)
+        for agent in (RevenueAgent(), CostAgent(), GrowthAgent())
+    ],
+}
+
+
+def test_edits_to_a_returned_result_do_not_reach_the_memo() -> None:
+    simulator = Simulator(seed=3)
+    first = simulator.run(6)
+    round_ = first.rounds[0]
+    round_.consensus.final_deltas["revenue"] = 99.0
+    round_.consensus.agent_votes.clear()
+    round_.proposals.clear()
+    round_.noise_history[:] = 1.0
+    first.rounds.clear()
+    first.metadata["note"] = "edited"
+    first.states[:] = 0.0
+
+    fresh = Simulator(seed=3).run(6)
+    for again in (simulator.run(6), simulator.run(4)):
+        n = again.n_rounds
+        assert again.metadata == {}
+        np.testing.assert_array_equal(again.states, fresh.states[: n + 1])
+        for got, want in zip(again.rounds, fresh.rounds):
+            assert got.noise == want.noise
+            assert got.state_after == want.state_after
+            assert len(got.proposals) == len(want.proposals)
+            assert got.consensus.final_deltas == want.consensus.final_deltas
+            assert got.consensus.agent_votes == want.consensus.agent_votes
+
+
+@pytest.mark.parametrize("kernel", [True, False], ids=["round_kernel", "negotiate"])
+@pytest.mark.parametrize("stochastic", [True, False])
+@pytest.mark.parametrize("line_up", list(_LINE_UPS))
+def test_run_states_matches_run(
+    line_up: str, stochastic: bool, kernel: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if kernel and not simulator_module.HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    # False takes run_states' pure-Python path, as used without Numba
+    monkeypatch.setattr(simulator_module, "HAVE_NUMBA", kernel)
+    simulator = Simulator(seed=5, agents=_LINE_UPS[line_up]())
+
+    for n in (1, 6, 12):
+        np.testing.assert_array_equal(
+            simulator.run_states(n, stochastic),
+            simulator.run(n, stochastic=stochastic).states,
+        )
+
+
+def _assert_same_run(got, want) -> None:
+    """Assert two results hold the same states, rounds and consensus."""
+    np.testing.assert_array_equal(got.states, want.states)
+    assert got.initial_state == want.initial_state
+    assert got.final_state == want.final_state
+    assert len(got.rounds) == len(want.rounds)
+    for got_round, want_round in zip(got.rounds, want.rounds):
+        assert got_round.round_number == want_round.round_number
+        assert got_round.noise == want_round.noise
+        assert got_round.state_before == want_round.state_before
+        assert got_round.state_after == want_round.state_after
+        assert got_round.consensus.final_deltas == want_round.consensus.final_deltas
+
+
+@pytest.mark.parametrize("stochastic", [True, False])
+@pytest.mark.parametrize("first, second", [(3, 9), (9, 3), (1, 12), (12, 1), (6, 7)])
+def test_resumed_run_matches_fresh_run(
+    first: int, second: int, stochastic: bool
+) -> None:
+    simulator = Simulator(seed=9)
+    simulator.run(first, stochastic=stochastic)
+
+    _assert_same_run(
+        simulator.run(second, stochastic=stochastic),
+        Simulator(seed=9).run(second, stochastic=stochastic),
+    )
+
+
+def test_run_sequences_match_fresh_runs() -> None:
+    rng = np.random.default_rng(0)
+    fresh = {
+        (n, stochastic): Simulator(seed=9).run(n, stochastic=stochastic)
+        for n in range(1, 13)
+        for stochastic in (True, False)
+    }
+    for _ in range(30):
+        simulator = Simulator(seed=9)
+        for _ in range(5):
+            n, stochastic = int(rng.integers(1, 13)), bool(rng.random() < 0.5)
+            _assert_same_run(
+                simulator.run(n, stochastic=stochastic), fresh[n, stochastic]
+            )